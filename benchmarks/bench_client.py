@@ -0,0 +1,112 @@
+"""Per-request client overhead against the local dev server.
+
+Every request goes to an in-process stand-in server with zero simulated
+latency, so the numbers are the cost of the client stack itself (pool,
+retries, breaker, bookkeeping, JSON decoding). A bare httpx.AsyncClient
+request to /health is the baseline each result is compared against.
+
+The first chat turn is timed separately on a fresh pool, once cold and
+once after chat's warm-up has run (as it does while the splash renders).
+"""
+
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+from harness import dev_server, summarize
+
+from terryann_cli.auth import AuthUser
+from terryann_cli.client import GatewayClient
+from terryann_cli.commands.chat import _warm_up
+from terryann_cli.config import Config
+from terryann_cli.runtime import run as run_async
+from terryann_cli.transport import HTTPPool, get_pool, set_pool
+
+
+async def _timed(count: int, fn: Callable[[], Awaitable[Any]]) -> list[float]:
+    # One untimed call opens the connection
+    await fn()
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _bench(url: str, count: int) -> list[dict[str, Any]]:
+    results = []
+    client = GatewayClient(Config(gateway_url=url, backend_url=url))
+    pool = get_pool()
+    journey_id = (await pool.get_json(f"{url}/gateway/journeys", params={"limit": 1}))[
+        "journeys"
+    ][0]["id"]
+
+    async with httpx.AsyncClient() as raw:
+        samples = await _timed(count, lambda: raw.get(f"{url}/health"))
+        baseline = summarize("client.httpx_baseline", samples)
+    results.append(baseline)
+
+    cases: list[tuple[str, Callable[[], Awaitable[Any]]]] = [
+        ("client.pool_request", lambda: pool.request("GET", f"{url}/health")),
+        ("client.health_check", client.health_check),
+        (
+            "client.journeys_list",
+            lambda: pool.get_json(f"{url}/gateway/journeys", params={"limit": 20}),
+        ),
+        ("client.journey_detail", lambda: pool.get_json(f"{url}/gateway/journeys/{journey_id}")),
+        (
+            "client.journey_detail_304",
+            lambda: pool.get_json(f"{url}/gateway/journeys/{journey_id}", conditional=True),
+        ),
+        ("client.send_message", lambda: client.send_message("bench", "hello")),
+        ("client.stream_message", lambda: _drain(client.stream_message("bench", "hello"))),
+    ]
+    for name, fn in cases:
+        result = summarize(name, await _timed(count, fn))
+        result["overhead_median"] = result["median"] - baseline["median"]
+        results.append(result)
+
+    return results
+
+
+async def _drain(stream) -> None:
+    async for _ in stream:
+        pass
+
+
+async def _first_turn(url: str, warm: bool) -> float:
+    # A new chat session: fresh pool, nothing connected yet
+    pool = HTTPPool(Config(), persist=False)
+    previous = set_pool(pool)
+    try:
+        client = GatewayClient(Config(gateway_url=url, backend_url=url), auth_token="bench")
+        if warm:
+            # Finished while the splash rendered and the user typed
+            await _warm_up(client, AuthUser("bench", "bench@example.com", "bench"))
+        started = time.perf_counter()
+        await _drain(client.stream_message("bench", "hello"))
+        return time.perf_counter() - started
+    finally:
+        await pool.aclose()
+        set_pool(previous)
+
+
+async def _bench_first_turn(url: str, count: int) -> list[dict[str, Any]]:
+    results = []
+    for warm in (False, True):
+        samples = [await _first_turn(url, warm) for _ in range(count)]
+        results.append(summarize("client.chat_first_turn", samples, warm_up=warm, turns=count))
+    cold, warm = results
+    warm["saved_median"] = cold["median"] - warm["median"]
+    return results
+
+
+def run(quick: bool = False) -> list[dict[str, Any]]:
+    count = 50 if quick else 500
+    with dev_server(nodes=1_000, token_delay=0.0) as url:
+        results = run_async(_bench(url, count))
+        for result in results:
+            result["params"]["requests"] = count
+        results.extend(run_async(_bench_first_turn(url, count // 10)))
+    return results
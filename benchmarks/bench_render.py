@@ -0,0 +1,99 @@
+"""Rendering and parsing: journey trees, the journeys table, help pages."""
+
+import io
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from harness import measure
+from rich.console import Console
+
+from terryann_cli.commands.chat import _html_to_rich
+from terryann_cli.commands.journeys import _build_journey_tree, _build_journeys_table
+from terryann_cli.devserver import generate_journey
+
+TREE_SIZES = (10, 1_000, 50_000)
+# Rendering a path of n nodes emits O(n^2) guide characters, so the
+# largest tree is only built, not rendered
+TREE_RENDER_SIZES = (10, 1_000)
+TABLE_ROWS = (100, 1_000, 5_000)
+HELP_PAGE_SECTIONS = (10, 200, 2_000)
+
+
+def _render(renderable: Any) -> str:
+    console = Console(file=io.StringIO(), width=120, force_terminal=True, color_system="truecolor")
+    console.print(renderable)
+    return console.file.getvalue()
+
+
+def _journeys(count: int) -> list[dict[str, Any]]:
+    rng = random.Random(count)
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": f"{rng.getrandbits(128):032x}",
+            "status": rng.choice(["draft", "simulated", "approved", "executing"]),
+            "created_at": (now - timedelta(minutes=i * 37)).isoformat(),
+            "cohort_config": {"location": f"ZIP {rng.randint(10000, 99999)}"},
+            "journey_data": {
+                "name": f"Journey {i}",
+                "touchpoints": [{"id": f"tp{t}"} for t in range(rng.randint(3, 12))],
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def _help_page(sections: int) -> str:
+    parts = [
+        "<html><head><title>TerryAnn Help</title>",
+        "<style>body { font-family: sans-serif; }</style>",
+        "<script>window.analytics = {};</script></head><body><nav>Home</nav><main>",
+    ]
+    for i in range(sections):
+        parts.append(
+            f"<h2>Section {i}</h2>"
+            f"<p>Use <code>/journeys</code> to list <strong>recent</strong> journeys, "
+            f"<em>or</em> open <a href=\"https://terryann.ai/docs/{i}\">the docs</a> "
+            "&amp; more.</p>"
+            f"<ul><li>First tip {i}</li><li>Second tip</li><li><b>Third</b> tip</li></ul>"
+            "<p>Journeys are built from 15+ data sources.<br/>Ask follow-up questions.</p>"
+        )
+    parts.append("</main><footer>© TerryAnn</footer></body></html>")
+    return "".join(parts)
+
+
+def run(quick: bool = False) -> list[dict[str, Any]]:
+    repeat = 3 if quick else 7
+    results = []
+
+    for size in TREE_SIZES:
+        journey_data = generate_journey(size, random.Random(size))
+        results.append(
+            measure("tree.build", lambda: _build_journey_tree(journey_data), repeat, nodes=size)
+        )
+        if size in TREE_RENDER_SIZES:
+            tree = _build_journey_tree(journey_data)
+            results.append(measure("tree.render", lambda: _render(tree), repeat, nodes=size))
+
+    for rows in TABLE_ROWS:
+        journeys = _journeys(rows)
+        results.append(
+            measure("table.build", lambda: _build_journeys_table(journeys), repeat, rows=rows)
+        )
+        results.append(
+            measure(
+                "table.render",
+                lambda: _render(_build_journeys_table(journeys)),
+                repeat,
+                rows=rows,
+            )
+        )
+
+    for sections in HELP_PAGE_SECTIONS:
+        html = _help_page(sections)
+        results.append(
+            measure("help.html_to_rich", lambda: _html_to_rich(html), repeat, kb=len(html) // 1024)
+        )
+
+    return results
@@ -0,0 +1,24 @@
+"""Cold start: `terryann --version`, `status` and `whoami` as fresh processes."""
+
+import os
+import sys
+from typing import Any, Optional
+
+from harness import dev_server, measure_command
+
+CLI = [sys.executable, "-m", "terryann_cli.main"]
+
+
+def run(quick: bool = False, repeat: Optional[int] = None) -> list[dict[str, Any]]:
+    repeat = repeat or (3 if quick else 15)
+    results = [
+        measure_command("startup.version", CLI + ["--version"], repeat=repeat),
+        # Not logged in (HOME is a temporary directory): reads credentials and exits
+        measure_command("startup.whoami", CLI + ["whoami"], repeat=repeat),
+    ]
+
+    with dev_server() as url:
+        env = {**os.environ, "TERRYANN_GATEWAY_URL": url, "TERRYANN_BACKEND_URL": url}
+        results.append(measure_command("startup.status", CLI + ["status"], repeat=repeat, env=env))
+
+    return results
@@ -0,0 +1,78 @@
+"""Fail when CLI cold start exceeds its budget.
+
+    python benchmarks/check_startup.py                        # default budgets
+    python benchmarks/check_startup.py --budget version=0.3   # override one
+    python benchmarks/check_startup.py --scale 1.5            # slower machine
+
+Runs the startup suite (fresh processes, HOME pointed at a temporary
+directory) and compares each command's median against its budget. Exits
+with status 1 if any command is over budget. Use
+`terryann --profile-startup <command>` to see which imports to blame.
+
+Timings vary by machine, so pytest doesn't run this; the machine-independent
+part, keeping heavy SDKs out of cold start, is tests/test_startup_imports.py.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+# Median cold start per command, in seconds
+BUDGETS = {
+    "version": 0.5,
+    "whoami": 0.5,
+    "status": 1.0,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check CLI cold start against budgets.")
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="COMMAND=SECONDS",
+        help=f"Override a budget ({', '.join(f'{k}={v:g}' for k, v in BUDGETS.items())})",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply all budgets")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per command")
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS)
+    for override in args.budget:
+        command, _, seconds = override.partition("=")
+        if command not in budgets or not seconds:
+            parser.error(f"Bad --budget {override!r}")
+        budgets[command] = float(seconds)
+
+    home = tempfile.mkdtemp(prefix="terryann-bench-")
+    os.environ["HOME"] = home
+    for var in ("TERRYANN_GATEWAY_URL", "TERRYANN_BACKEND_URL"):
+        os.environ.pop(var, None)
+
+    from bench_startup import run
+    from harness import format_seconds
+
+    over = []
+    for result in run(repeat=args.repeat):
+        command = result["name"].removeprefix("startup.")
+        budget = budgets[command] * args.scale
+        median = result["median"]
+        verdict = "ok" if median <= budget else "OVER BUDGET"
+        print(
+            f"{command:<10} median {format_seconds(median):>9}  "
+            f"budget {format_seconds(budget):>9}  {verdict}",
+            file=sys.stderr,
+        )
+        if median > budget:
+            over.append(command)
+
+    if over:
+        print(f"Cold start over budget: {', '.join(over)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""Shared helpers for the benchmark suite: timing, statistics, dev server."""
+
+import asyncio
+import gc
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import timeit
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+
+def summarize(name: str, samples: list[float], **params: Any) -> dict[str, Any]:
+    """
+    Summarize timing samples (seconds) into a result record.
+
+    Args:
+        name: Benchmark name
+        samples: One duration per run
+        **params: Parameters of the benchmark (sizes, counts), kept in the output
+
+    Returns:
+        Result dict with min, median, mean, p95, stdev and sample count
+    """
+    ordered = sorted(samples)
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "name": name,
+        "params": params,
+        "unit": "s",
+        "samples": len(samples),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p95": p95,
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    repeat: int = 7,
+    number: Optional[int] = None,
+    **params: Any,
+) -> dict[str, Any]:
+    """
+    Time an in-process function.
+
+    Each sample is the mean of `number` calls; when number is not given it
+    is picked like timeit's autorange (at least 0.2s per sample), so fast
+    functions are not dominated by timer resolution. Garbage collection is
+    run before each sample and disabled during it.
+
+    Args:
+        name: Benchmark name
+        fn: Zero-argument function to time
+        repeat: Number of samples
+        number: Calls per sample (auto when None)
+        **params: Parameters recorded with the result
+
+    Returns:
+        Result dict (see summarize)
+    """
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        samples.append(timer.timeit(number) / number)
+    return summarize(name, samples, number=number, **params)
+
+
+def measure_command(
+    name: str, argv: list[str], repeat: int = 10, env: Optional[dict] = None, **params: Any
+) -> dict[str, Any]:
+    """
+    Time a command from process start to exit (one warm-up run is discarded).
+
+    Raises:
+        RuntimeError: If the command fails
+    """
+    samples = []
+    for i in range(repeat + 1):
+        started = time.perf_counter()
+        result = subprocess.run(argv, env=env, capture_output=True)
+        elapsed = time.perf_counter() - started
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(argv)} exited with {result.returncode}: "
+                f"{result.stderr.decode(errors='replace')[-500:]}"
+            )
+        if i:
+            samples.append(elapsed)
+    return summarize(name, samples, argv=argv[1:], **params)
+
+
+def environment() -> dict[str, Any]:
+    """Describe the machine and code the benchmarks ran on."""
+    from terryann_cli import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "terryann_cli": __version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+@contextmanager
+def dev_server(**settings: Any) -> Iterator[str]:
+    """
+    Run the stand-in dev server on a free port in a background thread.
+
+    Args:
+        **settings: DevServerSettings overrides (latency defaults to fixed:0)
+
+    Yields:
+        The server's base URL
+    """
+    from terryann_cli.devserver import DevServer, DevServerSettings
+    from terryann_cli.http_server import serve
+
+    settings.setdefault("latency", "fixed:0")
+    settings.setdefault("seed", 1)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    state: dict[str, Any] = {}
+
+    async def main():
+        server = await serve(DevServer(DevServerSettings(**settings)).handle, "127.0.0.1", 0)
+        state["url"] = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        state["task"] = asyncio.current_task()
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    def run():
+        try:
+            loop.run_until_complete(main())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            ready.set()
+            loop.close()
+
+    thread = threading.Thread(target=run, name="dev-server", daemon=True)
+    thread.start()
+    ready.wait()
+    if "url" not in state:
+        raise RuntimeError("Dev server failed to start")
+    try:
+        yield state["url"]
+    finally:
+        loop.call_soon_threadsafe(state["task"].cancel)
+        thread.join(timeout=5)
+
+
+def format_seconds(value: float) -> str:
+    """Format a duration with a readable unit."""
+    if value >= 1:
+        return f"{value:.2f}s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value * 1e6:.1f}µs"
+
+
+def print_summary(
+    results: list[dict[str, Any]], baseline: Optional[dict[str, dict]] = None
+) -> None:
+    """Print a one-line-per-benchmark summary to stderr."""
+    for result in results:
+        params = " ".join(
+            f"{k}={v}" for k, v in result["params"].items() if k not in ("argv", "number")
+        )
+        line = (
+            f"{result['name']:<28} {params:<22} "
+            f"median {format_seconds(result['median']):>9}  "
+            f"p95 {format_seconds(result['p95']):>9}  "
+            f"±{format_seconds(result['stdev']):>8}"
+        )
+        previous = (baseline or {}).get(result_key(result))
+        if previous:
+            line += f"  {result['median'] / previous['median']:.2f}x vs baseline"
+        print(line, file=sys.stderr)
+
+
+def result_key(result: dict[str, Any]) -> str:
+    """Identity of a result across runs (name plus size parameters)."""
+    params = {k: v for k, v in result["params"].items() if k not in ("argv", "number")}
+    return f"{result['name']}{sorted(params.items())}"
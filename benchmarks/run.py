@@ -0,0 +1,67 @@
+"""Run the TerryAnn CLI benchmark suite.
+
+    python benchmarks/run.py                       # everything, JSON to stdout
+    python benchmarks/run.py -o results.json       # write results to a file
+    python benchmarks/run.py --only render,client  # pick suites
+    python benchmarks/run.py --quick               # fewer samples, for smoke runs
+    python benchmarks/run.py --compare before.json # show ratios against a saved run
+
+A summary is printed to stderr. The suite runs with HOME pointed at a
+temporary directory, so your ~/.terryann config, caches and endpoint health
+neither affect nor get touched by the measurements.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+
+SUITES = ("startup", "render", "client")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the TerryAnn CLI benchmarks.")
+    parser.add_argument("--only", help=f"Comma-separated suites to run ({', '.join(SUITES)})")
+    parser.add_argument("--output", "-o", help="Write JSON results to this file")
+    parser.add_argument("--quick", action="store_true", help="Fewer samples (smoke test)")
+    parser.add_argument("--compare", help="Earlier JSON results to compare medians against")
+    args = parser.parse_args()
+
+    suites = args.only.split(",") if args.only else list(SUITES)
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"Unknown suite(s): {', '.join(sorted(unknown))}")
+
+    # Isolate from the user's config before terryann_cli is imported
+    home = tempfile.mkdtemp(prefix="terryann-bench-")
+    os.environ["HOME"] = home
+    for var in ("TERRYANN_GATEWAY_URL", "TERRYANN_BACKEND_URL"):
+        os.environ.pop(var, None)
+
+    from harness import environment, print_summary, result_key
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {result_key(r): r for r in json.load(f)["results"]}
+
+    results = []
+    for suite in suites:
+        print(f"== {suite}", file=sys.stderr)
+        suite_results = importlib.import_module(f"bench_{suite}").run(quick=args.quick)
+        print_summary(suite_results, baseline)
+        results.extend(suite_results)
+
+    output = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
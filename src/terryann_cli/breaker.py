@@ -0,0 +1,249 @@
+"""Adaptive timeouts and circuit breaking for gateway and backend calls.
+
+Latencies of successful requests (and the timeout of requests that timed
+out) are tracked per endpoint, and timeouts are derived from the observed
+p99 instead of the hard-coded worst case. Hosts
+are scored by latency so the fastest of several endpoints can be used. A
+per-host circuit breaker fails fast after repeated failures and lets a
+single probe through once it has cooled down. Both survive across CLI
+invocations in ~/.terryann/endpoint_health.json.
+"""
+
+import json
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import httpx
+
+from terryann_cli.config import CONFIG_DIR
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+HEALTH_FILE = CONFIG_DIR / "endpoint_health.json"
+
+# Latency samples kept per endpoint
+LATENCY_WINDOW = 100
+# Samples needed before timeouts are derived from observations
+MIN_SAMPLES = 10
+# Derived timeout = p99 * TIMEOUT_MULTIPLIER, clamped to [floor, call-site timeout]
+TIMEOUT_MULTIPLIER = 3.0
+TIMEOUT_FLOOR = 5.0
+# The floor is at least this fraction of the call-site timeout, so a run of
+# fast replies can't shrink a long pipeline's timeout (e.g. chat's 180s)
+# below what its slow replies need
+TIMEOUT_FLOOR_FRACTION = 0.5
+# Weight of the newest sample in each host's latency score
+HOST_SCORE_ALPHA = 0.3
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.ConnectError):
+    """Raised instead of sending a request to a host that keeps failing."""
+
+
+def percentile(samples: list[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0-100) of a list of samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LatencyTracker:
+    """
+    Rolling window of request latencies per endpoint.
+
+    Successful requests are sampled at their duration and timed-out ones at
+    the timeout they were given, so a timeout that proved too short raises
+    the next one.
+
+    Also keeps an exponentially weighted latency score per host, used to
+    pick the fastest of several endpoints for the same service.
+    """
+
+    def __init__(self, samples: Optional[dict[str, list[float]]] = None):
+        self.samples: dict[str, list[float]] = samples or {}
+        self.host_scores: dict[str, float] = {}
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record a request's latency (or the timeout it ran into)."""
+        window = self.samples.setdefault(endpoint, [])
+        window.append(round(seconds, 4))
+        if len(window) > LATENCY_WINDOW:
+            del window[: len(window) - LATENCY_WINDOW]
+
+    def observe_host(self, host: str, seconds: Optional[float]) -> None:
+        """Update a host's latency score (None records a failure)."""
+        previous = self.host_scores.get(host)
+        if seconds is None:
+            # Failures push the host behind its healthy alternatives
+            self.host_scores[host] = max(1.0, (previous or 0.0) * 2)
+        elif previous is None:
+            self.host_scores[host] = round(seconds, 4)
+        else:
+            score = HOST_SCORE_ALPHA * seconds + (1 - HOST_SCORE_ALPHA) * previous
+            self.host_scores[host] = round(score, 4)
+
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        """Latency percentile for an endpoint, or None without enough samples."""
+        window = self.samples.get(endpoint, [])
+        if len(window) < MIN_SAMPLES:
+            return None
+        return percentile(window, q)
+
+    def timeout_for(self, endpoint: str, ceiling: float) -> float:
+        """
+        Derive a timeout for an endpoint from its observed latency.
+
+        Args:
+            endpoint: Endpoint label (see transport.endpoint_label)
+            ceiling: The call site's own timeout, never exceeded
+
+        Returns:
+            Timeout in seconds, never below TIMEOUT_FLOOR or
+            TIMEOUT_FLOOR_FRACTION of the ceiling
+        """
+        p99 = self.percentile(endpoint, 99)
+        if p99 is None:
+            return ceiling
+        floor = max(TIMEOUT_FLOOR, ceiling * TIMEOUT_FLOOR_FRACTION)
+        return min(ceiling, max(floor, p99 * TIMEOUT_MULTIPLIER))
+
+
+@dataclass
+class CircuitState:
+    """Breaker state for one host."""
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests fail immediately. Once reset_timeout seconds have passed one
+    probe request is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        states: Optional[dict[str, CircuitState]] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.states: dict[str, CircuitState] = states or {}
+
+    def before_request(self, host: str) -> None:
+        """
+        Check whether a request to host may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit for host is open
+        """
+        circuit = self.states.get(host)
+        if circuit is None or circuit.state == CLOSED:
+            return
+
+        remaining = circuit.opened_at + self.reset_timeout - time.time()
+        if circuit.state == OPEN and remaining <= 0:
+            circuit.state = HALF_OPEN
+            circuit.probing = False
+
+        if circuit.state == HALF_OPEN and not circuit.probing:
+            circuit.probing = True
+            logger.debug("Circuit for %s is half-open, sending probe", host)
+            return
+
+        raise CircuitOpenError(
+            f"{host} is failing ({circuit.failures} errors in a row); "
+            f"not sending requests for another {max(1, math.ceil(remaining))}s. "
+            "Run 'terryann status' to check the service."
+        )
+
+    def is_open(self, host: str) -> bool:
+        """Whether requests to host would currently be rejected."""
+        circuit = self.states.get(host)
+        if circuit is None or circuit.state == CLOSED:
+            return False
+        if circuit.state == OPEN:
+            return circuit.opened_at + self.reset_timeout > time.time()
+        return circuit.probing
+
+    def release_probe(self, host: str) -> None:
+        """Give up a probe that ended without a result (e.g. it was cancelled).
+
+        The circuit stays half-open, so the next request is let through as
+        the probe instead.
+        """
+        circuit = self.states.get(host)
+        if circuit is not None and circuit.state == HALF_OPEN and circuit.probing:
+            circuit.probing = False
+            logger.debug("Probe for %s was abandoned", host)
+
+    def record_success(self, host: str) -> None:
+        """Record a successful request, closing the circuit."""
+        circuit = self.states.get(host)
+        if circuit is None:
+            return
+        if circuit.state != CLOSED:
+            logger.debug("Circuit for %s closed", host)
+        del self.states[host]
+
+    def record_failure(self, host: str) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        circuit = self.states.setdefault(host, CircuitState())
+        circuit.failures += 1
+        circuit.probing = False
+        if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+            if circuit.state != OPEN:
+                logger.debug("Circuit for %s opened after %d failures", host, circuit.failures)
+            circuit.state = OPEN
+            circuit.opened_at = time.time()
+
+
+def load_health(tracker: LatencyTracker, breaker: CircuitBreaker) -> None:
+    """Restore latency samples and breaker state saved by earlier invocations."""
+    if not HEALTH_FILE.exists():
+        return
+
+    try:
+        with open(HEALTH_FILE, "r") as f:
+            data = json.load(f)
+        tracker.samples.update(data.get("latency", {}))
+        tracker.host_scores.update(data.get("hosts", {}))
+        for host, state in data.get("circuits", {}).items():
+            # A probe that was in flight when the last process exited is gone
+            breaker.states[host] = CircuitState(**{**state, "probing": False})
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.debug("Ignoring unreadable endpoint health file: %s", e)
+
+
+def save_health(tracker: LatencyTracker, breaker: CircuitBreaker) -> None:
+    """Persist latency samples and breaker state for the next invocation."""
+    data = {
+        "latency": tracker.samples,
+        "hosts": tracker.host_scores,
+        "circuits": {host: asdict(state) for host, state in breaker.states.items()},
+    }
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = HEALTH_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, HEALTH_FILE)
+    except OSError as e:
+        logger.debug("Could not save endpoint health: %s", e)
@@ -1,13 +1,28 @@
 """HTTP client for TerryAnn Gateway."""
 
-from typing import Any, Optional
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Optional
 
 import httpx
 
-from terryann_cli.config import Config
+from terryann_cli import jobs, timings
+from terryann_cli.config import DEFAULT_BACKEND_URL, Config
+from terryann_cli.logging import get_logger
+from terryann_cli.transport import get_pool
+
+logger = get_logger(__name__)
 
 # Backend URL for direct calls (bypasses gateway for long-running operations)
-BACKEND_URL = "https://synthwell-prototype-production.up.railway.app"
+BACKEND_URL = DEFAULT_BACKEND_URL
+
+# Backend responses meaning "no job endpoints here, use the blocking call"
+JOBS_UNSUPPORTED_STATUSES = (404, 405, 501)
+
+
+class GatewayStreamError(Exception):
+    """A streamed reply failed partway: error event, bad payload or dropped connection."""
 
 
 class GatewayClient:
@@ -15,9 +30,20 @@ class GatewayClient:
 
     def __init__(self, config: Config, auth_token: Optional[str] = None):
         self.config = config
-        self.base_url = config.gateway_url.rstrip("/")
+        self.gateway_urls = [url.rstrip("/") for url in config.gateway_urls]
+        self.backend_urls = [url.rstrip("/") for url in config.backend_urls]
         self.auth_token = auth_token
 
+    @property
+    def base_url(self) -> str:
+        """Fastest healthy gateway endpoint."""
+        return get_pool().rank(self.gateway_urls)[0]
+
+    @property
+    def backend_url(self) -> str:
+        """Fastest healthy backend endpoint."""
+        return get_pool().rank(self.backend_urls)[0]
+
     def _get_headers(self) -> dict:
         """Build request headers including auth if available."""
         headers = {
@@ -29,14 +55,27 @@ class GatewayClient:
         return headers
 
     async def health_check(self) -> dict:
-        """Check gateway health status."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{self.base_url}/health",
-                headers=self._get_headers(),
-            )
-            response.raise_for_status()
-            return response.json()
+        """Check gateway health status (hedged across gateway endpoints)."""
+        response = await get_pool().hedged_request(
+            "GET",
+            [f"{url}/health" for url in self.gateway_urls],
+            headers=self._get_headers(),
+            timeout=10.0,
+            circuit=False,  # Always probe, even if the breaker is open
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def warm_backend(self) -> None:
+        """Open a pooled connection to the backend ahead of journey creation.
+
+        Any response (even an error status) means DNS, TCP and TLS are done,
+        so the result is ignored.
+        """
+        response = await get_pool().request(
+            "GET", f"{self.backend_url}/health", timeout=10.0, retry=False
+        )
+        logger.debug("Backend connection warmed (%d)", response.status_code)
 
     async def send_message(
         self, session_id: str, message: str, surface: str = "cli"
@@ -51,34 +90,102 @@ class GatewayClient:
         Returns:
             Gateway response dict
         """
-        async with httpx.AsyncClient(timeout=180.0) as client:  # 3 min for full pipeline
-            response = await client.post(
-                f"{self.base_url}/gateway/message",
-                headers=self._get_headers(),
-                json={"session_id": session_id, "message": message, "surface": surface},
-            )
-            response.raise_for_status()
+        response = await get_pool().request(
+            "POST",
+            f"{self.base_url}/gateway/message",
+            headers=self._get_headers(),
+            json={"session_id": session_id, "message": message, "surface": surface},
+            timeout=180.0,  # 3 min for full pipeline
+        )
+        response.raise_for_status()
+        with timings.phase("decode"):
             return response.json()
 
-    async def create_journey_direct(self, params: dict[str, Any]) -> dict:
-        """Create a journey by calling the backend directly.
+    async def stream_message(
+        self, session_id: str, message: str, surface: str = "cli"
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Send a message to the gateway and stream the response.
 
-        This bypasses the gateway to avoid Railway timeout issues on long-running
-        journey creation (~90 seconds).
+        Asks for server-sent events. Gateways that stream chunked plain text
+        are read chunk by chunk, and gateways that only answer with JSON
+        produce a single "done" event carrying the usual response dict.
 
         Args:
-            params: Journey creation params including:
-                - zip_codes: List of ZIP codes (optional if locations provided)
-                - locations: List of location dicts with type, value, cluster_id (optional)
-                - campaign_type: Campaign type (e.g., "aep_acquisition")
-                - name: Journey name
-                - user_id: User ID for ownership
-                - created_from: Source identifier
+            session_id: Conversation session ID
+            message: User message text
+            surface: Client surface identifier (default: "cli")
 
-        Returns:
-            Journey creation response with nodes, edges, market_profile, etc.
+        Yields:
+            (kind, payload) tuples:
+            - ("text", str): next piece of response text
+            - ("metadata", dict): response metadata (e.g. pending_action)
+            - ("done", dict): full response dict, always yielded last
+
+        Raises:
+            GatewayStreamError: If the gateway sends an error event or an
+                event payload that isn't valid JSON, or the connection drops
+                after the reply has started (timeouts are raised as is)
         """
-        # Build request body
+        headers = self._get_headers()
+        headers["Accept"] = "text/event-stream, application/json"
+
+        async with get_pool().stream(
+            "POST",
+            f"{self.base_url}/gateway/message",
+            headers=headers,
+            json={"session_id": session_id, "message": message, "surface": surface},
+            timeout=180.0,  # 3 min for full pipeline
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            try:
+                if content_type.startswith("application/json"):
+                    # Gateway doesn't stream - fall back to the buffered response
+                    await response.aread()
+                    yield "done", response.json()
+                    return
+
+                text_parts: list[str] = []
+                metadata: dict = {}
+                final: Optional[dict] = None
+
+                if content_type.startswith("text/event-stream"):
+                    async for event, data in _iter_sse(response):
+                        if event in ("message", "token", "delta"):
+                            text = _sse_text(data)
+                            if text:
+                                text_parts.append(text)
+                                yield "text", text
+                        elif event == "metadata":
+                            metadata.update(_sse_json(event, data))
+                            yield "metadata", metadata
+                        elif event == "done":
+                            final = _sse_json(event, data) if data.strip() else None
+                            break
+                        elif event == "error":
+                            raise GatewayStreamError(_sse_text(data) or "Gateway stream failed")
+                else:
+                    async for chunk in response.aiter_text():
+                        if chunk:
+                            text_parts.append(chunk)
+                            yield "text", chunk
+            except httpx.TimeoutException:
+                raise
+            except (httpx.TransportError, httpx.StreamError) as e:
+                raise GatewayStreamError(
+                    "Connection to the gateway was lost mid-reply. Please try again."
+                ) from e
+
+            if final is None:
+                final = {"response": "".join(text_parts), "metadata": metadata}
+            yield "done", final
+
+    @staticmethod
+    def _build_journey_body(params: dict[str, Any]) -> dict[str, Any]:
+        """Build the backend request body for journey creation."""
         body: dict[str, Any] = {
             "campaign_type": params.get("campaign_type", "aep_acquisition"),
             "name": params.get("name", "New Journey"),
@@ -92,11 +199,229 @@ class GatewayClient:
         elif params.get("zip_codes"):
             body["zip_codes"] = params["zip_codes"]
 
-        async with httpx.AsyncClient(timeout=300.0) as client:  # 5 min timeout
-            response = await client.post(
-                f"{BACKEND_URL}/journey/flowchart/create-v2",
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-                json=body,
+        return body
+
+    async def create_journey(self, params: dict[str, Any]) -> dict:
+        """Create a journey, preferring submit-and-poll job mode.
+
+        The job is recorded in the local ledger while it runs, so its result
+        can be collected with `terryann journeys jobs` if this process dies.
+        Falls back to the blocking create_journey_direct call when job mode
+        is disabled or the backend has no job endpoints (remembered for a
+        day, so later builds skip the job submit).
+
+        Args:
+            params: Journey creation params (see create_journey_direct)
+
+        Returns:
+            Journey creation response with nodes, edges, market_profile, etc.
+        """
+        if self.config.journey_jobs and jobs.jobs_supported(self.backend_url):
+            job_id = await self.submit_journey_job(params)
+            if job_id:
+                return await self.wait_for_journey_job(job_id)
+        return await self.create_journey_direct(params)
+
+    async def submit_journey_job(self, params: dict[str, Any]) -> Optional[str]:
+        """Submit a journey creation job to the backend.
+
+        Args:
+            params: Journey creation params (see create_journey_direct)
+
+        Returns:
+            The job ID, or None if the backend does not support job mode
+        """
+        body = self._build_journey_body(params)
+        response = await get_pool().request(
+            "POST",
+            f"{self.backend_url}/journey/flowchart/jobs",
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            json=body,
+            timeout=30.0,
+        )
+        if response.status_code in JOBS_UNSUPPORTED_STATUSES:
+            logger.debug(
+                "Backend returned %d for job submit, using blocking create",
+                response.status_code,
             )
-            response.raise_for_status()
+            jobs.mark_jobs_unsupported(self.backend_url)
+            return None
+        response.raise_for_status()
+
+        job_id = response.json()["job_id"]
+        jobs.record_job(job_id, self.backend_url, body)
+        return job_id
+
+    async def get_journey_job(self, job_id: str, backend_url: Optional[str] = None) -> dict:
+        """Fetch the current state of a journey creation job.
+
+        Args:
+            job_id: Job ID returned by submit_journey_job
+            backend_url: Backend the job was submitted to (default: configured backend)
+
+        Returns:
+            Job dict with status ("queued", "running", "completed", "failed"),
+            plus result when completed or error when failed
+
+        Raises:
+            httpx.HTTPStatusError: If the backend answers with an error; on a
+                4xx (e.g. a job the backend has expired) the job is marked
+                expired in the ledger first, since it can't finish any more
+        """
+        base = (backend_url or self.backend_url).rstrip("/")
+        response = await get_pool().request(
+            "GET",
+            f"{base}/journey/flowchart/jobs/{job_id}",
+            headers={"Accept": "application/json"},
+            timeout=30.0,
+        )
+        if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+            jobs.update_job(
+                job_id,
+                status=jobs.EXPIRED,
+                error=f"Backend returned {response.status_code} for the job",
+            )
+        response.raise_for_status()
+        return response.json()
+
+    async def wait_for_journey_job(
+        self,
+        job_id: str,
+        backend_url: Optional[str] = None,
+        poll_interval: float = 2.0,
+        max_interval: float = 15.0,
+        timeout: float = 600.0,
+    ) -> dict:
+        """Poll a journey creation job with backoff until it finishes.
+
+        Transient network errors while polling are tolerated, since the
+        job keeps running on the backend regardless.
+
+        Args:
+            job_id: Job ID returned by submit_journey_job
+            backend_url: Backend the job was submitted to (default: configured backend)
+            poll_interval: Initial delay between polls in seconds
+            max_interval: Upper bound on the delay between polls
+            timeout: Give up after this many seconds (job stays in the ledger)
+
+        Returns:
+            Journey creation response from the completed job
+
+        Raises:
+            RuntimeError: If the job failed on the backend
+            httpx.TimeoutException: If the job did not finish within timeout
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        last_status = None
+
+        while True:
+            try:
+                job = await self.get_journey_job(job_id, backend_url)
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                    raise
+                logger.debug("Polling job %s failed, will retry: %s", job_id, e)
+                job = None
+
+            if job is not None:
+                status = job.get("status", "running")
+                if status == "completed":
+                    result = job.get("result") or {}
+                    jobs.update_job(job_id, status="completed", journey_id=result.get("id"))
+                    return result
+                if status == "failed":
+                    error = job.get("error") or "Journey creation failed"
+                    jobs.update_job(job_id, status="failed", error=error)
+                    raise RuntimeError(error)
+                if status != last_status:
+                    jobs.update_job(job_id, status=status)
+                    last_status = status
+
+            if time.monotonic() + interval > deadline:
+                raise httpx.TimeoutException(
+                    f"Journey job {job_id} is still running. "
+                    "Run 'terryann journeys jobs --wait' to collect it."
+                )
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+
+    async def create_journey_direct(self, params: dict[str, Any]) -> dict:
+        """Create a journey by calling the backend directly.
+
+        This bypasses the gateway to avoid Railway timeout issues on long-running
+        journey creation (~90 seconds).
+
+        Args:
+            params: Journey creation params including:
+                - zip_codes: List of ZIP codes (optional if locations provided)
+                - locations: List of location dicts with type, value, cluster_id (optional)
+                - campaign_type: Campaign type (e.g., "aep_acquisition")
+                - name: Journey name
+                - user_id: User ID for ownership
+                - created_from: Source identifier
+
+        Returns:
+            Journey creation response with nodes, edges, market_profile, etc.
+        """
+        body = self._build_journey_body(params)
+
+        response = await get_pool().request(
+            "POST",
+            f"{self.backend_url}/journey/flowchart/create-v2",
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            json=body,
+            timeout=300.0,  # 5 min timeout
+        )
+        response.raise_for_status()
+        with timings.phase("decode"):
             return response.json()
+
+
+async def _iter_sse(response: httpx.Response) -> AsyncIterator[tuple[str, str]]:
+    """Parse a server-sent event stream into (event, data) pairs."""
+    event = "message"
+    data_lines: list[str] = []
+
+    async for line in response.aiter_lines():
+        if not line:
+            # Blank line dispatches the event
+            if data_lines:
+                yield event, "\n".join(data_lines)
+            event = "message"
+            data_lines = []
+        elif line.startswith(":"):
+            continue  # Comment / keep-alive
+        else:
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "event":
+                event = value
+            elif field == "data":
+                data_lines.append(value)
+
+    if data_lines:
+        yield event, "\n".join(data_lines)
+
+
+def _sse_json(event: str, data: str) -> dict:
+    """Decode the JSON object carried by a metadata or done event."""
+    try:
+        payload = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise GatewayStreamError(f"Malformed {event} event from gateway: {e}") from e
+    if not isinstance(payload, dict):
+        raise GatewayStreamError(f"Malformed {event} event from gateway: expected an object")
+    return payload
+
+
+def _sse_text(data: str) -> str:
+    """Extract text from an SSE data payload (JSON {"text": ...} or raw text)."""
+    if data.startswith("{"):
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            return data
+        return payload.get("text") or payload.get("delta") or payload.get("detail") or ""
+    return data
@@ -0,0 +1,151 @@
+"""Bench commands - load testing against a gateway."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from terryann_cli import auth
+from terryann_cli.config import load_config
+from terryann_cli.loadgen import LoadReport, LoadSettings, load_corpus, run_load
+from terryann_cli.runtime import entry_point
+from terryann_cli.timings import format_duration
+
+console = Console()
+
+
+def _print_report(report: LoadReport) -> None:
+    """Print per-endpoint results of a load test."""
+    data = report.to_dict()
+    turns = data["turns"]
+
+    table = Table(title="Load Test Results", show_header=True, header_style="bold magenta")
+    table.add_column("Endpoint", style="cyan", no_wrap=True)
+    table.add_column("Requests", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Req/s", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("p99", justify="right")
+
+    rows = [*data["endpoints"].items(), ("turn (end to end)", turns)]
+    for name, stats in rows:
+        errors = f"{stats['error_rate']:.1%}" if stats["errors"] else "0"
+        table.add_row(
+            name,
+            f"{stats['requests']:,}",
+            f"[red]{errors}[/red]" if stats["errors"] else errors,
+            f"{stats['throughput']:.1f}",
+            format_duration(stats["p50"]),
+            format_duration(stats["p95"]),
+            format_duration(stats["p99"]),
+        )
+    console.print(table)
+
+    console.print(
+        f"\n[bold]{turns['requests']:,}[/bold] turns in {data['elapsed']:.1f}s "
+        f"([bold]{turns['throughput']:.1f}[/bold] turns/s), "
+        f"error rate {turns['error_rate']:.1%}"
+    )
+    if data["first_token"]["p50"] is not None:
+        first = data["first_token"]
+        console.print(
+            f"[dim]Time to first token: p50 {format_duration(first['p50'])} • "
+            f"p95 {format_duration(first['p95'])} • p99 {format_duration(first['p99'])}[/dim]"
+        )
+    if data["start_delay_p99"] is not None and data["start_delay_p99"] > 0.1:
+        console.print(
+            f"[yellow]Turns started up to {format_duration(data['start_delay_p99'])} late (p99): "
+            "not enough sessions for the arrival rate.[/yellow]"
+        )
+    if turns["error_types"]:
+        breakdown = ", ".join(f"{kind} × {n}" for kind, n in turns["error_types"].items())
+        console.print(f"[red]Errors: {breakdown}[/red]")
+
+
+@entry_point
+async def load_test(
+    url: Optional[str] = typer.Option(
+        None, "--url", help="Gateway URL (default: configured gateway)"
+    ),
+    sessions: int = typer.Option(10, "--sessions", "-c", help="Concurrent chat sessions"),
+    duration: float = typer.Option(30.0, "--duration", "-d", help="Seconds to generate load"),
+    rate: Optional[float] = typer.Option(
+        None, "--rate", "-r", help="Turns per second across all sessions (default: back to back)"
+    ),
+    think_time: float = typer.Option(
+        0.0, "--think-time", help="Mean seconds between a session's turns (without --rate)"
+    ),
+    corpus: Optional[Path] = typer.Option(
+        None, "--corpus", help="Prompt file: one prompt per line, or .jsonl with 'message'"
+    ),
+    stream: bool = typer.Option(False, "--stream", help="Use streaming chat responses"),
+    retry: bool = typer.Option(False, "--retry", help="Retry transient failures like the CLI does"),
+    use_auth: bool = typer.Option(True, "--auth/--no-auth", help="Send the logged-in user's token"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for prompt selection"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write the report as JSON"),
+):
+    """Generate concurrent chat load against a gateway and report latency."""
+    config = load_config()
+
+    if sessions < 1 or duration <= 0 or (rate is not None and rate <= 0):
+        console.print("[red]Error: --sessions, --duration and --rate must be positive.[/red]")
+        raise typer.Exit(code=1)
+
+    try:
+        prompts = load_corpus(corpus) if corpus else None
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error reading corpus: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    token = None
+    if use_auth:
+        # Valid for the whole run; awaited, since this runs on the event loop
+        user = await auth.ensure_fresh_token(min_validity=auth.REFRESH_MARGIN + duration)
+        token = user.access_token if user else None
+
+    settings = LoadSettings(
+        gateway_url=(url or config.gateway_url).rstrip("/"),
+        sessions=sessions,
+        duration=duration,
+        rate=rate,
+        think_time=think_time,
+        stream=stream,
+        retry=retry,
+        auth_token=token,
+        seed=seed,
+    )
+    if prompts:
+        settings.corpus = prompts
+
+    mode = f"{rate:g} turns/s" if rate else "back to back"
+    console.print(
+        f"[dim]{sessions} sessions against {settings.gateway_url} "
+        f"for {duration:g}s ({mode})...[/dim]"
+    )
+
+    with console.status("Starting...") as status:
+
+        def on_progress(report: LoadReport):
+            turns = report.turns
+            status.update(
+                f"{report.elapsed:.0f}s • {turns.count:,} turns • "
+                f"{turns.count / report.elapsed:.1f}/s • "
+                f"{sum(turns.errors.values())} errors"
+            )
+
+        report = await run_load(settings, config, on_progress=on_progress)
+
+    _print_report(report)
+
+    if output:
+        output.write_text(json.dumps(report.to_dict(), indent=2) + "\n")
+        console.print(f"[dim]Report written to {output}[/dim]")
+
+
+# Registered lazily as `terryann bench` (see main.py)
+app = typer.Typer(help="Benchmark and load-test tools")
+app.command("load")(load_test)
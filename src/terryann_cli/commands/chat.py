@@ -15,16 +15,21 @@ from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.styles import Style
 from rich.console import Console
+from rich.live import Live
+from rich.text import Text
 
-from terryann_cli.logging import logger
+from terryann_cli.logging import get_logger
 from rich.panel import Panel
 from rich.rule import Rule
 
-from terryann_cli import auth
-from terryann_cli.client import GatewayClient
+from terryann_cli import auth, jobs, memprof, timings, tracing
+from terryann_cli.breaker import CircuitOpenError
+from terryann_cli.client import GatewayClient, GatewayStreamError
 from terryann_cli.config import load_config
 from terryann_cli.splash import print_splash, SUGGESTIONS
 from terryann_cli.spinner import run_with_rotating_status
+from terryann_cli.runtime import run
+from terryann_cli.transport import get_pool
 from terryann_cli.journey_confirm import (
     confirm_journey_creation,
     format_journey_params_for_api,
@@ -38,6 +43,8 @@ from terryann_cli.commands.journeys import (
 )
 from rich.table import Table
 
+logger = get_logger(__name__)
+
 console = Console()
 
 # Menu commands
@@ -106,10 +113,10 @@ def _read_cached_help(page: str) -> str | None:
         # Check if cache is less than 24 hours old
         age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
         if age_hours < 24:
-            logger.debug(f"Using cached help content for {page} (age: {age_hours:.1f}h)")
+            logger.debug("Using cached help content for %s (age: %.1fh)", page, age_hours)
             return cache_path.read_text()
         else:
-            logger.debug(f"Cache expired for {page} (age: {age_hours:.1f}h)")
+            logger.debug("Cache expired for %s (age: %.1fh)", page, age_hours)
     return None
 
 
@@ -117,7 +124,65 @@ def _write_cached_help(page: str, content: str):
     """Write help content to cache."""
     cache_path = _get_cache_path(page)
     cache_path.write_text(content)
-    logger.debug(f"Cached help content for {page}")
+    logger.debug("Cached help content for %s", page)
+
+
+@tracing.traced("help html to rich", "render")
+def _html_to_rich(html: str) -> str:
+    """Convert a help page's HTML to Rich markup (basic extraction)."""
+    # Try to extract main content - look for common patterns
+    import re
+
+    # Remove script and style tags
+    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+
+    # Extract title
+    title_match = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
+    title = title_match.group(1).strip() if title_match else "TerryAnn Help"
+
+    # Extract main/article content or body
+    main_match = re.search(r'<main[^>]*>(.*?)</main>', html, flags=re.DOTALL | re.IGNORECASE)
+    if not main_match:
+        main_match = re.search(r'<article[^>]*>(.*?)</article>', html, flags=re.DOTALL | re.IGNORECASE)
+    if not main_match:
+        main_match = re.search(r'<body[^>]*>(.*?)</body>', html, flags=re.DOTALL | re.IGNORECASE)
+
+    content = main_match.group(1) if main_match else html
+
+    # Convert common HTML to Rich markup format
+    content = re.sub(r'<h1[^>]*>([^<]+)</h1>', r'\n[bold]\1[/bold]\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<h2[^>]*>([^<]+)</h2>', r'\n[bold cyan]\1[/bold cyan]\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<h3[^>]*>([^<]+)</h3>', r'\n[cyan]\1[/cyan]\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<p[^>]*>', '\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'</p>', '\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<br\s*/?>', '\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<li[^>]*>', '  • ', content, flags=re.IGNORECASE)
+    content = re.sub(r'</li>', '\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<strong>([^<]+)</strong>', r'[bold]\1[/bold]', content, flags=re.IGNORECASE)
+    content = re.sub(r'<b>([^<]+)</b>', r'[bold]\1[/bold]', content, flags=re.IGNORECASE)
+    content = re.sub(r'<em>([^<]+)</em>', r'[italic]\1[/italic]', content, flags=re.IGNORECASE)
+    content = re.sub(r'<code[^>]*>([^<]+)</code>', r'[cyan]\1[/cyan]', content, flags=re.IGNORECASE)
+    # Convert links to Rich clickable format: [link=URL]text[/link]
+    content = re.sub(
+        r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>([^<]+)</a>',
+        r'[link=\1]\2[/link]',
+        content,
+        flags=re.IGNORECASE,
+    )
+
+    # Remove remaining HTML tags
+    content = re.sub(r'<[^>]+>', '', content)
+
+    # Clean up whitespace
+    content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+    content = content.strip()
+
+    # Decode HTML entities
+    import html as html_module
+    content = html_module.unescape(content)
+
+    return content
 
 
 async def _fetch_help_content(page: str = "help") -> str | None:
@@ -128,71 +193,24 @@ async def _fetch_help_content(page: str = "help") -> str | None:
         return cached
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"https://terryann.ai/{page}?surface=cli")
-            response.raise_for_status()
-
-            # Extract text content from HTML (basic extraction)
-            html = response.text
-
-            # Try to extract main content - look for common patterns
-            import re
-
-            # Remove script and style tags
-            html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-
-            # Extract title
-            title_match = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
-            title = title_match.group(1).strip() if title_match else "TerryAnn Help"
-
-            # Extract main/article content or body
-            main_match = re.search(r'<main[^>]*>(.*?)</main>', html, flags=re.DOTALL | re.IGNORECASE)
-            if not main_match:
-                main_match = re.search(r'<article[^>]*>(.*?)</article>', html, flags=re.DOTALL | re.IGNORECASE)
-            if not main_match:
-                main_match = re.search(r'<body[^>]*>(.*?)</body>', html, flags=re.DOTALL | re.IGNORECASE)
-
-            content = main_match.group(1) if main_match else html
-
-            # Convert common HTML to Rich markup format
-            content = re.sub(r'<h1[^>]*>([^<]+)</h1>', r'\n[bold]\1[/bold]\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<h2[^>]*>([^<]+)</h2>', r'\n[bold cyan]\1[/bold cyan]\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<h3[^>]*>([^<]+)</h3>', r'\n[cyan]\1[/cyan]\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<p[^>]*>', '\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'</p>', '\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<br\s*/?>', '\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<li[^>]*>', '  • ', content, flags=re.IGNORECASE)
-            content = re.sub(r'</li>', '\n', content, flags=re.IGNORECASE)
-            content = re.sub(r'<strong>([^<]+)</strong>', r'[bold]\1[/bold]', content, flags=re.IGNORECASE)
-            content = re.sub(r'<b>([^<]+)</b>', r'[bold]\1[/bold]', content, flags=re.IGNORECASE)
-            content = re.sub(r'<em>([^<]+)</em>', r'[italic]\1[/italic]', content, flags=re.IGNORECASE)
-            content = re.sub(r'<code[^>]*>([^<]+)</code>', r'[cyan]\1[/cyan]', content, flags=re.IGNORECASE)
-            # Convert links to Rich clickable format: [link=URL]text[/link]
-            content = re.sub(r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>([^<]+)</a>', r'[link=\1]\2[/link]', content, flags=re.IGNORECASE)
-
-            # Remove remaining HTML tags
-            content = re.sub(r'<[^>]+>', '', content)
-
-            # Clean up whitespace
-            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-            content = content.strip()
-
-            # Decode HTML entities
-            import html as html_module
-            content = html_module.unescape(content)
-
-            # Cache for next time
-            _write_cached_help(page, content)
-
-            return content
+        response = await get_pool().request(
+            "GET", f"https://terryann.ai/{page}?surface=cli", timeout=10.0
+        )
+        response.raise_for_status()
+
+        content = _html_to_rich(response.text)
+
+        # Cache for next time
+        _write_cached_help(page, content)
+
+        return content
 
     except Exception as e:
-        logger.debug(f"Failed to fetch help content from {page}: {e}")
+        logger.debug("Failed to fetch help content from %s: %s", page, e)
         # Try stale cache as last resort
         cache_path = _get_cache_path(page)
         if cache_path.exists():
-            logger.debug(f"Using stale cache for {page}")
+            logger.debug("Using stale cache for %s", page)
             return cache_path.read_text()
         return None
 
@@ -230,6 +248,15 @@ Visit [bold]terryann.ai/help[/bold] for detailed documentation."""
     )
 
 
+def _hint_pending_jobs():
+    """Point the user at the job ledger if a journey build is still running."""
+    if jobs.has_recent_pending_jobs():
+        console.print(
+            "[dim]Your journey may still be building. "
+            "Run [bold]terryann journeys jobs --wait[/bold] to collect it.[/dim]"
+        )
+
+
 # Rotating acknowledgment messages
 ACKNOWLEDGMENTS = [
     "On it...",
@@ -272,7 +299,110 @@ async def get_user_input_async(session: PromptSession) -> str | None:
         return None
 
 
-async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser):
+async def _stream_response(
+    client: GatewayClient, session_id: str, user_input: str
+) -> tuple[dict, bool]:
+    """Stream a chat reply into a live TerryAnn panel.
+
+    Shows the rotating status until the first event arrives, then renders
+    partial text as it comes in. A pending_action is flagged on the panel
+    as soon as its metadata event lands.
+
+    Returns:
+        (result, rendered): the full gateway response dict, and whether the
+        TerryAnn panel has already been printed
+    """
+    stream = client.stream_message(session_id, user_input)
+
+    async def first_event():
+        return await anext(stream)
+
+    try:
+        kind, payload = await run_with_rotating_status(console, first_event(), message=user_input)
+        if kind == "done":
+            # Gateway answered with plain JSON - let the caller render it
+            return payload, False
+
+        parts: list[str] = []
+        subtitle = None
+
+        def render(content) -> Panel:
+            return Panel(
+                content,
+                title="[bold magenta]TerryAnn[/bold magenta]",
+                subtitle=subtitle,
+                border_style="magenta",
+                padding=(0, 1),
+            )
+
+        with Live(console=console, refresh_per_second=12) as live:
+            while kind != "done":
+                if kind == "text":
+                    parts.append(payload)
+                elif kind == "metadata" and payload.get("pending_action"):
+                    subtitle = "[dim]Journey details ready to confirm[/dim]"
+                # Plain Text while streaming - partial markup may not parse yet
+                live.update(render(Text("".join(parts))))
+                kind, payload = await anext(stream)
+
+            result = payload
+            subtitle = None
+            with timings.phase("render"):
+                live.update(render(result.get("response") or "".join(parts)), refresh=True)
+
+        return result, True
+    finally:
+        # Release the connection even if we stopped before the stream ended
+        await stream.aclose()
+
+
+async def _warm_up(client: GatewayClient, user: auth.AuthUser) -> None:
+    """Warm gateway and backend connections and the auth token.
+
+    Runs while the splash screen renders, so the first message goes out
+    on already-open connections with a token that won't need a refresh.
+    """
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        client.health_check(),
+        client.warm_backend(),
+        auth.ensure_fresh_token(),
+        return_exceptions=True,
+    )
+
+    fresh_user = results[2]
+    if isinstance(fresh_user, auth.AuthUser) and fresh_user.access_token != client.auth_token:
+        client.auth_token = fresh_user.access_token
+        user.access_token = fresh_user.access_token
+
+    failures = [r for r in results[:2] if isinstance(r, Exception)]
+    logger.debug(
+        "Warm-up finished in %.0fms (%d of 2 connections failed)",
+        (time.perf_counter() - started) * 1000,
+        len(failures),
+    )
+
+
+async def chat_session(client: GatewayClient, session_id: str, user: auth.AuthUser):
+    """Show the splash while warming up connections, then run the chat loop."""
+    warmup = asyncio.create_task(_warm_up(client, user))
+
+    # Render in a thread so warm-up requests progress on the loop meanwhile
+    await asyncio.to_thread(print_splash, console, session_id, user_email=user.email)
+
+    try:
+        await chat_loop(client, session_id, user, warmup=warmup)
+    finally:
+        if not warmup.done():
+            warmup.cancel()
+
+
+async def chat_loop(
+    client: GatewayClient,
+    session_id: str,
+    user: auth.AuthUser,
+    warmup: asyncio.Task | None = None,
+):
     """Run the interactive chat loop."""
     # Create prompt session for async input with slash command completion
     # Custom style for completion menu - no background except highlighted item
@@ -292,6 +422,7 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
         style=menu_style,
     )
     current_session_id = session_id
+    first_turn = True
 
     while True:
         user_input = await get_user_input_async(prompt_session)
@@ -299,6 +430,11 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
             console.print("\n[dim]Goodbye![/dim]")
             break
 
+        if warmup is not None:
+            # Almost always done by the time the user has typed something
+            await warmup
+            warmup = None
+
         input_lower = user_input.lower().strip()
 
         # Handle menu command
@@ -345,14 +481,14 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
             continue
 
         if input_lower == "/logout":
-            auth.logout()
+            await auth.sign_out()
             console.print("[dim]Logged out. Goodbye![/dim]")
             break
 
         if input_lower == "/journeys":
             try:
                 config = load_config()
-                data = await _fetch_journeys(config.gateway_url, limit=10)
+                data = await _fetch_journeys(config.gateway_urls, limit=10)
                 journeys = data.get("journeys", [])
                 if not journeys:
                     console.print("[dim]No journeys found.[/dim]")
@@ -377,12 +513,12 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
         if input_lower == "/last":
             try:
                 config = load_config()
-                data = await _fetch_journeys(config.gateway_url, limit=1)
+                data = await _fetch_journeys(config.gateway_urls, limit=1)
                 journeys = data.get("journeys", [])
                 if not journeys:
                     console.print("[dim]No journeys found.[/dim]")
                 else:
-                    journey = await _fetch_journey(config.gateway_url, journeys[0]["id"])
+                    journey = await _fetch_journey(config.gateway_urls, journeys[0]["id"])
                     journey_data = journey.get("journey_data", {}) or {}
                     name = journey_data.get("name") or journey.get("name", "Journey")
                     console.print(Panel(
@@ -394,6 +530,7 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
                         console.print("\n[bold]Journey Flow[/bold]")
                         tree = _build_journey_tree(journey_data, show_because=True)
                         console.print(tree)
+                        memprof.checkpoint("journey render")
             except Exception as e:
                 console.print(f"[red]Error fetching journey: {e}[/red]")
             continue
@@ -419,7 +556,7 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
                         api_params = format_journey_params_for_api(confirmed_params, user.id)
                         journey_result = await run_with_rotating_status(
                             console,
-                            client.create_journey_direct(api_params),
+                            client.create_journey(api_params),
                             message="Building journey...",
                         )
                         journey_id = journey_result.get("id", "unknown")
@@ -436,12 +573,14 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
                         console.print("\n[bold]Journey Flow[/bold]")
                         tree = _build_journey_tree(journey_result, show_because=True)
                         console.print(tree)
+                        memprof.checkpoint("journey render")
                     else:
                         console.print("[dim]Journey creation cancelled.[/dim]")
                 else:
                     console.print("[dim]Journey wizard not available. Try typing your request directly.[/dim]")
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
+                _hint_pending_jobs()
             continue
 
         if input_lower == "/web":
@@ -470,17 +609,32 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
             console.print("[dim]Type / to see available commands[/dim]")
             continue
 
+        turn_timing = timings.begin("chat turn")
         try:
             # Brief acknowledgment before processing
             ack = random.choice(ACKNOWLEDGMENTS)
             console.print(f"[dim]{ack}[/dim]\n")
 
-            # Use rotating branded status messages while waiting
-            result = await run_with_rotating_status(
-                console,
-                client.send_message(current_session_id, user_input),
-                message=user_input,
-            )
+            turn_started = time.perf_counter()
+            if client.config.stream_responses:
+                # Render the reply as it streams in
+                result, rendered = await _stream_response(
+                    client, current_session_id, user_input
+                )
+            else:
+                # Use rotating branded status messages while waiting
+                result = await run_with_rotating_status(
+                    console,
+                    client.send_message(current_session_id, user_input),
+                    message=user_input,
+                )
+                rendered = False
+
+            if first_turn:
+                logger.debug(
+                    "First response in %.0fms", (time.perf_counter() - turn_started) * 1000
+                )
+                first_turn = False
 
             response_text = result.get("response", "No response received.")
 
@@ -495,14 +649,16 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
                 has_complete_info = extracted_campaign and extracted_location.get("location_type")
 
                 # Show TerryAnn's message first
-                console.print(
-                    Panel(
-                        response_text,
-                        title="[bold magenta]TerryAnn[/bold magenta]",
-                        border_style="magenta",
-                        padding=(0, 1),
-                    )
-                )
+                if not rendered:
+                    with timings.phase("render"):
+                        console.print(
+                            Panel(
+                                response_text,
+                                title="[bold magenta]TerryAnn[/bold magenta]",
+                                border_style="magenta",
+                                padding=(0, 1),
+                            )
+                        )
 
                 if has_complete_info:
                     # Skip confirmation UI - build params from extracted info
@@ -565,7 +721,7 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
                     try:
                         journey_result = await run_with_rotating_status(
                             console,
-                            client.create_journey_direct(api_params),
+                            client.create_journey(api_params),
                             message="Building journey...",
                         )
 
@@ -586,8 +742,11 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
 
                         # Journey flow visualization
                         console.print("\n[bold]Journey Flow[/bold]")
-                        tree = _build_journey_tree(journey_result, show_because=True)
-                        console.print(tree)
+                        with timings.phase("build"):
+                            tree = _build_journey_tree(journey_result, show_because=True)
+                        with timings.phase("render"):
+                            console.print(tree)
+                        memprof.checkpoint("journey render")
 
                         # Hint for next steps
                         console.print(
@@ -597,19 +756,23 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
                         )
                     except Exception as e:
                         console.print(f"[red]Error creating journey: {e}[/red]")
+                        _hint_pending_jobs()
                 else:
                     console.print("[dim]Journey creation cancelled.[/dim]")
-            else:
+            elif not rendered:
                 # Normal response - just show it
-                console.print(
-                    Panel(
-                        response_text,
-                        title="[bold magenta]TerryAnn[/bold magenta]",
-                        border_style="magenta",
-                        padding=(0, 1),
+                with timings.phase("render"):
+                    console.print(
+                        Panel(
+                            response_text,
+                            title="[bold magenta]TerryAnn[/bold magenta]",
+                            border_style="magenta",
+                            padding=(0, 1),
+                        )
                     )
-                )
 
+        except CircuitOpenError as e:
+            console.print(f"[red]Error: {e}[/red]")
         except httpx.ConnectError:
             console.print(
                 "[red]Error: Cannot connect to gateway. Check your connection.[/red]"
@@ -620,6 +783,11 @@ async def chat_loop(client: GatewayClient, session_id: str, user: auth.AuthUser)
             )
         except httpx.HTTPStatusError as e:
             console.print(f"[red]Error: Gateway returned {e.response.status_code}[/red]")
+        except GatewayStreamError as e:
+            console.print(f"[red]Error: {e}[/red]")
+        finally:
+            timings.end(turn_timing)
+            memprof.checkpoint("chat turn")
 
 
 def _prompt_login() -> auth.AuthUser | None:
@@ -678,11 +846,9 @@ def chat():
     client = GatewayClient(config, auth_token=user.access_token)
     session_id = str(uuid.uuid4())
 
-    # Display splash screen with ASCII logo
-    print_splash(console, session_id, user_email=user.email)
-
+    # Display splash screen with ASCII logo while connections warm up
     try:
-        asyncio.run(chat_loop(client, session_id, user))
+        run(chat_session(client, session_id, user))
     except KeyboardInterrupt:
         console.print("\n[dim]Goodbye![/dim]")
 
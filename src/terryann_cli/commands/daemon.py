@@ -0,0 +1,145 @@
+"""Daemon commands - run and control the background daemon."""
+
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from terryann_cli import daemon_client
+from terryann_cli.config import CONFIG_DIR, load_config
+
+console = Console()
+
+DAEMON_LOG = CONFIG_DIR / "daemon.log"
+# Seconds to wait for a background daemon to answer
+START_TIMEOUT = 10.0
+
+
+def _ping() -> Optional[dict[str, Any]]:
+    """Status of the running daemon, or None if there is none."""
+    try:
+        return daemon_client.call("ping", timeout=5.0)
+    except (daemon_client.DaemonUnavailableError, daemon_client.OpError):
+        return None
+
+
+def _format_uptime(seconds: float) -> str:
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f}h"
+    if seconds >= 60:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds:.0f}s"
+
+
+def start(
+    background: bool = typer.Option(
+        False, "--background", "-b", help="Detach and run in the background"
+    ),
+):
+    """Start the daemon that keeps connections, auth and caches warm.
+
+    Commands such as `journeys list` and `journeys show` use it while it
+    runs and work in-process otherwise.
+    """
+    running = _ping()
+    if running:
+        console.print(f"[yellow]Daemon already running (pid {running['pid']}).[/yellow]")
+        raise typer.Exit(code=0)
+
+    if background:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        with open(DAEMON_LOG, "ab") as log:
+            subprocess.Popen(
+                [sys.executable, "-m", "terryann_cli.main", "daemon", "start"],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                cwd=CONFIG_DIR,
+                start_new_session=True,
+            )
+        deadline = time.monotonic() + START_TIMEOUT
+        while time.monotonic() < deadline:
+            running = _ping()
+            if running:
+                console.print(f"[green]Daemon started (pid {running['pid']}).[/green]")
+                return
+            time.sleep(0.1)
+        console.print(f"[red]Error: Daemon did not start, see {DAEMON_LOG}[/red]")
+        raise typer.Exit(code=1)
+
+    from terryann_cli.daemon import Daemon
+    from terryann_cli.runtime import run
+
+    config = load_config()
+
+    def on_ready(socket_path: str):
+        idle = (
+            f"exits after {_format_uptime(config.daemon_idle_timeout)} idle"
+            if config.daemon_idle_timeout > 0
+            else "no idle timeout"
+        )
+        console.print(
+            Panel(
+                f"[green bold]Daemon listening on {socket_path}[/green bold]\n\n"
+                f"[dim]Reads cached for {config.daemon_cache_ttl:g}s • {idle} • "
+                "Ctrl+C to stop[/dim]",
+                title="TerryAnn Daemon",
+                border_style="cyan",
+            )
+        )
+
+    try:
+        run(Daemon(config).run(on_ready=on_ready))
+    except KeyboardInterrupt:
+        pass
+    console.print("[dim]Daemon stopped.[/dim]")
+
+
+def stop():
+    """Stop the running daemon."""
+    try:
+        reply = daemon_client.call("shutdown", timeout=5.0)
+    except daemon_client.DaemonUnavailableError:
+        console.print("[yellow]No daemon running.[/yellow]")
+        raise typer.Exit(code=0)
+    console.print(f"[green]Daemon stopped (pid {reply['pid']}).[/green]")
+
+
+def status():
+    """Show whether the daemon is running and what it has served."""
+    running = _ping()
+    if not running:
+        console.print(
+            "[yellow]No daemon running.[/yellow]\n"
+            "Run [bold]terryann daemon start --background[/bold] to start one."
+        )
+        raise typer.Exit(code=0)
+
+    lookups = running["cache_hits"] + running["cache_misses"]
+    hit_ratio = f"{running['cache_hits'] / lookups:.0%}" if lookups else "—"
+    lines = [
+        f"[bold]pid {running['pid']}[/bold] • up {_format_uptime(running['uptime'])}",
+        f"Requests served: {running['served']:,}",
+        f"Cache: {running['cache_entries']} entries, {hit_ratio} hit ratio",
+        f"Upstream requests: {running['upstream_requests']:,}",
+    ]
+    if running["user"]:
+        expires = datetime.fromisoformat(running["token_expires_at"])
+        lines.append(f"User: {running['user']} [dim](token valid until {expires:%H:%M})[/dim]")
+    else:
+        lines.append("[dim]Not logged in[/dim]")
+    console.print(
+        Panel("\n".join(lines), title="[bold cyan]Daemon[/bold cyan]", border_style="cyan")
+    )
+
+
+# Registered lazily as `terryann daemon` (see main.py)
+app = typer.Typer(help="Run the background daemon that keeps connections warm")
+app.command("start")(start)
+app.command("stop")(stop)
+app.command("status")(status)
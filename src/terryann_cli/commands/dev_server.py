@@ -0,0 +1,82 @@
+"""Dev server command - local stand-in for the gateway and backend."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from terryann_cli.devserver import DEFAULT_PORT, DevServerSettings, parse_latency, run_dev_server
+from terryann_cli.runtime import run
+
+console = Console()
+
+
+def dev_server(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(DEFAULT_PORT, "--port", "-p", help="Port to bind"),
+    latency: str = typer.Option(
+        "lognormal:0.05,0.5",
+        "--latency",
+        help=(
+            "Latency distribution: fixed:S, uniform:MIN,MAX, normal:MEAN,SD "
+            "or lognormal:MEDIAN,SIGMA"
+        ),
+    ),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Share of requests that fail (0-1)"),
+    error_status: int = typer.Option(503, "--error-status", help="Status code for injected errors"),
+    payload_kb: int = typer.Option(0, "--payload-kb", help="Extra KB of text in chat responses"),
+    reply_words: int = typer.Option(60, "--reply-words", help="Words per chat reply"),
+    token_delay: float = typer.Option(
+        0.02, "--token-delay", help="Seconds between streamed tokens"
+    ),
+    nodes: int = typer.Option(40, "--nodes", help="Nodes per generated journey"),
+    journeys: int = typer.Option(25, "--journeys", help="Journeys in the list"),
+    build_time: float = typer.Option(2.0, "--build-time", help="Seconds a journey build takes"),
+    jobs: bool = typer.Option(True, "--jobs/--no-jobs", help="Serve journey build job endpoints"),
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Stream chat replies as SSE"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for reproducible runs"),
+):
+    """Run a local stand-in for the gateway and backend (offline development)."""
+    try:
+        parse_latency(latency)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    settings = DevServerSettings(
+        latency=latency,
+        error_rate=error_rate,
+        error_status=error_status,
+        payload_kb=payload_kb,
+        reply_words=reply_words,
+        token_delay=token_delay,
+        nodes=nodes,
+        journeys=journeys,
+        build_time=build_time,
+        jobs=jobs,
+        stream=stream,
+        seed=seed,
+    )
+
+    def on_ready(base_url: str):
+        console.print(
+            Panel(
+                f"[green bold]Dev server listening on {base_url}[/green bold]\n\n"
+                f"[dim]Point the CLI at it:[/dim]\n"
+                f"  export TERRYANN_GATEWAY_URL={base_url}\n"
+                f"  export TERRYANN_BACKEND_URL={base_url}\n\n"
+                f"[dim]Latency {latency} • errors {error_rate:.0%} • "
+                f"{journeys} journeys of {nodes} nodes • Ctrl+C to stop[/dim]",
+                title="TerryAnn Dev Server",
+                border_style="cyan",
+            )
+        )
+
+    try:
+        run(run_dev_server(settings, host, port, on_ready=on_ready))
+    except KeyboardInterrupt:
+        console.print("[dim]Dev server stopped.[/dim]")
+    except OSError as e:
+        console.print(f"[red]Error: Cannot listen on {host}:{port}: {e}[/red]")
+        raise typer.Exit(code=1)
@@ -1,21 +1,32 @@
 """Journeys command - list and manage journeys."""
 
-import asyncio
 from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, Sequence
 
-import httpx
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
+from terryann_cli import daemon_client, jobs, memprof, timings, tracing
 from terryann_cli.config import load_config
 from terryann_cli.constants import CHANNEL_ICONS, NODE_TYPE_ICONS
 
+if TYPE_CHECKING:
+    from terryann_cli.client import GatewayClient
+
+# The HTTP stack (httpx, transport, client) is imported where it's used:
+# reads answered by the daemon don't need it
+
 console = Console()
 
 
+def _as_list(urls: str | Sequence[str]) -> list[str]:
+    """Normalize one base URL or a list of them."""
+    return [urls] if isinstance(urls, str) else list(urls)
+
+
 def _parse_datetime(dt_str: str) -> datetime:
     """Parse ISO datetime string."""
     return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
@@ -38,39 +49,71 @@ def _format_relative_time(dt: datetime) -> str:
         return "just now"
 
 
-async def _fetch_journeys(gateway_url: str, limit: int = 20) -> dict:
-    """Fetch journeys from gateway."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            f"{gateway_url}/gateway/journeys",
-            params={"limit": limit},
-        )
-        response.raise_for_status()
-        return response.json()
+async def _fetch_journeys(gateway_url: str | Sequence[str], limit: int = 20) -> dict:
+    """Fetch journeys from gateway (concurrent identical calls share one request).
 
+    gateway_url may be a list of gateway endpoints to hedge across. Unchanged
+    lists are served from the local conditional-request cache.
+    """
+    from terryann_cli.transport import get_pool
 
-def list_journeys(
-    limit: int = typer.Option(20, "--limit", "-n", help="Number of journeys to show"),
-):
-    """List recent journeys."""
+    return await get_pool().get_json(
+        [f"{url}/gateway/journeys" for url in _as_list(gateway_url)],
+        params={"limit": limit},
+        timeout=30.0,
+        conditional=True,
+    )
+
+
+def gateway_error(e: Exception) -> Optional[daemon_client.OpError]:
+    """Turn a failed gateway read into an error for the user (None if unexpected)."""
+    import httpx
+
+    from terryann_cli.breaker import CircuitOpenError
+
+    if isinstance(e, CircuitOpenError):
+        return daemon_client.OpError(str(e))
+    if isinstance(e, httpx.ConnectError):
+        return daemon_client.OpError("Cannot connect to gateway.")
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        return daemon_client.OpError(f"Gateway returned {status}", status=status)
+    return None
+
+
+def _read(op: str, fetch: Callable[[list[str]], Coroutine[Any, Any, dict]], **args: Any) -> dict:
+    """
+    Read journey data through a running daemon, or in-process without one.
+
+    Args:
+        op: Daemon op (e.g. "journeys.list")
+        fetch: Coroutine function taking the gateway URLs, for in-process reads
+        **args: Op arguments (the gateway URLs are added)
+
+    Raises:
+        daemon_client.OpError: If the read failed
+    """
     config = load_config()
+    if config.daemon_enabled:
+        try:
+            return daemon_client.call(op, gateway_urls=config.gateway_urls, **args)
+        except daemon_client.DaemonUnavailableError:
+            pass
+
+    from terryann_cli.runtime import run
 
     try:
-        data = asyncio.run(_fetch_journeys(config.gateway_url, limit))
-    except httpx.ConnectError:
-        console.print("[red]Error: Cannot connect to gateway.[/red]")
-        raise typer.Exit(code=1)
-    except httpx.HTTPStatusError as e:
-        console.print(f"[red]Error: Gateway returned {e.response.status_code}[/red]")
-        raise typer.Exit(code=1)
+        return run(fetch(config.gateway_urls))
+    except Exception as e:
+        error = gateway_error(e)
+        if error is None:
+            raise
+        raise error from e
 
-    journeys = data.get("journeys", [])
 
-    if not journeys:
-        console.print("[dim]No journeys found.[/dim]")
-        return
-
-    # Create table
+@tracing.traced("journeys table", "render")
+def _build_journeys_table(journeys: list[dict]) -> Table:
+    """Build the Recent Journeys table."""
     table = Table(title="Recent Journeys", show_header=True, header_style="bold magenta")
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Status", style="green")
@@ -109,18 +152,53 @@ def list_journeys(
 
         table.add_row(journey_id, status_display, target, tp_count, created)
 
-    console.print(table)
+    return table
+
+
+def list_journeys(
+    limit: int = typer.Option(20, "--limit", "-n", help="Number of journeys to show"),
+):
+    """List recent journeys."""
+    with timings.operation("journeys list"):
+        _list_journeys(limit)
+
+
+def _list_journeys(limit: int):
+    try:
+        data = _read("journeys.list", lambda urls: _fetch_journeys(urls, limit), limit=limit)
+    except daemon_client.OpError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    journeys = data.get("journeys", [])
+
+    if not journeys:
+        console.print("[dim]No journeys found.[/dim]")
+        return
+
+    with timings.phase("build"):
+        table = _build_journeys_table(journeys)
+    with timings.phase("render"):
+        console.print(table)
     console.print(f"\n[dim]Total: {data.get('count', len(journeys))} journeys[/dim]")
 
 
-async def _fetch_journey(gateway_url: str, journey_id: str) -> dict:
-    """Fetch a single journey from gateway."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(f"{gateway_url}/gateway/journeys/{journey_id}")
-        response.raise_for_status()
-        return response.json()
+async def _fetch_journey(gateway_url: str | Sequence[str], journey_id: str) -> dict:
+    """Fetch a single journey from gateway (concurrent identical calls share one request).
 
+    gateway_url may be a list of gateway endpoints to hedge across. Unchanged
+    journeys are served from the local conditional-request cache.
+    """
+    from terryann_cli.transport import get_pool
 
+    return await get_pool().get_json(
+        [f"{url}/gateway/journeys/{journey_id}" for url in _as_list(gateway_url)],
+        timeout=30.0,
+        conditional=True,
+    )
+
+
+@tracing.traced("journey tree", "render")
 def _build_journey_tree(journey_data: dict, show_because: bool = True) -> Tree:
     """Build a Rich tree visualization of the journey flow."""
     nodes = journey_data.get("nodes", [])
@@ -152,19 +230,25 @@ def _build_journey_tree(journey_data: dict, show_because: bool = True) -> Tree:
         tree = Tree("[dim]No entry node found[/dim]")
         return tree
 
-    # Build tree recursively
+    # Walk the graph depth-first with an explicit stack (long journeys are
+    # deeper than the recursion limit)
     tree = Tree(f"{NODE_TYPE_ICONS.get('entry', '▶')} [bold]Journey Start[/bold]")
     visited = set()
+    stack: list[tuple[Tree, str, str | None]] = [
+        (tree, edge.get("target"), None)
+        for edge in reversed(adjacency.get(entry_node.get("id"), []))
+    ]
 
-    def add_node_to_tree(parent_tree, node_id: str, edge_label: str | None = None):
+    while stack:
+        parent_tree, node_id, edge_label = stack.pop()
         if node_id in visited:
             parent_tree.add(f"[dim]↩ (loops to {node_id})[/dim]")
-            return
+            continue
         visited.add(node_id)
 
         node = node_map.get(node_id)
         if not node:
-            return
+            continue
 
         node_type = node.get("type", "unknown")
         icon = NODE_TYPE_ICONS.get(node_type, "○")
@@ -216,16 +300,10 @@ def _build_journey_tree(journey_data: dict, show_because: bool = True) -> Tree:
 
         branch = parent_tree.add(display)
 
-        # Add children
-        child_edges = adjacency.get(node_id, [])
-        for edge in child_edges:
-            target = edge.get("target")
-            label = edge.get("label")  # "Yes", "No", or None
-            add_node_to_tree(branch, target, label)
-
-    # Start from entry node's children
-    for edge in adjacency.get(entry_node.get("id"), []):
-        add_node_to_tree(tree, edge.get("target"))
+        # Add children, first edge on top of the stack so order is kept
+        for edge in reversed(adjacency.get(node_id, [])):
+            # Edge label is "Yes", "No", or None
+            stack.append((branch, edge.get("target"), edge.get("label")))
 
     return tree
 
@@ -264,18 +342,22 @@ def show_journey(
     brief: bool = typer.Option(False, "--brief", "-b", help="Hide 'because' reasoning statements"),
 ):
     """Show journey details and visualization."""
-    config = load_config()
+    with timings.operation("journeys show"):
+        _show_journey(journey_id, brief)
 
+
+def _show_journey(journey_id: str, brief: bool):
     try:
-        journey = asyncio.run(_fetch_journey(config.gateway_url, journey_id))
-    except httpx.ConnectError:
-        console.print("[red]Error: Cannot connect to gateway.[/red]")
-        raise typer.Exit(code=1)
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
+        journey = _read(
+            "journeys.show",
+            lambda urls: _fetch_journey(urls, journey_id),
+            journey_id=journey_id,
+        )
+    except daemon_client.OpError as e:
+        if e.status == 404:
             console.print(f"[red]Journey not found: {journey_id}[/red]")
         else:
-            console.print(f"[red]Error: Gateway returned {e.response.status_code}[/red]")
+            console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(code=1)
 
     # Journey header
@@ -320,8 +402,11 @@ def show_journey(
     # Journey flow visualization
     if journey_data:
         console.print("\n[bold]Journey Flow[/bold]")
-        tree = _build_journey_tree(journey_data, show_because=not brief)
-        console.print(tree)
+        with timings.phase("build"):
+            tree = _build_journey_tree(journey_data, show_because=not brief)
+        with timings.phase("render"):
+            console.print(tree)
+        memprof.checkpoint("journey render")
 
         # Show hint when in brief mode
         if brief:
@@ -336,3 +421,91 @@ def show_journey(
     simulation = journey.get("simulation_results")
     if simulation:
         _display_simulation_results(simulation)
+
+
+async def _refresh_jobs(client: "GatewayClient", pending: list[jobs.JourneyJob], wait: bool):
+    """Poll pending jobs concurrently, updating the ledger."""
+    import asyncio
+
+    async def refresh(job: jobs.JourneyJob):
+        try:
+            if wait:
+                await client.wait_for_journey_job(job.job_id, job.backend_url)
+            else:
+                state = await client.get_journey_job(job.job_id, job.backend_url)
+                status = state.get("status", job.status)
+                result = state.get("result") or {}
+                jobs.update_job(
+                    job.job_id,
+                    status=status,
+                    journey_id=result.get("id"),
+                    error=state.get("error"),
+                )
+        except Exception as e:
+            console.print(f"[yellow]Could not check job {job.job_id[:8]}: {e}[/yellow]")
+
+    await asyncio.gather(*(refresh(job) for job in pending))
+
+
+def list_jobs(
+    wait: bool = typer.Option(False, "--wait", "-w", help="Wait for pending jobs to finish"),
+    clear: bool = typer.Option(
+        False, "--clear", help="Remove finished, expired and day-old pending jobs"
+    ),
+):
+    """Show journey builds recorded in the local job ledger."""
+    if clear:
+        removed = jobs.clear_finished_jobs()
+        console.print(f"[dim]Removed {removed} finished jobs.[/dim]")
+        return
+
+    pending = [job for job in jobs.load_jobs() if job.is_pending]
+    if pending:
+        from terryann_cli.client import GatewayClient
+        from terryann_cli.runtime import run
+
+        config = load_config()
+        client = GatewayClient(config)
+        message = "Waiting for" if wait else "Checking"
+        console.print(f"[dim]{message} {len(pending)} pending jobs...[/dim]")
+        run(_refresh_jobs(client, pending, wait))
+
+    ledger = jobs.load_jobs()
+    if not ledger:
+        console.print("[dim]No journey jobs recorded.[/dim]")
+        return
+
+    table = Table(title="Journey Jobs", show_header=True, header_style="bold magenta")
+    table.add_column("Job", style="cyan", no_wrap=True)
+    table.add_column("Name", style="white")
+    table.add_column("Status")
+    table.add_column("Journey", style="cyan", no_wrap=True)
+    table.add_column("Submitted", style="dim")
+
+    for job in ledger:
+        status_display = {
+            "queued": "[yellow]queued[/yellow]",
+            "running": "[cyan]running[/cyan]",
+            "completed": "[green]completed[/green]",
+            "failed": "[red]failed[/red]",
+            jobs.EXPIRED: "[dim]expired[/dim]",
+        }.get(job.status, job.status)
+        table.add_row(
+            job.job_id[:8],
+            job.name,
+            status_display,
+            # In full: the gateway looks journeys up by their complete ID
+            job.journey_id or "—",
+            _format_relative_time(_parse_datetime(job.submitted_at)),
+        )
+
+    console.print(table)
+    if any(job.journey_id for job in ledger):
+        console.print("\n[dim]Run 'terryann journeys show <id>' to view a completed journey.[/dim]")
+
+
+# Registered lazily as `terryann journeys` (see main.py)
+app = typer.Typer(help="Manage journeys")
+app.command("list")(list_journeys)
+app.command("show")(show_journey)
+app.command("jobs")(list_jobs)
@@ -0,0 +1,88 @@
+"""Serve command - shared caching proxy in front of the gateway."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from terryann_cli.config import load_config, split_urls
+
+console = Console()
+
+
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind (0.0.0.0 for a team)"),
+    port: int = typer.Option(8790, "--port", "-p", help="Port to bind"),
+    upstream: Optional[str] = typer.Option(
+        None,
+        "--upstream",
+        help="Gateway URL(s), comma-separated (default: the configured gateway)",
+    ),
+    backend_upstream: Optional[str] = typer.Option(
+        None,
+        "--backend-upstream",
+        help="Backend URL(s) for journey builds, comma-separated (default: the configured backend)",
+    ),
+    cache_ttl: float = typer.Option(
+        30.0, "--cache-ttl", help="Seconds journey reads are served without revalidating"
+    ),
+    max_entries: int = typer.Option(1024, "--max-entries", help="Cached responses to keep"),
+    max_connections: int = typer.Option(
+        256, "--max-connections", help="Concurrent upstream connections (one per streamed chat)"
+    ),
+):
+    """Run a caching proxy that a team can share as its gateway URL."""
+    from terryann_cli.http_server import serve as serve_http
+    from terryann_cli.proxy import METRICS_PATH, GatewayProxy
+    from terryann_cli.runtime import on_shutdown, run
+
+    config = load_config()
+    upstreams = split_urls(upstream) if upstream else config.gateway_urls
+    backend_upstreams = split_urls(backend_upstream) if backend_upstream else config.backend_urls
+    own_ports = {f"{host}:{port}", f"localhost:{port}", f"127.0.0.1:{port}"}
+    if any(url.split("://", 1)[-1] in own_ports for url in upstreams + backend_upstreams):
+        console.print(
+            "[red]Error: The upstream is this proxy. Unset TERRYANN_GATEWAY_URL and "
+            "TERRYANN_BACKEND_URL, or pass --upstream and --backend-upstream.[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    proxy = GatewayProxy(
+        config,
+        upstreams,
+        backend_upstreams,
+        cache_ttl=cache_ttl,
+        max_entries=max_entries,
+        max_connections=max_connections,
+    )
+    on_shutdown(proxy.aclose)
+
+    async def main():
+        server = await serve_http(proxy.handle, host, port)
+        bound_port = server.sockets[0].getsockname()[1]
+        base_url = f"http://{host}:{bound_port}"
+        console.print(
+            Panel(
+                f"[green bold]Proxy listening on {base_url}[/green bold]\n\n"
+                f"[dim]Point the CLI and scripts at it:[/dim]\n"
+                f"  export TERRYANN_GATEWAY_URL={base_url}\n"
+                f"  export TERRYANN_BACKEND_URL={base_url}\n\n"
+                f"[dim]Gateway {', '.join(upstreams)} • backend "
+                f"{', '.join(backend_upstreams)} • journey reads cached "
+                f"{cache_ttl:g}s per user • metrics at {base_url}{METRICS_PATH} • "
+                "Ctrl+C to stop[/dim]",
+                title="TerryAnn Gateway Proxy",
+                border_style="cyan",
+            )
+        )
+        async with server:
+            await server.serve_forever()
+
+    try:
+        run(main())
+    except KeyboardInterrupt:
+        console.print("[dim]Proxy stopped.[/dim]")
+    except OSError as e:
+        console.print(f"[red]Error: Cannot listen on {host}:{port}: {e}[/red]")
+        raise typer.Exit(code=1)
@@ -0,0 +1,108 @@
+"""Stats command - latency percentiles from the persistent request history."""
+
+import time
+from datetime import datetime
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from terryann_cli.breaker import percentile
+from terryann_cli.config import load_config
+from terryann_cli.history import HISTORY_FILE, HistoryRecord, LatencyHistory
+from terryann_cli.timings import format_duration
+
+console = Console()
+
+# Upper bounds (seconds) of the histogram buckets; the last bucket is open
+HISTOGRAM_BOUNDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SPARK_CHARS = " ▁▂▃▄▅▆▇█"
+
+
+def _histogram(durations: list[float]) -> str:
+    """One character per latency bucket, scaled to the fullest bucket."""
+    counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+    for duration in durations:
+        bucket = 0
+        while bucket < len(HISTOGRAM_BOUNDS) and duration > HISTOGRAM_BOUNDS[bucket]:
+            bucket += 1
+        counts[bucket] += 1
+    peak = max(counts) or 1
+    levels = len(SPARK_CHARS) - 1
+    return "".join(
+        SPARK_CHARS[max(1, round(count / peak * levels))] if count else "·" for count in counts
+    )
+
+
+def _add_row(table: Table, label: str, records: list[HistoryRecord]) -> None:
+    durations = [r.duration for r in records if r.ok]
+    errors = len(records) - len(durations)
+    table.add_row(
+        label,
+        f"{len(records):,}",
+        f"[red]{errors / len(records):.1%}[/red]" if errors else "0",
+        format_duration(percentile(durations, 50)),
+        format_duration(percentile(durations, 90)),
+        format_duration(percentile(durations, 99)),
+        f"[cyan]{_histogram(durations)}[/cyan]",
+    )
+
+
+def _new_table(title: str, first_column: str) -> Table:
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    table.add_column(first_column, style="cyan", overflow="fold")
+    table.add_column("Requests", justify="right", no_wrap=True)
+    table.add_column("Errors", justify="right", no_wrap=True)
+    table.add_column("p50", justify="right", no_wrap=True)
+    table.add_column("p90", justify="right", no_wrap=True)
+    table.add_column("p99", justify="right", no_wrap=True)
+    table.add_column("10ms…30s+", no_wrap=True)
+    return table
+
+
+def stats(
+    days: int = typer.Option(7, "--days", "-d", help="Only include the last N days"),
+    endpoint: Optional[str] = typer.Option(
+        None, "--endpoint", "-e", help="Only endpoints containing this text (e.g. journeys)"
+    ),
+):
+    """Show latency percentiles of past gateway and backend calls."""
+    config = load_config()
+    history = LatencyHistory(capacity=config.history_max_records)
+    since = time.time() - days * 86400
+    records = [r for r in history.read() if r.timestamp >= since]
+    if endpoint:
+        records = [r for r in records if endpoint.lower() in r.endpoint.lower()]
+
+    if not records:
+        console.print("[yellow]No requests recorded yet.[/yellow]")
+        if not config.history_enabled:
+            console.print("[dim]History is disabled ([history] enabled = false).[/dim]")
+        else:
+            console.print(f"[dim]History file: {HISTORY_FILE}[/dim]")
+        return
+
+    by_endpoint: dict[str, list[HistoryRecord]] = {}
+    by_day: dict[str, list[HistoryRecord]] = {}
+    for record in records:
+        by_endpoint.setdefault(record.endpoint, []).append(record)
+        day = datetime.fromtimestamp(record.timestamp).strftime("%Y-%m-%d")
+        by_day.setdefault(day, []).append(record)
+
+    table = _new_table("Latency by Endpoint", "Endpoint")
+    for name in sorted(by_endpoint, key=lambda name: -len(by_endpoint[name])):
+        _add_row(table, name, by_endpoint[name])
+    console.print(table)
+
+    table = _new_table("Latency by Day", "Day")
+    for day in sorted(by_day):
+        _add_row(table, day, by_day[day])
+    console.print(table)
+
+    first = datetime.fromtimestamp(records[0].timestamp)
+    console.print(
+        f"[dim]{len(records):,} requests since {first:%Y-%m-%d %H:%M} • "
+        f"percentiles over successful responses • "
+        f"keeping the last {config.history_max_records:,} in {HISTORY_FILE}[/dim]"
+    )
@@ -1,27 +1,135 @@
 """Status command - gateway health check."""
 
-import asyncio
+from urllib.parse import urlsplit
 
 import httpx
 import typer
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
+from terryann_cli.auth import SUPABASE_ANON_KEY, SUPABASE_URL
 from terryann_cli.client import GatewayClient
-from terryann_cli.config import load_config
+from terryann_cli.config import Config, load_config
+from terryann_cli.probe import ProbeResult, ProbeSample, ProbeTarget, probe_targets
+from terryann_cli.runtime import entry_point
+from terryann_cli.timings import format_duration
 
 console = Console()
 
+HELP_PAGE_URL = "https://terryann.ai/help?surface=cli"
 
-def status():
+
+def _deep_targets(config: Config) -> list[ProbeTarget]:
+    """Every service the CLI talks to."""
+    targets = [
+        ProbeTarget("Gateway", f"{url.rstrip('/')}/health", critical=True)
+        for url in config.gateway_urls
+    ]
+    targets += [
+        ProbeTarget("Backend", f"{url.rstrip('/')}/health") for url in config.backend_urls
+    ]
+    targets.append(
+        ProbeTarget(
+            "Supabase auth",
+            f"{SUPABASE_URL.rstrip('/')}/auth/v1/health",
+            headers={"apikey": SUPABASE_ANON_KEY},
+        )
+    )
+    targets.append(ProbeTarget("Help pages", HELP_PAGE_URL))
+    return targets
+
+
+def _print_deep_report(results: list[ProbeResult], samples: int) -> None:
+    """Print one row per probed endpoint."""
+    table = Table(title="Service Health", show_header=True, header_style="bold magenta")
+    table.add_column("Service", style="cyan", no_wrap=True)
+    table.add_column("Host", style="dim", overflow="fold")
+    table.add_column("OK", justify="right", no_wrap=True)
+    table.add_column("Connect", justify="right", no_wrap=True)
+    table.add_column("TLS", justify="right", no_wrap=True)
+    table.add_column("TTFB", justify="right", no_wrap=True)
+    table.add_column("Total p50", justify="right", no_wrap=True)
+    table.add_column("Max", justify="right", no_wrap=True)
+
+    for result in results:
+        successes = result.successes
+        if not result.samples:
+            ok = "[yellow]skipped[/yellow]"
+        elif len(successes) == samples:
+            ok = f"[green]{len(successes)}/{samples}[/green]"
+        else:
+            ok = f"[{'yellow' if successes else 'red'}]{len(successes)}/{samples}[/]"
+        table.add_row(
+            result.target.service,
+            urlsplit(result.target.url).netloc,
+            ok,
+            format_duration(result.percentile("connect", 50)),
+            format_duration(result.percentile("tls", 50)),
+            format_duration(result.percentile("ttfb", 50)),
+            format_duration(result.percentile("total", 50)),
+            format_duration(result.percentile("total", 100)),
+        )
+    console.print(table)
+    console.print("[dim]Connect includes DNS; timings are medians of successful samples.[/dim]")
+
+    for result in results:
+        error = result.last_error()
+        if error:
+            console.print(
+                f"[red]{result.target.service}[/red] [dim]{result.target.url}:[/dim] {error}"
+            )
+
+
+async def _deep_status(config: Config, samples: int, budget: float) -> None:
+    """Probe every service concurrently and report connection timings."""
+    targets = _deep_targets(config)
+    total = len(targets) * samples
+    console.print(
+        f"[dim]Probing {len(targets)} endpoints × {samples} samples "
+        f"(budget {budget:g}s)...[/dim]"
+    )
+
+    with console.status("Probing...") as spinner:
+        done = 0
+
+        def on_sample(result: ProbeResult, sample: ProbeSample):
+            nonlocal done
+            done += 1
+            spinner.update(f"Probing... {done}/{total} samples")
+
+        results = await probe_targets(targets, samples, budget, on_sample=on_sample)
+
+    _print_deep_report(results, samples)
+    if not any(result.healthy for result in results if result.target.critical):
+        raise typer.Exit(code=1)
+
+
+@entry_point
+async def status(
+    deep: bool = typer.Option(
+        False, "--deep", help="Probe gateway, backend, auth and help pages with timings"
+    ),
+    samples: int = typer.Option(3, "--samples", "-n", help="Samples per endpoint (--deep)"),
+    budget: float = typer.Option(
+        10.0, "--timeout", help="Seconds the whole deep probe may take (--deep)"
+    ),
+):
     """Check TerryAnn gateway health status."""
     config = load_config()
+    if deep:
+        if samples < 1 or budget <= 0:
+            console.print("[red]Error: --samples and --timeout must be positive.[/red]")
+            raise typer.Exit(code=1)
+        await _deep_status(config, samples, budget)
+        return
+
     client = GatewayClient(config)
 
     console.print(f"[dim]Checking gateway at {config.gateway_url}...[/dim]")
 
     try:
-        result = asyncio.run(client.health_check())
+        result = await client.health_check()
         console.print(
             Panel(
                 f"[green bold]Gateway is healthy[/green bold]\n\n"
@@ -3,7 +3,7 @@
 import os
 import sys
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -12,6 +12,8 @@ else:
 
 
 DEFAULT_GATEWAY_URL = "https://terryann-core-production.up.railway.app"
+# Backend URL for direct calls (bypasses gateway for long-running operations)
+DEFAULT_BACKEND_URL = "https://synthwell-prototype-production.up.railway.app"
 CONFIG_DIR = Path.home() / ".terryann"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
@@ -21,25 +23,171 @@ class Config:
     """TerryAnn CLI configuration."""
 
     gateway_url: str = DEFAULT_GATEWAY_URL
+    backend_url: str = DEFAULT_BACKEND_URL
+
+    # All endpoints per service, primary first. Reads are hedged across
+    # them and calls go to the fastest healthy one.
+    gateway_urls: list[str] = field(default_factory=list)
+    backend_urls: list[str] = field(default_factory=list)
+
+    # Submit-and-poll journey creation, falls back to a blocking call
+    # when the backend has no job endpoints
+    journey_jobs: bool = True
+
+    # Stream chat responses as they are generated ([chat] stream)
+    stream_responses: bool = True
+
+    # Shared HTTP connection pool ([http] section of config.toml)
+    http2: bool = True
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    max_requests_per_host: int = 8
+    # Gzip JSON request bodies at least this large (server must accept
+    # Content-Encoding: gzip, so off by default)
+    compress_requests: bool = False
+    compress_min_bytes: int = 16384
+
+    # Derive per-endpoint timeouts from observed latency ([http] adaptive_timeouts)
+    adaptive_timeouts: bool = True
+    # Send a duplicate idempotent read to a second endpoint if the first
+    # hasn't answered by its p95 ([http] hedge_requests)
+    hedge_requests: bool = True
+
+    # Fail fast after repeated failures ([circuit_breaker] section)
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+
+    # Record request latencies in ~/.terryann/latency_history.bin for
+    # `terryann stats` ([history] section: enabled, max_records)
+    history_enabled: bool = True
+    history_max_records: int = 20000
+
+    # Logging ([logging] section): a JSON-lines file sink and its level,
+    # per-module levels ([logging.levels]) and sampling rates for
+    # high-frequency loggers ([logging.sample])
+    log_file: str = ""
+    log_level: str = "DEBUG"
+    log_levels: dict[str, str] = field(default_factory=dict)
+    log_sample_rates: dict[str, float] = field(default_factory=dict)
+
+    # Run the event loop on uvloop when it is installed ([runtime] uvloop)
+    uvloop: bool = True
+
+    # Background daemon ([daemon] section): whether commands use a
+    # running `terryann daemon`, how long it lives without requests and
+    # how long it serves journey reads from memory
+    daemon_enabled: bool = True
+    daemon_idle_timeout: float = 1800.0
+    daemon_cache_ttl: float = 10.0
+
+    # Retry policy for transient failures ([retry] section of config.toml)
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 8.0
+    retry_budget: float = 60.0
+    retry_respect_retry_after: bool = True
+
+    def __post_init__(self):
+        if not self.gateway_urls:
+            self.gateway_urls = [self.gateway_url]
+        if not self.backend_urls:
+            self.backend_urls = [self.backend_url]
+
+
+def split_urls(value: str) -> list[str]:
+    """Split a comma-separated endpoint list, dropping blanks and trailing slashes."""
+    return [url.strip().rstrip("/") for url in value.split(",") if url.strip()]
+
+
+def _url_list(env_var: str, section: dict, default: str) -> list[str]:
+    """Read a service's endpoint list.
+
+    The env var may hold several comma-separated URLs. The config section
+    may set `url` (single endpoint) or `urls` (list, primary first).
+    """
+    env_value = os.environ.get(env_var)
+    if env_value:
+        return split_urls(env_value)
+    if section.get("urls"):
+        urls = list(section["urls"])
+    else:
+        urls = [section.get("url", default)]
+    return [url.rstrip("/") for url in urls if url]
 
 
 def load_config() -> Config:
     """Load configuration from env var or config file.
 
     Priority:
-    1. TERRYANN_GATEWAY_URL environment variable
+    1. TERRYANN_GATEWAY_URL / TERRYANN_BACKEND_URL environment variables
+       (comma-separated for several endpoints)
     2. ~/.terryann/config.toml
     3. Default value
     """
-    gateway_url = DEFAULT_GATEWAY_URL
+    data: dict = {}
 
     # Try config file first
     if CONFIG_FILE.exists():
         with open(CONFIG_FILE, "rb") as f:
             data = tomllib.load(f)
-            gateway_url = data.get("gateway", {}).get("url", DEFAULT_GATEWAY_URL)
 
-    # Env var takes precedence
-    gateway_url = os.environ.get("TERRYANN_GATEWAY_URL", gateway_url)
+    # Env vars take precedence
+    backend = data.get("backend", {})
+    gateway_urls = _url_list("TERRYANN_GATEWAY_URL", data.get("gateway", {}), DEFAULT_GATEWAY_URL)
+    backend_urls = _url_list("TERRYANN_BACKEND_URL", backend, DEFAULT_BACKEND_URL)
+
+    chat = data.get("chat", {})
+    http = data.get("http", {})
+    retry = data.get("retry", {})
+    breaker = data.get("circuit_breaker", {})
+    history = data.get("history", {})
+    logs = data.get("logging", {})
+    daemon = data.get("daemon", {})
+    runtime = data.get("runtime", {})
+    defaults = Config()
 
-    return Config(gateway_url=gateway_url)
+    return Config(
+        gateway_url=gateway_urls[0],
+        backend_url=backend_urls[0],
+        gateway_urls=gateway_urls,
+        backend_urls=backend_urls,
+        journey_jobs=bool(backend.get("jobs", defaults.journey_jobs)),
+        stream_responses=bool(chat.get("stream", defaults.stream_responses)),
+        http2=bool(http.get("http2", defaults.http2)),
+        max_connections=int(http.get("max_connections", defaults.max_connections)),
+        max_keepalive_connections=int(
+            http.get("max_keepalive_connections", defaults.max_keepalive_connections)
+        ),
+        keepalive_expiry=float(http.get("keepalive_expiry", defaults.keepalive_expiry)),
+        max_requests_per_host=int(
+            http.get("max_requests_per_host", defaults.max_requests_per_host)
+        ),
+        compress_requests=bool(http.get("compress_requests", defaults.compress_requests)),
+        compress_min_bytes=int(http.get("compress_min_bytes", defaults.compress_min_bytes)),
+        adaptive_timeouts=bool(http.get("adaptive_timeouts", defaults.adaptive_timeouts)),
+        hedge_requests=bool(http.get("hedge_requests", defaults.hedge_requests)),
+        breaker_failure_threshold=int(
+            breaker.get("failure_threshold", defaults.breaker_failure_threshold)
+        ),
+        breaker_reset_timeout=float(
+            breaker.get("reset_timeout", defaults.breaker_reset_timeout)
+        ),
+        history_enabled=bool(history.get("enabled", defaults.history_enabled)),
+        history_max_records=int(history.get("max_records", defaults.history_max_records)),
+        log_file=str(logs.get("file", defaults.log_file)),
+        log_level=str(logs.get("level", defaults.log_level)),
+        log_levels={str(k): str(v) for k, v in logs.get("levels", {}).items()},
+        log_sample_rates={str(k): float(v) for k, v in logs.get("sample", {}).items()},
+        uvloop=bool(runtime.get("uvloop", defaults.uvloop)),
+        daemon_enabled=bool(daemon.get("enabled", defaults.daemon_enabled)),
+        daemon_idle_timeout=float(daemon.get("idle_timeout", defaults.daemon_idle_timeout)),
+        daemon_cache_ttl=float(daemon.get("cache_ttl", defaults.daemon_cache_ttl)),
+        retry_max_attempts=int(retry.get("max_attempts", defaults.retry_max_attempts)),
+        retry_base_delay=float(retry.get("base_delay", defaults.retry_base_delay)),
+        retry_max_delay=float(retry.get("max_delay", defaults.retry_max_delay)),
+        retry_budget=float(retry.get("budget", defaults.retry_budget)),
+        retry_respect_retry_after=bool(
+            retry.get("respect_retry_after", defaults.retry_respect_retry_after)
+        ),
+    )
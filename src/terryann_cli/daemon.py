@@ -0,0 +1,210 @@
+"""Per-user background daemon (`terryann daemon start`).
+
+Every CLI invocation is a new process that re-imports the package, reads
+config and credentials and opens new TLS connections. The daemon keeps
+those warm for short commands: it listens on ~/.terryann/daemon.sock,
+runs journey reads through its long-lived HTTP pool, serves repeated
+reads from memory for [daemon] cache_ttl seconds and refreshes the
+stored token ahead of expiry, so client processes never wait on a
+refresh. Commands talk to it through daemon_client and fall back to
+in-process execution when it isn't running.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from terryann_cli import auth, runtime
+from terryann_cli.commands.journeys import _fetch_journey, _fetch_journeys, gateway_error
+from terryann_cli.config import Config
+from terryann_cli.daemon_client import DAEMON_SOCKET, OpError
+from terryann_cli.logging import get_logger
+from terryann_cli.transport import get_pool
+
+logger = get_logger(__name__)
+
+# Keep the stored token valid for at least this long, checking this often
+# (clients refresh themselves only within auth.REFRESH_MARGIN of expiry)
+TOKEN_MIN_VALIDITY = 900
+TOKEN_CHECK_INTERVAL = 300
+# Cached reads kept in memory, oldest evicted first
+CACHE_MAX_ENTRIES = 256
+
+
+class ReadCache:
+    """Short-lived in-memory cache of op results."""
+
+    def __init__(self, ttl: float, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries: dict[str, tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result that is still fresh."""
+        entry = self.entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a result, evicting the oldest entry when full."""
+        if self.ttl <= 0:
+            return
+        self.entries.pop(key, None)
+        if len(self.entries) >= self.max_entries:
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = (time.monotonic(), value)
+
+
+class Daemon:
+    """Serves ops over the Unix socket until stopped or idle."""
+
+    def __init__(self, config: Config, socket_path: Path = DAEMON_SOCKET):
+        self.config = config
+        self.socket_path = socket_path
+        self.cache = ReadCache(config.daemon_cache_ttl)
+        self.started = time.time()
+        self.last_request = time.monotonic()
+        self.served = 0
+        self._stop: Optional[asyncio.Event] = None
+        self._ops: dict[str, Callable[..., Awaitable[Any]]] = {
+            "ping": self._ping,
+            "journeys.list": self._journeys_list,
+            "journeys.show": self._journeys_show,
+            "shutdown": self._shutdown,
+        }
+
+    async def run(self, on_ready: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Listen on the socket until shutdown, SIGTERM or the idle timeout.
+
+        Args:
+            on_ready: Called with the socket path once the daemon is listening
+        """
+        self._stop = asyncio.Event()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # A socket left behind by a daemon that didn't shut down cleanly
+        self.socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(self._on_connection, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self._stop.set)
+
+        tasks = [
+            runtime.spawn(self._keep_token_fresh(), name="daemon token refresh"),
+            runtime.spawn(self._exit_when_idle(), name="daemon idle timeout"),
+        ]
+        logger.info("Daemon listening on %s (pid %d)", self.socket_path, os.getpid())
+        if on_ready:
+            on_ready(str(self.socket_path))
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.socket_path.unlink(missing_ok=True)
+            logger.info("Daemon stopped after %d requests", self.served)
+
+    async def _on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                reply = await self._dispatch(line)
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> dict[str, Any]:
+        """Run one request line and build its reply."""
+        self.last_request = time.monotonic()
+        self.served += 1
+        try:
+            request = json.loads(line)
+            op = request["op"]
+            handler = self._ops[op]
+            args = dict(request.get("args") or {})
+        except (ValueError, KeyError, TypeError):
+            return {"ok": False, "error": {"message": "Bad daemon request"}}
+
+        started = time.perf_counter()
+        try:
+            result = await handler(**args)
+        except Exception as e:
+            error = e if isinstance(e, OpError) else gateway_error(e)
+            if error is None:
+                logger.warning("Daemon op %s failed: %s", op, e)
+                error = OpError(f"{type(e).__name__}: {e}")
+            return {"ok": False, "error": {"message": str(error), "status": error.status}}
+        logger.debug("Daemon op %s in %.0fms", op, (time.perf_counter() - started) * 1000)
+        return {"ok": True, "result": result}
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve a read from memory, or fetch and remember it."""
+        result = self.cache.get(key)
+        if result is None:
+            # Concurrent identical reads already share one request in the pool
+            result = await fetch()
+            self.cache.put(key, result)
+        return result
+
+    async def _journeys_list(self, gateway_urls: list[str], limit: int = 20) -> dict:
+        return await self._cached(
+            f"journeys.list {gateway_urls} {limit}",
+            lambda: _fetch_journeys(gateway_urls, limit),
+        )
+
+    async def _journeys_show(self, gateway_urls: list[str], journey_id: str) -> dict:
+        return await self._cached(
+            f"journeys.show {gateway_urls} {journey_id}",
+            lambda: _fetch_journey(gateway_urls, journey_id),
+        )
+
+    async def _ping(self) -> dict[str, Any]:
+        creds = auth.load_credentials()
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started,
+            "served": self.served,
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "cache_entries": len(self.cache.entries),
+            "upstream_requests": get_pool().totals["requests"],
+            "user": creds.email if creds else None,
+            "token_expires_at": creds.expires_at.isoformat() if creds else None,
+        }
+
+    async def _shutdown(self) -> dict[str, Any]:
+        # Stop after the reply has gone out
+        asyncio.get_running_loop().call_later(0.1, self._stop.set)
+        return {"pid": os.getpid()}
+
+    async def _keep_token_fresh(self) -> None:
+        while True:
+            try:
+                await auth.ensure_fresh_token(min_validity=TOKEN_MIN_VALIDITY)
+            except Exception as e:
+                logger.debug("Background token refresh failed: %s", e)
+            await asyncio.sleep(TOKEN_CHECK_INTERVAL)
+
+    async def _exit_when_idle(self) -> None:
+        timeout = self.config.daemon_idle_timeout
+        if timeout <= 0:
+            return
+        while True:
+            idle = time.monotonic() - self.last_request
+            if idle >= timeout:
+                logger.info("Daemon idle for %.0fs, exiting", idle)
+                self._stop.set()
+                return
+            await asyncio.sleep(timeout - idle)
@@ -0,0 +1,87 @@
+"""Client side of the background daemon (`terryann daemon`).
+
+Short commands first hand their request to a running daemon over
+~/.terryann/daemon.sock; it answers from a warm connection pool and an
+in-memory cache. Only the standard library is used here, so when no
+daemon is running the check costs one failed connect() and the caller
+does the work in-process.
+
+The protocol is one JSON object per line. A request is
+{"op": ..., "args": {...}}, the reply {"ok": true, "result": ...} or
+{"ok": false, "error": {"message": ..., "status": ...}}.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Optional
+
+from terryann_cli.config import CONFIG_DIR
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+DAEMON_SOCKET = CONFIG_DIR / "daemon.sock"
+# Set to skip the daemon (e.g. to compare against in-process runs)
+NO_DAEMON_ENV = "TERRYANN_NO_DAEMON"
+
+CONNECT_TIMEOUT = 0.5
+# Upper bound for one op; the daemon applies the usual request timeouts
+REPLY_TIMEOUT = 120.0
+
+
+class DaemonUnavailableError(Exception):
+    """No daemon answered; do the work in-process."""
+
+
+class OpError(Exception):
+    """An op failed with an error to show the user."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of the failed upstream request, if there was one
+        self.status = status
+
+
+def call(op: str, timeout: float = REPLY_TIMEOUT, **args: Any) -> Any:
+    """
+    Run an op in the daemon.
+
+    Args:
+        op: Operation name (e.g. "journeys.list")
+        timeout: Seconds to wait for the reply
+        **args: JSON-serializable op arguments
+
+    Returns:
+        The op's result
+
+    Raises:
+        DaemonUnavailableError: If no daemon is running or it didn't answer
+        OpError: If the daemon ran the op and it failed
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailableError("daemon disabled")
+    if not DAEMON_SOCKET.exists():
+        raise DaemonUnavailableError("no daemon socket")
+
+    request = json.dumps({"op": op, "args": args}).encode("utf-8") + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(DAEMON_SOCKET))
+            sock.settimeout(timeout)
+            sock.sendall(request)
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError as e:
+        logger.debug("Daemon not reachable, running %s in-process: %s", op, e)
+        raise DaemonUnavailableError(str(e)) from e
+
+    if not line:
+        raise DaemonUnavailableError("daemon closed the connection")
+    reply = json.loads(line)
+    if not reply.get("ok"):
+        error = reply.get("error") or {}
+        raise OpError(error.get("message", "Daemon error"), error.get("status"))
+    logger.debug("%s served by daemon", op)
+    return reply.get("result")
@@ -0,0 +1,462 @@
+"""Local stand-in for the TerryAnn gateway and backend.
+
+Serves the endpoints the CLI talks to (health, chat messages, journey list
+and detail, journey creation and build jobs) from generated data, with
+knobs for latency, error rate, payload size and journey graph size. Point
+the CLI at it with TERRYANN_GATEWAY_URL / TERRYANN_BACKEND_URL to work on
+performance and resilience without the production services.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from terryann_cli.constants import CAMPAIGN_TYPES, CHANNEL_ICONS
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PORT = 8765
+
+WORDS = (
+    "medicare members enrollment plan benefits outreach campaign county seniors "
+    "coverage advantage journey touchpoint mailer call reminder eligibility "
+    "network pharmacy dental vision premium broker agent follow-up retention"
+).split()
+CHANNELS = [channel for channel in CHANNEL_ICONS if channel != "PHONE"]
+
+
+@dataclass
+class DevServerSettings:
+    """Knobs for the stand-in server."""
+
+    # Per-request latency distribution (see parse_latency)
+    latency: str = "lognormal:0.05,0.5"
+    # Share of requests (other than /health) answered with error_status
+    error_rate: float = 0.0
+    error_status: int = 503
+    # Extra kilobytes of text added to chat responses
+    payload_kb: int = 0
+    # Words in a chat reply, streamed one token per token_delay seconds
+    reply_words: int = 60
+    token_delay: float = 0.02
+    # Nodes per generated journey graph and journeys in the list
+    nodes: int = 40
+    journeys: int = 25
+    # Seconds a journey build takes (create-v2 and jobs)
+    build_time: float = 2.0
+    # Serve /journey/flowchart/jobs (off exercises the blocking fallback)
+    jobs: bool = True
+    # Answer text/event-stream requests with SSE (off returns JSON)
+    stream: bool = True
+    seed: Optional[int] = None
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse a latency distribution spec into a sampler.
+
+    Supported specs (seconds):
+        fixed:0.05
+        uniform:0.02,0.2
+        normal:0.1,0.03          (mean, stddev)
+        lognormal:0.05,0.5       (median, sigma)
+
+    Args:
+        spec: Distribution spec
+
+    Returns:
+        Function drawing one latency (never negative) from a Random
+
+    Raises:
+        ValueError: If the spec is not understood
+    """
+    kind, _, raw_args = spec.partition(":")
+    try:
+        args = [float(value) for value in raw_args.split(",") if value.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}") from None
+
+    if kind == "fixed" and len(args) == 1:
+        return lambda rng: args[0]
+    if kind == "uniform" and len(args) == 2:
+        return lambda rng: rng.uniform(args[0], args[1])
+    if kind == "normal" and len(args) == 2:
+        return lambda rng: max(0.0, rng.gauss(args[0], args[1]))
+    if kind == "lognormal" and len(args) == 2 and args[0] > 0:
+        # median = exp(mu)
+        mu = math.log(args[0])
+        return lambda rng: rng.lognormvariate(mu, args[1])
+    raise ValueError(f"Invalid latency spec: {spec}")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[:1].upper() + text[1:] + "."
+
+
+def generate_journey(
+    node_count: int,
+    rng: random.Random,
+    name: str = "Dev Journey",
+) -> dict[str, Any]:
+    """
+    Generate journey flow data with roughly node_count nodes.
+
+    The graph is a main path of touchpoints and waits from an entry node to
+    an exit, with a decision every few steps whose "Yes" branch ends in a
+    conversion status.
+
+    Args:
+        node_count: Target number of nodes (at least 3)
+        rng: Random source, for reproducible graphs
+        name: Journey name
+
+    Returns:
+        Journey data dict with name, nodes, edges and touchpoints
+    """
+    nodes: list[dict[str, Any]] = [{"id": "n0", "type": "entry", "label": "Journey Start"}]
+    edges: list[dict[str, Any]] = []
+    touchpoints: list[dict[str, Any]] = []
+    previous = "n0"
+    pending_label: Optional[str] = None
+
+    def add(node: dict[str, Any]) -> str:
+        node_id = f"n{len(nodes)}"
+        nodes.append({"id": node_id, **node})
+        return node_id
+
+    def link(source: str, target: str, label: Optional[str] = None) -> None:
+        edge = {"id": f"e{len(edges)}", "source": source, "target": target}
+        if label:
+            edge["label"] = label
+        edges.append(edge)
+
+    step = 0
+    while len(nodes) < max(3, node_count) - 1:
+        step += 1
+        if step % 6 == 0 and len(nodes) < node_count - 3:
+            node_id = add({
+                "type": "decision",
+                "label": "Engaged?",
+                "decision_question": "Did the member respond to the last touchpoint?",
+            })
+            link(previous, node_id, pending_label)
+            converted = add({"type": "status", "label": "Enrolled", "status_type": "success"})
+            link(node_id, converted, "Yes")
+            previous, pending_label = node_id, "No"
+        elif step % 2 == 0:
+            node_id = add(
+                {"type": "wait", "label": "Wait", "wait_days": rng.choice([2, 3, 5, 7, 14])}
+            )
+            link(previous, node_id, pending_label)
+            previous, pending_label = node_id, None
+        else:
+            channel = rng.choice(CHANNELS)
+            node_id = add({
+                "type": "touchpoint",
+                "label": f"{channel.replace('_', ' ').title()} {step}",
+                "channel": channel,
+                "because": {"claim": _sentence(rng, rng.randint(8, 24))},
+            })
+            touchpoints.append({"id": node_id, "channel": channel})
+            link(previous, node_id, pending_label)
+            previous, pending_label = node_id, None
+
+    exit_id = add({"type": "exit", "label": "Journey End"})
+    link(previous, exit_id, pending_label)
+
+    return {
+        "name": name,
+        "nodes": nodes,
+        "edges": edges,
+        "touchpoints": touchpoints,
+        "methodology_notes": "Generated by the TerryAnn dev server.",
+    }
+
+
+@dataclass
+class _Journey:
+    """A journey held by the stand-in server."""
+    id: str
+    name: str
+    campaign_type: str
+    location: str
+    created_at: str
+    node_count: int
+    seed: int
+    status: str = "draft"
+    # Encoded detail response and its ETag, built on first request
+    body: Optional[bytes] = None
+    etag: Optional[str] = None
+
+    def summary(self) -> dict[str, Any]:
+        touchpoints = [{"id": f"tp{i}"} for i in range(self.node_count // 3)]
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "created_at": self.created_at,
+            "cohort_config": {"location": self.location, "campaign_type": self.campaign_type},
+            "journey_data": {"name": self.name, "touchpoints": touchpoints},
+        }
+
+    def detail(self) -> tuple[bytes, str]:
+        if self.body is None:
+            journey_data = generate_journey(self.node_count, random.Random(self.seed), self.name)
+            journey = {**self.summary(), "journey_data": journey_data}
+            self.body = json.dumps(journey).encode("utf-8")
+            self.etag = f'"{hashlib.sha1(self.body).hexdigest()[:16]}"'
+        return self.body, self.etag
+
+
+class DevServer:
+    """Request handler and in-memory state of the stand-in server."""
+
+    def __init__(self, settings: DevServerSettings):
+        self.settings = settings
+        self.rng = random.Random(settings.seed)
+        self.sample_latency = parse_latency(settings.latency)
+        self.journeys: list[_Journey] = []
+        self.jobs: dict[str, dict[str, Any]] = {}
+        # Idempotency-Key -> (status, payload) of the first response
+        self.idempotent: dict[str, tuple[int, dict[str, Any]]] = {}
+        self.requests = 0
+        self._tasks: set[asyncio.Task] = set()
+
+        now = datetime.now(timezone.utc)
+        for i in range(settings.journeys):
+            created = now - timedelta(hours=i * 7 + self.rng.randint(0, 6))
+            self._add_journey(
+                name=f"Dev Journey {settings.journeys - i}",
+                campaign_type=self.rng.choice(CAMPAIGN_TYPES)[0],
+                location=f"ZIP {self.rng.randint(10000, 99999)}",
+                created_at=created,
+            )
+
+    def _add_journey(
+        self, name: str, campaign_type: str, location: str, created_at: datetime
+    ) -> _Journey:
+        journey = _Journey(
+            id=str(uuid.UUID(int=self.rng.getrandbits(128), version=4)),
+            name=name,
+            campaign_type=campaign_type,
+            location=location,
+            created_at=created_at.isoformat().replace("+00:00", "Z"),
+            node_count=self.settings.nodes,
+            seed=self.rng.getrandbits(32),
+        )
+        self.journeys.append(journey)
+        self.journeys.sort(key=lambda j: j.created_at, reverse=True)
+        return journey
+
+    def _padding(self) -> Optional[str]:
+        if not self.settings.payload_kb:
+            return None
+        target = self.settings.payload_kb * 1024
+        words: list[str] = []
+        size = 0
+        while size < target:
+            word = self.rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        return " ".join(words)
+
+    async def handle(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        """Route one request, after the simulated latency and error injection."""
+        self.requests += 1
+        started = time.monotonic()
+        await asyncio.sleep(self.sample_latency(self.rng))
+
+        if request.path != "/health" and self.rng.random() < self.settings.error_rate:
+            await response.send_json(
+                self.settings.error_status,
+                {"detail": "Injected error"},
+                {"Retry-After": "1"} if self.settings.error_status in (429, 503) else None,
+            )
+        else:
+            await self._route(request, response)
+
+        logger.debug(
+            "%s %s handled in %.0fms",
+            request.method,
+            request.target,
+            (time.monotonic() - started) * 1000,
+        )
+
+    async def _route(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        path = request.path.rstrip("/")
+        method = request.method
+
+        if path == "/health":
+            await response.send_json(200, {"status": "ok", "service": "terryann-dev-server"})
+        elif path == "/gateway/message" and method == "POST":
+            await self._message(request, response)
+        elif path == "/gateway/journeys" and method == "GET":
+            await self._list_journeys(request, response)
+        elif path.startswith("/gateway/journeys/") and method == "GET":
+            await self._get_journey(request, response, path.rsplit("/", 1)[1])
+        elif path == "/journey/flowchart/create-v2" and method == "POST":
+            await self._idempotent(request, response, self._create_journey)
+        elif path == "/journey/flowchart/jobs" and method == "POST" and self.settings.jobs:
+            await self._idempotent(request, response, self._submit_job)
+        elif path.startswith("/journey/flowchart/jobs/") and method == "GET" and self.settings.jobs:
+            job = self.jobs.get(path.rsplit("/", 1)[1])
+            if job is None:
+                await response.send_json(404, {"detail": "Job not found"})
+            else:
+                await response.send_json(200, job)
+        else:
+            await response.send_json(404, {"detail": f"Not found: {method} {path}"})
+
+    async def _idempotent(self, request: HTTPRequest, response: HTTPResponseWriter, create) -> None:
+        """Replay the first response for a repeated Idempotency-Key."""
+        key = request.headers.get("idempotency-key")
+        if key and key in self.idempotent:
+            status, payload = self.idempotent[key]
+            await response.send_json(status, payload, {"Idempotent-Replayed": "true"})
+            return
+        status, payload = await create(request.json() or {})
+        if key:
+            self.idempotent[key] = (status, payload)
+        await response.send_json(status, payload)
+
+    async def _message(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        body = request.json() or {}
+        message = str(body.get("message", ""))
+        lowered = message.lower()
+
+        metadata: dict[str, Any] = {}
+        if "journey" in lowered and any(word in lowered for word in ("create", "build", "new")):
+            reply = "Sure - I'll build an AEP acquisition journey for ZIP 33101."
+            metadata["pending_action"] = {
+                "type": "confirm_journey",
+                "campaign_type": "AEP_ACQUISITION",
+                "location_info": {
+                    "location_type": "zip",
+                    "location_value": "33101",
+                    "zip_codes": ["33101"],
+                },
+                "user_id": "dev-user",
+            }
+        else:
+            reply = _sentence(self.rng, self.settings.reply_words)
+        padding = self._padding()
+        if padding:
+            metadata["context"] = padding
+
+        result = {"response": reply, "session_id": body.get("session_id"), "metadata": metadata}
+        if not (self.settings.stream and request.accepts("text/event-stream")):
+            await response.send_json(200, result)
+            return
+
+        await response.start_chunked(
+            200, {"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        words = reply.split(" ")
+        for i, word in enumerate(words):
+            token = word if i == len(words) - 1 else word + " "
+            await response.write_chunk(
+                f"event: token\ndata: {json.dumps({'text': token})}\n\n".encode("utf-8")
+            )
+            await asyncio.sleep(self.settings.token_delay)
+        if metadata:
+            await response.write_chunk(
+                f"event: metadata\ndata: {json.dumps(metadata)}\n\n".encode("utf-8")
+            )
+        await response.write_chunk(f"event: done\ndata: {json.dumps(result)}\n\n".encode("utf-8"))
+        await response.end_chunked()
+
+    async def _list_journeys(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        try:
+            limit = int(request.query.get("limit", 20))
+        except ValueError:
+            limit = 20
+        journeys = [j.summary() for j in self.journeys[:limit]]
+        body = json.dumps({"journeys": journeys, "count": len(self.journeys)}).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        await self._send_cacheable(request, response, body, etag)
+
+    async def _get_journey(
+        self, request: HTTPRequest, response: HTTPResponseWriter, journey_id: str
+    ) -> None:
+        # Accept short IDs, like the real gateway
+        journey = next((j for j in self.journeys if j.id.startswith(journey_id)), None)
+        if journey is None:
+            await response.send_json(404, {"detail": "Journey not found"})
+            return
+        body, etag = journey.detail()
+        await self._send_cacheable(request, response, body, etag)
+
+    async def _send_cacheable(
+        self, request: HTTPRequest, response: HTTPResponseWriter, body: bytes, etag: str
+    ) -> None:
+        """Send a JSON body with an ETag, or 304 if the client has it already."""
+        if request.headers.get("if-none-match") == etag:
+            await response.send(304, headers={"ETag": etag})
+        else:
+            await response.send(200, body, {"Content-Type": "application/json", "ETag": etag})
+
+    async def _build(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Build a journey from a create request (takes build_time seconds)."""
+        await asyncio.sleep(self.settings.build_time)
+        location = body.get("zip_codes") or body.get("locations") or ["33101"]
+        journey = self._add_journey(
+            name=body.get("name") or "New Journey",
+            campaign_type=body.get("campaign_type", "aep_acquisition"),
+            location=str(location[0] if isinstance(location, list) else location),
+            created_at=datetime.now(timezone.utc),
+        )
+        journey_data = json.loads(journey.detail()[0])["journey_data"]
+        return {"id": journey.id, **journey_data}
+
+    async def _create_journey(self, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        return 200, await self._build(body)
+
+    async def _submit_job(self, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        job_id = uuid.uuid4().hex
+        job: dict[str, Any] = {"job_id": job_id, "status": "queued"}
+        self.jobs[job_id] = job
+
+        async def run_job():
+            await asyncio.sleep(min(0.5, self.settings.build_time / 4))
+            job["status"] = "running"
+            job["result"] = await self._build(body)
+            job["status"] = "completed"
+
+        task = asyncio.create_task(run_job())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return 202, dict(job)
+
+
+async def run_dev_server(
+    settings: DevServerSettings,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    on_ready: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Run the stand-in server until cancelled.
+
+    Args:
+        settings: Server knobs
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+        on_ready: Called with the base URL once the server is listening
+    """
+    dev_server = DevServer(settings)
+    server = await serve(dev_server.handle, host, port)
+    bound_port = server.sockets[0].getsockname()[1]
+    if on_ready:
+        on_ready(f"http://{host}:{bound_port}")
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,207 @@
+"""Persistent latency history of gateway and backend calls.
+
+Every request made through the shared pool is appended to a fixed-size
+ring buffer in ~/.terryann/latency_history.bin, so `terryann stats` can
+report percentiles across invocations without the file ever growing past
+history_max_records slots. Records are packed binary structs: a write is
+one seek and a few hundred bytes, and readers don't have to parse JSON.
+
+Records are buffered in memory and written when the pool closes (or once
+FLUSH_EVERY have accumulated). Concurrent CLI processes serialize their
+writes with an advisory lock where the platform supports one.
+"""
+
+import os
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from terryann_cli.config import CONFIG_DIR
+from terryann_cli.logging import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are not locked
+    fcntl = None
+
+logger = get_logger(__name__)
+
+HISTORY_FILE = CONFIG_DIR / "latency_history.bin"
+
+MAGIC = b"TALH"
+VERSION = 1
+# magic, version, record size, capacity, records ever written
+_HEADER = struct.Struct("<4sHHIQ")
+HEADER_SIZE = 32
+# timestamp, duration, status, failed, bytes sent/received/decoded, host, endpoint
+_RECORD = struct.Struct("<dfHBxIII40s64s")
+
+# Buffered records written without waiting for the pool to close
+FLUSH_EVERY = 256
+
+_U32_MAX = 0xFFFFFFFF
+
+
+@dataclass
+class HistoryRecord:
+    """One request in the latency history."""
+    timestamp: float  # Unix time the request finished
+    duration: float  # seconds
+    status: int  # 0 if no response was received
+    failed: bool  # transport error (timeout, connection refused, ...)
+    bytes_sent: int
+    bytes_received: int
+    bytes_decoded: int
+    host: str
+    endpoint: str  # e.g. "GET /gateway/journeys/{id}"
+
+    def pack(self) -> bytes:
+        return _RECORD.pack(
+            self.timestamp,
+            self.duration,
+            min(self.status, 0xFFFF),
+            self.failed,
+            min(self.bytes_sent, _U32_MAX),
+            min(self.bytes_received, _U32_MAX),
+            min(self.bytes_decoded, _U32_MAX),
+            self.host.encode()[:40],
+            self.endpoint.encode()[:64],
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "HistoryRecord":
+        ts, duration, status, failed, sent, received, decoded, host, endpoint = _RECORD.unpack(data)
+        return cls(
+            timestamp=ts,
+            duration=duration,
+            status=status,
+            failed=bool(failed),
+            bytes_sent=sent,
+            bytes_received=received,
+            bytes_decoded=decoded,
+            host=host.rstrip(b"\0").decode(errors="replace"),
+            endpoint=endpoint.rstrip(b"\0").decode(errors="replace"),
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request got a non-error response."""
+        return not self.failed and 0 < self.status < 400
+
+
+class LatencyHistory:
+    """Bounded on-disk ring buffer of request records."""
+
+    def __init__(self, path: Path = HISTORY_FILE, capacity: int = 20000):
+        """
+        Initialize the history.
+
+        Args:
+            path: Ring buffer file
+            capacity: Records kept; the oldest are overwritten first
+        """
+        self.path = path
+        self.capacity = max(1, capacity)
+        self.pending: list[HistoryRecord] = []
+
+    def observe(self, record) -> None:
+        """Pool observer: buffer one finished request (a transport.RequestRecord)."""
+        self.pending.append(
+            HistoryRecord(
+                timestamp=time.time(),
+                duration=record.duration,
+                status=record.status,
+                failed=record.error is not None,
+                bytes_sent=record.bytes_sent,
+                bytes_received=record.bytes_received,
+                bytes_decoded=record.bytes_decoded,
+                host=urlsplit(record.url).netloc,
+                endpoint=record.endpoint,
+            )
+        )
+        if len(self.pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered records to the ring buffer."""
+        if not self.pending:
+            return
+        records, self.pending = self.pending, []
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+b") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                self._append(f, records)
+        except OSError as e:
+            logger.debug("Could not write latency history: %s", e)
+
+    def _append(self, f, records: list[HistoryRecord]) -> None:
+        header = _read_header(f)
+        if header is not None and header[0] == self.capacity:
+            written = header[1]
+        else:
+            # New, foreign or resized file: start over, keeping what fits
+            records = _read_records(f) + records
+            f.truncate(0)
+            written = 0
+
+        # Records that would be overwritten within this batch are skipped
+        skipped = max(0, len(records) - self.capacity)
+        written += skipped
+        for record in records[skipped:]:
+            f.seek(HEADER_SIZE + (written % self.capacity) * _RECORD.size)
+            f.write(record.pack())
+            written += 1
+
+        f.seek(0)
+        header = _HEADER.pack(MAGIC, VERSION, _RECORD.size, self.capacity, written)
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+
+    def read(self) -> list[HistoryRecord]:
+        """All records on disk, oldest first (buffered records not included)."""
+        try:
+            with open(self.path, "rb") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_SH)
+                return _read_records(f)
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.debug("Could not read latency history: %s", e)
+            return []
+
+
+def _read_header(f) -> Optional[tuple[int, int]]:
+    """(capacity, records ever written) from a file's header, or None if unusable."""
+    f.seek(0)
+    data = f.read(_HEADER.size)
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, record_size, capacity, written = _HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION or record_size != _RECORD.size or not capacity:
+        return None
+    return capacity, written
+
+
+def _read_records(f) -> list[HistoryRecord]:
+    """Records in a ring buffer file, oldest first."""
+    header = _read_header(f)
+    if header is None:
+        return []
+    capacity, written = header
+    f.seek(HEADER_SIZE)
+    data = f.read(min(written, capacity) * _RECORD.size)
+    records = [
+        HistoryRecord.unpack(data[offset:offset + _RECORD.size])
+        for offset in range(0, len(data) - _RECORD.size + 1, _RECORD.size)
+    ]
+    if written > capacity:
+        # The slot of the next write holds the oldest record
+        start = written % capacity
+        records = records[start:] + records[:start]
+    return records
@@ -0,0 +1,168 @@
+"""Conditional-request cache for journey list and detail fetches.
+
+Responses carrying an ETag or Last-Modified validator are stored under
+~/.terryann/cache/http, and the next fetch of the same resource sends
+If-None-Match / If-Modified-Since. A 304 is answered from the cached copy:
+from memory if this process has seen it, otherwise from a marshal file,
+so the JSON body is never parsed twice. Files unused for MAX_AGE, and the
+least recently used beyond MAX_ENTRIES, are pruned as new entries are written.
+"""
+
+import hashlib
+import marshal
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from terryann_cli.config import CONFIG_DIR
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+HTTP_CACHE_DIR = CONFIG_DIR / "cache" / "http"
+
+# Disk entries kept; the least recently used beyond this are pruned
+MAX_ENTRIES = 500
+# Entries not written or read for this many seconds are pruned
+MAX_AGE = 30 * 24 * 3600
+# Prune on the first write, then every this many writes
+PRUNE_EVERY = 100
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and its validators."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Any
+
+    def validators(self) -> dict[str, str]:
+        """Headers that make the next request conditional."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """On-disk store of validated response bodies, with an in-memory layer."""
+
+    def __init__(
+        self,
+        directory: Path = HTTP_CACHE_DIR,
+        max_entries: int = MAX_ENTRIES,
+        max_age: float = MAX_AGE,
+    ):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._memory: dict[str, CacheEntry] = {}
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Stable cache key for a resource (path, params, identity headers)."""
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Get the cached entry for a key, if any."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            etag, last_modified, body = marshal.loads(path.read_bytes())
+        except (EOFError, ValueError, TypeError, OSError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path.name, e)
+            return None
+        try:
+            # Still in use, so it ages from now
+            os.utime(path)
+        except OSError:
+            pass
+
+        entry = CacheEntry(etag=etag, last_modified=last_modified, body=body)
+        self._memory[key] = entry
+        return entry
+
+    def store(
+        self, key: str, etag: Optional[str], last_modified: Optional[str], body: Any
+    ) -> None:
+        """Store a response body with its validators."""
+        self._memory[key] = CacheEntry(etag=etag, last_modified=last_modified, body=body)
+        try:
+            data = marshal.dumps((etag, last_modified, body))
+        except ValueError as e:
+            logger.debug("Response body can't be cached: %s", e)
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Journey data is private to the user
+            os.chmod(self.directory, 0o700)
+            tmp_path = self._path(key).with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.debug("Could not write cache entry: %s", e)
+            return
+
+        if self._writes % PRUNE_EVERY == 0:
+            self.prune()
+        self._writes += 1
+
+    def prune(self) -> int:
+        """Delete expired entries and the least recently used beyond max_entries.
+
+        Returns:
+            Number of files removed
+        """
+        now = time.time()
+        try:
+            entries = []
+            stale = []
+            for path in self.directory.iterdir():
+                if path.suffix == ".bin":
+                    entries.append((path.stat().st_mtime, path))
+                elif path.suffix == ".tmp" and path.stat().st_mtime < now - 60:
+                    # Left behind by an interrupted write
+                    stale.append(path)
+        except OSError as e:
+            logger.debug("Could not list cache entries: %s", e)
+            return 0
+
+        entries.sort(reverse=True)
+        cutoff = now - self.max_age
+        stale.extend(
+            path
+            for index, (mtime, path) in enumerate(entries)
+            if index >= self.max_entries or mtime < cutoff
+        )
+        removed = 0
+        for path in stale:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.debug("Could not remove cache entry %s: %s", path.name, e)
+        if removed:
+            logger.debug("Pruned %d HTTP cache entries", removed)
+        return removed
+
+    def hit_ratio(self) -> Optional[float]:
+        """Share of conditional requests answered with 304."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
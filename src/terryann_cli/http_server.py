@@ -0,0 +1,266 @@
+"""Minimal asyncio HTTP/1.1 server used by the dev server and the team proxy.
+
+Supports keep-alive, Content-Length and gzip request bodies, gzip response
+compression and chunked streaming (for server-sent events). Request bodies
+(also after decompression), header counts and the time a client may take to
+send a request or leave a connection idle are bounded, so one slow or
+oversized client can't tie up the server. There is no TLS: keep it on a
+trusted network.
+"""
+
+import asyncio
+import gzip
+import json
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Don't bother compressing responses smaller than this
+GZIP_MIN_BYTES = 1024
+MAX_HEADER_LINES = 100
+# Largest request body accepted, before and after gzip decoding
+MAX_BODY_BYTES = 8 * 1024 * 1024
+# Seconds a keep-alive connection may sit idle between requests
+KEEPALIVE_TIMEOUT = 75.0
+# Seconds a client has to send the headers, and then the body, of a request
+HEADER_TIMEOUT = 10.0
+BODY_TIMEOUT = 60.0
+
+STATUS_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Content Too Large",
+    429: "Too Many Requests",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+class RequestRejectedError(Exception):
+    """A request the server refuses to read (too large, too slow or malformed)."""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+@dataclass
+class HTTPRequest:
+    """A parsed HTTP request."""
+    method: str
+    target: str
+    headers: dict[str, str]
+    body: bytes = b""
+    path: str = ""
+    query: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        parts = urlsplit(self.target)
+        self.path = parts.path
+        self.query = dict(parse_qsl(parts.query))
+
+    def json(self) -> Any:
+        """Decode the request body as JSON."""
+        return json.loads(self.body or b"null")
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "").lower() != "close"
+
+    def accepts(self, content_type: str) -> bool:
+        return content_type in self.headers.get("accept", "")
+
+
+class HTTPResponseWriter:
+    """Writes one response to a connection, buffered or chunked."""
+
+    def __init__(self, request: HTTPRequest, writer: asyncio.StreamWriter):
+        self.request = request
+        self.writer = writer
+        self.started = False
+
+    def _head(self, status: int, headers: dict[str, str]) -> bytes:
+        lines = [f"HTTP/1.1 {status} {STATUS_REASONS.get(status, 'Unknown')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def send(
+        self,
+        status: int,
+        body: bytes = b"",
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Send a complete response, gzipped if the client accepts it."""
+        headers = dict(headers or {})
+        if (
+            len(body) >= GZIP_MIN_BYTES
+            and "gzip" in self.request.headers.get("accept-encoding", "")
+        ):
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        headers["Content-Length"] = str(len(body))
+        if not self.request.keep_alive:
+            headers["Connection"] = "close"
+        self.writer.write(self._head(status, headers) + body)
+        await self.writer.drain()
+        self.started = True
+
+    async def send_json(
+        self, status: int, payload: Any, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        """Send a JSON response."""
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        await self.send(status, json.dumps(payload).encode("utf-8"), headers)
+
+    async def start_chunked(self, status: int, headers: Optional[dict[str, str]] = None) -> None:
+        """Start a chunked (streamed) response."""
+        headers = {**(headers or {}), "Transfer-Encoding": "chunked"}
+        self.writer.write(self._head(status, headers))
+        await self.writer.drain()
+        self.started = True
+
+    async def write_chunk(self, data: bytes) -> None:
+        """Write one chunk of a streamed response."""
+        if data:
+            self.writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await self.writer.drain()
+
+    async def end_chunked(self) -> None:
+        """Finish a streamed response."""
+        self.writer.write(b"0\r\n\r\n")
+        await self.writer.drain()
+
+
+Handler = Callable[[HTTPRequest, HTTPResponseWriter], Awaitable[None]]
+
+
+def _gunzip(body: bytes) -> bytes:
+    """Decode a gzip request body without inflating more than MAX_BODY_BYTES."""
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        data = decoder.decompress(body, MAX_BODY_BYTES)
+    except zlib.error as e:
+        raise RequestRejectedError(400, f"Invalid gzip body: {e}") from e
+    if decoder.unconsumed_tail:
+        raise RequestRejectedError(413, f"Request body over {MAX_BODY_BYTES} bytes when decoded")
+    if not decoder.eof:
+        raise RequestRejectedError(400, "Truncated gzip body")
+    return data
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise RequestRejectedError(431, f"More than {MAX_HEADER_LINES} header lines")
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+    """
+    Read one request from a connection.
+
+    Returns:
+        The request, or None when the connection is closed or was idle for
+        KEEPALIVE_TIMEOUT
+
+    Raises:
+        RequestRejectedError: If the request is too large, malformed or too slow
+    """
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+    except asyncio.TimeoutError:
+        return None
+    if not request_line.strip():
+        return None
+
+    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    try:
+        headers = await asyncio.wait_for(_read_headers(reader), HEADER_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise RequestRejectedError(408, "Request headers not received in time") from None
+
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise RequestRejectedError(400, "Invalid Content-Length") from None
+    if length < 0:
+        raise RequestRejectedError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise RequestRejectedError(413, f"Request body over {MAX_BODY_BYTES} bytes")
+
+    body = b""
+    if length:
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length), BODY_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RequestRejectedError(408, "Request body not received in time") from None
+    if headers.get("content-encoding") == "gzip":
+        body = _gunzip(body)
+
+    return HTTPRequest(method=method.upper(), target=target, headers=headers, body=body)
+
+
+async def serve(handler: Handler, host: str, port: int) -> asyncio.AbstractServer:
+    """
+    Start serving requests with a handler.
+
+    Args:
+        handler: Coroutine called with each request and its response writer
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+
+    Returns:
+        The started asyncio server
+    """
+
+    async def on_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                response = HTTPResponseWriter(request, writer)
+                try:
+                    await handler(request, response)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:
+                    logger.debug("Handler failed for %s %s: %s", request.method, request.path, e)
+                    if response.started:
+                        break
+                    await response.send_json(500, {"detail": str(e)})
+                if not request.keep_alive:
+                    break
+        except RequestRejectedError as e:
+            logger.debug("Rejected request: %s", e.detail)
+            # The rest of the request is unread, so the connection can't be reused
+            closing = HTTPRequest(method="", target="/", headers={"connection": "close"})
+            try:
+                await HTTPResponseWriter(closing, writer).send_json(e.status, {"detail": e.detail})
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(on_connection, host, port)
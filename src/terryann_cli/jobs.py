@@ -0,0 +1,217 @@
+"""Local ledger of in-flight journey creation jobs.
+
+Journey builds take ~90 seconds. When the backend supports job mode, each
+submitted job is recorded in ~/.terryann/jobs.json so that its result can
+be collected with `terryann journeys jobs` after a sleep, network blip or
+CLI restart.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from terryann_cli.config import CONFIG_DIR
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+JOBS_FILE = CONFIG_DIR / "jobs.json"
+# Backends known to have no job endpoints, with when that was seen
+JOB_SUPPORT_FILE = CONFIG_DIR / "job_support.json"
+
+# Job statuses reported by the backend
+PENDING_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("completed", "failed")
+# Set locally when the backend no longer knows the job (4xx while polling)
+EXPIRED = "expired"
+# Finished jobs are dropped from the ledger this long after submission
+FINISHED_JOB_RETENTION = timedelta(days=30)
+# Pending jobs this old are assumed lost (builds take minutes, not days)
+ABANDONED_AFTER = timedelta(days=1)
+# How long a backend without job endpoints is remembered before retrying
+UNSUPPORTED_RECHECK = timedelta(days=1)
+
+
+@dataclass
+class JourneyJob:
+    """A journey creation job recorded in the local ledger."""
+    job_id: str
+    backend_url: str
+    name: str
+    campaign_type: str
+    submitted_at: str
+    status: str = "queued"
+    journey_id: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def is_pending(self) -> bool:
+        """Whether the job may still produce a result."""
+        return self.status in PENDING_STATUSES
+
+    def age(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """Time since submission, or None if submitted_at is unreadable."""
+        try:
+            submitted = datetime.fromisoformat(self.submitted_at)
+        except ValueError:
+            return None
+        return (now or datetime.now(timezone.utc)) - submitted
+
+    def is_abandoned(self, now: Optional[datetime] = None) -> bool:
+        """Whether a job is still pending long after it should have finished."""
+        age = self.age(now)
+        return self.is_pending and age is not None and age > ABANDONED_AFTER
+
+
+def load_jobs() -> list[JourneyJob]:
+    """Load all jobs from the ledger, oldest first."""
+    if not JOBS_FILE.exists():
+        return []
+
+    try:
+        with open(JOBS_FILE, "r") as f:
+            data = json.load(f)
+        return [JourneyJob(**entry) for entry in data.get("jobs", [])]
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning("Failed to load job ledger: %s", e)
+        return []
+
+
+def _is_expired(job: JourneyJob, now: datetime) -> bool:
+    """Whether a finished or abandoned job is old enough to drop from the ledger."""
+    if job.is_pending and not job.is_abandoned(now):
+        return False
+    age = job.age(now)
+    return age is not None and age > FINISHED_JOB_RETENTION
+
+
+def save_jobs(jobs: list[JourneyJob]) -> None:
+    """Write the ledger atomically with user-only permissions.
+
+    Finished and abandoned jobs older than FINISHED_JOB_RETENTION are
+    dropped, so the ledger doesn't grow without bound.
+    """
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    now = datetime.now(timezone.utc)
+    jobs = [job for job in jobs if not _is_expired(job, now)]
+
+    tmp_file = JOBS_FILE.with_suffix(".tmp")
+    with open(tmp_file, "w") as f:
+        json.dump({"jobs": [asdict(job) for job in jobs]}, f, indent=2)
+    os.chmod(tmp_file, 0o600)
+    os.replace(tmp_file, JOBS_FILE)
+
+
+def record_job(job_id: str, backend_url: str, body: dict) -> JourneyJob:
+    """
+    Record a newly submitted job in the ledger.
+
+    Args:
+        job_id: Job handle returned by the backend
+        backend_url: Backend the job was submitted to
+        body: Journey creation request body
+
+    Returns:
+        The recorded JourneyJob
+    """
+    job = JourneyJob(
+        job_id=job_id,
+        backend_url=backend_url,
+        name=body.get("name", "New Journey"),
+        campaign_type=body.get("campaign_type", ""),
+        submitted_at=datetime.now(timezone.utc).isoformat(),
+    )
+    jobs = load_jobs()
+    jobs.append(job)
+    save_jobs(jobs)
+    logger.debug("Recorded journey job %s in ledger", job_id)
+    return job
+
+
+def update_job(job_id: str, **changes) -> Optional[JourneyJob]:
+    """
+    Update a job's fields in the ledger.
+
+    Args:
+        job_id: Job to update
+        **changes: Field values to set (status, journey_id, error)
+
+    Returns:
+        The updated JourneyJob, or None if it is not in the ledger
+    """
+    jobs = load_jobs()
+    for job in jobs:
+        if job.job_id == job_id:
+            for key, value in changes.items():
+                setattr(job, key, value)
+            save_jobs(jobs)
+            return job
+    return None
+
+
+def clear_finished_jobs() -> int:
+    """Remove finished, expired and abandoned jobs from the ledger.
+
+    Returns:
+        Number of jobs removed
+    """
+    jobs = load_jobs()
+    now = datetime.now(timezone.utc)
+    remaining = [job for job in jobs if job.is_pending and not job.is_abandoned(now)]
+    save_jobs(remaining)
+    return len(jobs) - len(remaining)
+
+
+def has_recent_pending_jobs() -> bool:
+    """Whether a journey build may still be running."""
+    now = datetime.now(timezone.utc)
+    return any(job.is_pending and not job.is_abandoned(now) for job in load_jobs())
+
+
+_unsupported_backends: Optional[dict[str, float]] = None
+
+
+def _load_job_support() -> dict[str, float]:
+    global _unsupported_backends
+    if _unsupported_backends is None:
+        try:
+            with open(JOB_SUPPORT_FILE, "r") as f:
+                _unsupported_backends = {
+                    url: float(seen) for url, seen in json.load(f).get("unsupported", {}).items()
+                }
+        except (OSError, ValueError, TypeError, AttributeError):
+            _unsupported_backends = {}
+    return _unsupported_backends
+
+
+def _save_job_support(unsupported: dict[str, float]) -> None:
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = JOB_SUPPORT_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"unsupported": unsupported}, f, indent=2)
+        os.replace(tmp_file, JOB_SUPPORT_FILE)
+    except OSError as e:
+        logger.debug("Could not save job support state: %s", e)
+
+
+def jobs_supported(backend_url: str) -> bool:
+    """Whether to try job mode on a backend.
+
+    False for UNSUPPORTED_RECHECK after the backend answered a job submit
+    with "no job endpoints", so each build doesn't pay for a failed POST.
+    """
+    seen = _load_job_support().get(backend_url)
+    if seen is None:
+        return True
+    return time.time() - seen > UNSUPPORTED_RECHECK.total_seconds()
+
+
+def mark_jobs_unsupported(backend_url: str) -> None:
+    """Remember that a backend has no job endpoints."""
+    unsupported = _load_job_support()
+    unsupported[backend_url] = time.time()
+    _save_job_support(unsupported)
@@ -0,0 +1,74 @@
+"""Lazily loaded Typer commands.
+
+Command modules pull in heavy dependencies (prompt_toolkit for chat, the
+Supabase SDK for login, Rich tables and trees for journeys). The entry
+point registers each command by import path instead, and LazyGroup
+imports a command's module only when that command is about to run.
+Listing commands in `terryann --help` uses the registered one-line help,
+so it imports nothing.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import typer
+import typer.main
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass
+class LazyCommand:
+    """A command registered by import path."""
+    # "package.module:attribute" - a command function, or a typer.Typer
+    # for a group of subcommands
+    target: str
+    # One-line help shown in the parent's command list
+    help: str
+
+
+class LazyGroup(TyperGroup):
+    """TyperGroup whose subcommands are imported on first use."""
+
+    # Command name -> LazyCommand, in display order (set by subclasses)
+    lazy_commands: dict[str, LazyCommand] = {}
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._listing = False
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*self.lazy_commands, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Optional[Any]:
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return super().get_command(ctx, cmd_name)
+        if self._listing:
+            # Help output only needs the name and one-line help
+            return TyperCommand(cmd_name, short_help=spec.help, help=spec.help)
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            command = self.commands[cmd_name] = _load(cmd_name, spec)
+        return command
+
+    def format_help(self, ctx: typer.Context, formatter: Any) -> None:
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+
+def _load(name: str, spec: LazyCommand) -> Any:
+    """Import a command's module and build its click command."""
+    module_name, _, attribute = spec.target.partition(":")
+    target = getattr(importlib.import_module(module_name), attribute)
+    if isinstance(target, typer.Typer):
+        group = typer.main.get_group(target)
+        group.name = name
+        return group
+
+    wrapper = typer.Typer(add_completion=False)
+    wrapper.command(name)(target)
+    return typer.main.get_command(wrapper)
@@ -0,0 +1,287 @@
+"""Synthetic load generation against a gateway.
+
+Many concurrent chat sessions, each a GatewayClient with its own
+session_id, replay a prompt corpus for a fixed duration. Sessions either
+loop back to back (closed model, optionally with think time) or pick up
+turns from a Poisson arrival schedule (open model, --rate). Every HTTP
+request is recorded through the pool's observers and summarized per
+endpoint.
+"""
+
+import asyncio
+import dataclasses
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+
+from terryann_cli.breaker import percentile
+from terryann_cli.client import GatewayClient
+from terryann_cli.config import Config
+from terryann_cli.transport import HTTPPool, RequestRecord, set_pool
+
+# Prompts used when no corpus file is given. "/journeys" fetches the
+# journey list instead of sending a chat message.
+DEFAULT_CORPUS = [
+    "What campaign types can you build?",
+    "Which counties in Florida have the most turning-65 members?",
+    "Summarize AEP acquisition best practices for rural seniors.",
+    "How should we sequence mail and phone outreach for D-SNP members?",
+    "What if we add a mailer on day 3?",
+    "What if we remove the phone call?",
+    "Compare email and SMS response rates for members over 75.",
+    "Explain the wait steps in my last journey.",
+    "/journeys",
+]
+
+
+def load_corpus(path: Path) -> list[str]:
+    """
+    Read a prompt corpus.
+
+    Plain text files hold one prompt per line (blank lines and lines
+    starting with # are skipped). .jsonl files hold one object per line
+    with a "message" or "prompt" field.
+
+    Raises:
+        ValueError: If the file has no prompts
+    """
+    prompts = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if path.suffix == ".jsonl":
+                entry = json.loads(line)
+                line = entry.get("message") or entry.get("prompt") or ""
+            if line:
+                prompts.append(line)
+    if not prompts:
+        raise ValueError(f"No prompts in {path}")
+    return prompts
+
+
+@dataclass
+class LoadSettings:
+    """Shape of a load test."""
+    gateway_url: str
+    sessions: int = 10
+    duration: float = 30.0
+    # Turns per second across all sessions (None: sessions loop back to back)
+    rate: Optional[float] = None
+    # Mean pause between a session's turns in closed mode (exponential)
+    think_time: float = 0.0
+    corpus: list[str] = field(default_factory=lambda: list(DEFAULT_CORPUS))
+    stream: bool = False
+    # Use the client's retry policy (off: every failure is counted)
+    retry: bool = False
+    auth_token: Optional[str] = None
+    seed: Optional[int] = None
+
+
+class LatencyStats:
+    """Durations, errors and bytes for one endpoint (or for whole turns)."""
+
+    def __init__(self):
+        self.durations: list[float] = []
+        self.errors: Counter[str] = Counter()
+        self.bytes_received = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.durations) + sum(self.errors.values())
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        """Counts, throughput and latency percentiles (seconds)."""
+        return {
+            "requests": self.count,
+            "errors": sum(self.errors.values()),
+            "error_rate": sum(self.errors.values()) / self.count if self.count else 0.0,
+            "error_types": dict(self.errors),
+            "throughput": self.count / elapsed if elapsed else 0.0,
+            "p50": percentile(self.durations, 50),
+            "p95": percentile(self.durations, 95),
+            "p99": percentile(self.durations, 99),
+            "max": max(self.durations, default=None),
+            "bytes_received": self.bytes_received,
+        }
+
+
+@dataclass
+class LoadReport:
+    """Results of a load test, updated live while it runs."""
+    settings: LoadSettings
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+    endpoints: dict[str, LatencyStats] = field(default_factory=dict)
+    turns: LatencyStats = field(default_factory=LatencyStats)
+    # Time to first streamed token, per turn
+    first_token: list[float] = field(default_factory=list)
+    # Open model: how late turns started against their scheduled arrival
+    start_delays: list[float] = field(default_factory=list)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    def observe(self, record: RequestRecord) -> None:
+        """Pool observer: account one finished HTTP request."""
+        stats = self.endpoints.setdefault(record.endpoint, LatencyStats())
+        stats.bytes_received += record.bytes_received
+        if record.error:
+            stats.errors[record.error] += 1
+        elif record.status >= 400:
+            stats.errors[f"HTTP {record.status}"] += 1
+        else:
+            stats.durations.append(record.duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable report."""
+        elapsed = self.elapsed
+        settings = dataclasses.asdict(self.settings)
+        settings.pop("auth_token")
+        settings["corpus"] = len(self.settings.corpus)
+        return {
+            "settings": settings,
+            "elapsed": elapsed,
+            "turns": self.turns.summary(elapsed),
+            "first_token": {
+                "p50": percentile(self.first_token, 50),
+                "p95": percentile(self.first_token, 95),
+                "p99": percentile(self.first_token, 99),
+            },
+            "start_delay_p99": percentile(self.start_delays, 99),
+            "endpoints": {
+                name: stats.summary(elapsed) for name, stats in sorted(self.endpoints.items())
+            },
+        }
+
+
+def _load_config(settings: LoadSettings, base: Config) -> Config:
+    """Pool settings for load generation.
+
+    Connections scale with the session count, like one per CLI user, and
+    the adaptive timeouts, hedging and circuit breaker are switched off so
+    they don't shape the traffic being measured.
+    """
+    return dataclasses.replace(
+        base,
+        gateway_url=settings.gateway_url,
+        gateway_urls=[settings.gateway_url],
+        max_connections=settings.sessions,
+        max_keepalive_connections=settings.sessions,
+        max_requests_per_host=settings.sessions,
+        adaptive_timeouts=False,
+        hedge_requests=False,
+        breaker_failure_threshold=sys.maxsize,
+        retry_max_attempts=base.retry_max_attempts if settings.retry else 1,
+    )
+
+
+async def run_load(
+    settings: LoadSettings,
+    base_config: Config,
+    on_progress: Optional[Callable[[LoadReport], None]] = None,
+) -> LoadReport:
+    """
+    Run a load test.
+
+    Turns started before the duration runs out are allowed to finish.
+
+    Args:
+        settings: Shape of the test
+        base_config: Configuration to derive the load pool from
+        on_progress: Called about once a second with the live report
+
+    Returns:
+        The finished report
+    """
+    config = _load_config(settings, base_config)
+    pool = HTTPPool(config, persist=False)
+    previous_pool = set_pool(pool)
+    report = LoadReport(settings=settings)
+    pool.observers.append(report.observe)
+
+    rng = random.Random(settings.seed)
+    deadline = time.perf_counter() + settings.duration
+    arrivals: asyncio.Queue[float] = asyncio.Queue()
+
+    async def schedule_arrivals():
+        next_at = time.perf_counter()
+        while next_at < deadline:
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+            arrivals.put_nowait(next_at)
+            next_at += rng.expovariate(settings.rate)
+
+    async def turn(client: GatewayClient, session_id: str, prompt: str):
+        started = time.perf_counter()
+        first_token = None
+        try:
+            if prompt.startswith("/journeys"):
+                # Straight to the pool: get_json would coalesce concurrent fetches
+                response = await pool.request(
+                    "GET", f"{client.base_url}/gateway/journeys", params={"limit": 20}
+                )
+                response.raise_for_status()
+                response.json()
+            elif settings.stream:
+                async for kind, _ in client.stream_message(session_id, prompt):
+                    if kind == "text" and first_token is None:
+                        first_token = time.perf_counter() - started
+            else:
+                await client.send_message(session_id, prompt)
+        except httpx.HTTPStatusError as e:
+            report.turns.errors[f"HTTP {e.response.status_code}"] += 1
+        except Exception as e:
+            report.turns.errors[type(e).__name__] += 1
+        else:
+            report.turns.durations.append(time.perf_counter() - started)
+            if first_token is not None:
+                report.first_token.append(first_token)
+
+    async def session():
+        client = GatewayClient(config, auth_token=settings.auth_token)
+        session_id = str(uuid.uuid4())
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            if settings.rate:
+                try:
+                    scheduled = await asyncio.wait_for(arrivals.get(), remaining)
+                except asyncio.TimeoutError:
+                    return
+                report.start_delays.append(time.perf_counter() - scheduled)
+            await turn(client, session_id, rng.choice(settings.corpus))
+            if not settings.rate and settings.think_time:
+                await asyncio.sleep(rng.expovariate(1 / settings.think_time))
+
+    async def progress():
+        while True:
+            await asyncio.sleep(1.0)
+            on_progress(report)
+
+    background = []
+    if settings.rate:
+        background.append(asyncio.create_task(schedule_arrivals()))
+    if on_progress:
+        background.append(asyncio.create_task(progress()))
+
+    try:
+        await asyncio.gather(*(session() for _ in range(settings.sessions)))
+    finally:
+        report.finished = time.perf_counter()
+        for task in background:
+            task.cancel()
+        await pool.aclose()
+        set_pool(previous_pool)
+
+    return report
@@ -1,14 +1,122 @@
-"""Logging configuration for TerryAnn CLI."""
+"""Logging configuration for TerryAnn CLI.
 
+Modules log through get_logger(__name__), which places them under the
+"terryann" logger (terryann_cli.transport -> "terryann.transport"), so
+levels can be set per module. Messages use %-style arguments and are only
+formatted when a handler actually emits them.
+
+Sinks:
+    --debug            human-readable lines on stderr
+    [logging] file     JSON lines appended to a file (or --log-file)
+
+High-frequency loggers (e.g. "transport.requests") can be
+sampled: with a rate of 0.1 only every tenth DEBUG/INFO record from that
+logger reaches the sinks. Warnings and errors are never sampled out.
+"""
+
+import json
 import logging
 import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+PACKAGE_LOGGER = "terryann"
 
 # Create a logger for the package
-logger = logging.getLogger("terryann")
+logger = logging.getLogger(PACKAGE_LOGGER)
 
 # Track if debug mode is enabled
 _debug_enabled = False
 
+# Sampling rates shared by all sinks, keyed by full logger name
+_sample_rates: dict[str, float] = {}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get the logger for a module.
+
+    Args:
+        name: Module name (__name__) or a name relative to the package
+            logger, e.g. "transport.requests"
+
+    Returns:
+        A child of the "terryann" logger
+    """
+    if name == "terryann_cli" or name == PACKAGE_LOGGER:
+        return logger
+    for prefix in ("terryann_cli.", f"{PACKAGE_LOGGER}."):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+    return logger.getChild(name)
+
+
+def _full_name(name: str) -> str:
+    return get_logger(name).name
+
+
+class SamplingFilter(logging.Filter):
+    """Keep every Nth DEBUG/INFO record from sampled loggers."""
+
+    def __init__(self, rates: dict[str, float]):
+        """
+        Args:
+            rates: Fraction of records to keep (0-1), keyed by logger name;
+                a rate applies to the logger and its children
+        """
+        super().__init__()
+        self.rates = rates
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, name: str) -> Optional[float]:
+        while name:
+            rate = self.rates.get(name)
+            if rate is not None:
+                return rate
+            name = name.rpartition(".")[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate(record.name)
+        if rate is None or rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        with self._lock:
+            count = self._counts.get(record.name, 0)
+            self._counts[record.name] = count + 1
+        return count % round(1 / rate) == 0
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def _add_handler(handler: logging.Handler, level: int) -> None:
+    handler.setLevel(level)
+    handler.addFilter(SamplingFilter(_sample_rates))
+    logger.addHandler(handler)
+    if logger.level == logging.NOTSET or logger.level > level:
+        logger.setLevel(level)
+
 
 def enable_debug():
     """Enable debug logging to stderr."""
@@ -16,17 +124,74 @@ def enable_debug():
     _debug_enabled = True
 
     handler = logging.StreamHandler(sys.stderr)
-    handler.setLevel(logging.DEBUG)
     formatter = logging.Formatter(
         "[%(levelname)s] %(name)s: %(message)s"
     )
     handler.setFormatter(formatter)
-
-    logger.addHandler(handler)
-    logger.setLevel(logging.DEBUG)
+    _add_handler(handler, logging.DEBUG)
     logger.debug("Debug logging enabled")
 
 
+def _parse_level(level: str, setting: str) -> Optional[int]:
+    """
+    Resolve a level name from config, warning about unknown ones.
+
+    Args:
+        level: Level name, e.g. "info"
+        setting: Config key the name came from, for the warning
+
+    Returns:
+        The numeric level, or None if the name is not a level
+    """
+    value = logging.getLevelNamesMapping().get(str(level).upper())
+    if value is None:
+        logger.warning("Ignoring unknown log level %r for %s", level, setting)
+    return value
+
+
+def enable_log_file(path: Path, level: str = "DEBUG") -> None:
+    """
+    Append JSON-lines log records to a file.
+
+    Args:
+        path: Log file
+        level: Minimum level written to the file
+    """
+    if not logger.handlers:
+        # The package logger is about to get a handler, which would hide
+        # warnings from Python's last-resort stderr handler
+        _add_handler(logging.StreamHandler(sys.stderr), logging.WARNING)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(path, encoding="utf-8")
+    except OSError as e:
+        logger.warning("Could not open log file %s: %s", path, e)
+        return
+    handler.setFormatter(JSONLinesFormatter())
+    file_level = _parse_level(level, "[logging] level")
+    _add_handler(handler, logging.DEBUG if file_level is None else file_level)
+
+
+def configure_logging(
+    levels: Optional[dict[str, str]] = None,
+    sample_rates: Optional[dict[str, float]] = None,
+) -> None:
+    """
+    Apply per-module levels and sampling rates.
+
+    Args:
+        levels: Level names keyed by module, e.g. {"transport": "INFO"}
+        sample_rates: Fraction of DEBUG/INFO records kept, keyed by module
+    """
+    for name, level in (levels or {}).items():
+        module_level = _parse_level(level, f"[logging.levels] {name}")
+        if module_level is not None:
+            get_logger(name).setLevel(module_level)
+    for name, rate in (sample_rates or {}).items():
+        _sample_rates[_full_name(name)] = float(rate)
+
+
 def is_debug_enabled() -> bool:
     """Check if debug mode is enabled."""
     return _debug_enabled
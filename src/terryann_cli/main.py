@@ -1,17 +1,59 @@
 """TerryAnn CLI - Main entry point."""
 
+import sys
+from pathlib import Path
+from typing import Optional
+
 import typer
 
 from terryann_cli import __version__
-from terryann_cli.commands.auth import login, logout, whoami
-from terryann_cli.commands.chat import chat
-from terryann_cli.commands.journeys import list_journeys, show_journey
-from terryann_cli.commands.status import status
-from terryann_cli.logging import enable_debug
+from terryann_cli.config import load_config
+from terryann_cli.lazy import LazyCommand, LazyGroup
+from terryann_cli.logging import configure_logging, enable_debug, enable_log_file
+
+
+class CommandGroup(LazyGroup):
+    """Top-level commands, each imported only when it runs."""
+
+    lazy_commands = {
+        "status": LazyCommand(
+            "terryann_cli.commands.status:status", "Check TerryAnn gateway health status."
+        ),
+        "stats": LazyCommand(
+            "terryann_cli.commands.stats:stats",
+            "Show latency percentiles of past gateway and backend calls.",
+        ),
+        "chat": LazyCommand(
+            "terryann_cli.commands.chat:chat", "Start interactive conversation with TerryAnn."
+        ),
+        "login": LazyCommand(
+            "terryann_cli.commands.auth:login", "Log in to your TerryAnn account."
+        ),
+        "logout": LazyCommand(
+            "terryann_cli.commands.auth:logout", "Log out of your TerryAnn account."
+        ),
+        "whoami": LazyCommand("terryann_cli.commands.auth:whoami", "Show current logged-in user."),
+        "dev-server": LazyCommand(
+            "terryann_cli.commands.dev_server:dev_server",
+            "Run a local stand-in for the gateway and backend (offline development).",
+        ),
+        "journeys": LazyCommand("terryann_cli.commands.journeys:app", "Manage journeys"),
+        "bench": LazyCommand("terryann_cli.commands.bench:app", "Benchmark and load-test tools"),
+        "serve": LazyCommand(
+            "terryann_cli.commands.serve:serve",
+            "Run a caching proxy that a team can share as its gateway URL.",
+        ),
+        "daemon": LazyCommand(
+            "terryann_cli.commands.daemon:app",
+            "Run the background daemon that keeps connections warm",
+        ),
+    }
+
 
 app = typer.Typer(
     name="terryann",
     help="CLI for TerryAnn Medicare Journey Intelligence Platform",
+    cls=CommandGroup,
 )
 
 
@@ -26,6 +68,37 @@ def debug_callback(value: bool):
         enable_debug()
 
 
+# The diagnostics below are imported only when their flag is given
+
+
+def timings_callback(value: bool):
+    if value:
+        from terryann_cli.timings import enable_timings
+
+        enable_timings()
+
+
+def trace_callback(value: Optional[Path]):
+    if value:
+        from terryann_cli.tracing import start_tracing
+
+        start_tracing(value)
+
+
+def memprof_callback(value: bool):
+    if value:
+        from terryann_cli.memprof import start_memprof
+
+        start_memprof()
+
+
+def profile_startup_callback(value: bool):
+    if value:
+        from terryann_cli.startup_profile import profile_startup
+
+        raise typer.Exit(code=profile_startup(sys.argv[1:]))
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -44,27 +117,56 @@ def main(
         is_eager=True,
         help="Enable debug logging to stderr.",
     ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        callback=timings_callback,
+        is_eager=True,
+        help="Print a per-phase latency waterfall after each operation.",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        callback=trace_callback,
+        is_eager=True,
+        help="Write a Chrome/Perfetto trace of the session to this file.",
+        metavar="FILE",
+    ),
+    memprof: bool = typer.Option(
+        False,
+        "--memprof",
+        callback=memprof_callback,
+        is_eager=True,
+        help="Report memory growth per chat turn and dump a diff on exit.",
+    ),
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        callback=profile_startup_callback,
+        is_eager=True,
+        help="Run the command under -X importtime and print the import tree.",
+    ),
+    log_file: Optional[Path] = typer.Option(
+        None,
+        "--log-file",
+        help="Append JSON-lines logs to this file.",
+        metavar="FILE",
+    ),
 ):
     """TerryAnn CLI - Medicare Journey Intelligence Platform.
 
     Run without arguments to start an interactive chat session.
     """
+    config = load_config()
+    configure_logging(config.log_levels, config.log_sample_rates)
+    if log_file or config.log_file:
+        enable_log_file(log_file or Path(config.log_file).expanduser(), config.log_level)
+
     # If no subcommand provided, launch chat by default
     if ctx.invoked_subcommand is None:
-        chat()
-
+        from terryann_cli.commands.chat import chat
 
-app.command()(status)
-app.command()(chat)
-app.command()(login)
-app.command()(logout)
-app.command()(whoami)
-
-# Journeys subcommand group
-journeys_app = typer.Typer(help="Manage journeys")
-journeys_app.command("list")(list_journeys)
-journeys_app.command("show")(show_journey)
-app.add_typer(journeys_app, name="journeys")
+        chat()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+"""Memory profiling of long chat sessions (--memprof).
+
+tracemalloc traces every allocation from startup. A snapshot is taken at
+checkpoints (after each chat turn and each journey render) and compared
+with the previous one, so steady growth shows up turn by turn on stderr
+with the allocation sites responsible. On exit the last snapshot is
+diffed against the first checkpoint and written to
+~/.terryann/memprof/<timestamp>.txt together with the per-checkpoint
+series; sites that keep growing there point at held response dicts or
+Rich renderables.
+"""
+
+import atexit
+import linecache
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from rich.console import Console
+
+from terryann_cli.config import CONFIG_DIR
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+MEMPROF_DIR = CONFIG_DIR / "memprof"
+
+# Frames kept per allocation; the report groups by the innermost one,
+# the exit dump shows the full stack of the biggest growers
+TRACE_FRAMES = 10
+# Growth sites printed per checkpoint / written to the exit dump
+TOP_SITES = 3
+DUMP_SITES = 40
+
+# Allocation sites left out of reports. Statistics are filtered after
+# grouping: Snapshot.filter_traces() matches every trace and takes seconds
+# on a long session.
+_IGNORED_FILES = frozenset({
+    __file__,
+    tracemalloc.__file__,
+    linecache.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+})
+
+_stderr = Console(stderr=True, highlight=False)
+
+
+@dataclass
+class Checkpoint:
+    """Traced memory at one checkpoint."""
+    label: str
+    at: float
+    current: int
+    peak: int
+    growth: int  # since the previous checkpoint
+
+
+class MemoryProfiler:
+    """Snapshots, checkpoint series and the exit dump."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.checkpoints: list[Checkpoint] = []
+        self.counts: dict[str, int] = {}
+        self.first: Optional[tracemalloc.Snapshot] = None
+        # Per-site statistics of the last checkpoint, grouped once and
+        # reused for the next comparison (grouping dominates the cost)
+        self.previous: Optional[dict[tracemalloc.Traceback, tracemalloc.Statistic]] = None
+
+    def checkpoint(self, label: str) -> None:
+        """Snapshot, compare with the previous checkpoint and report growth."""
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        self.counts[label] = self.counts.get(label, 0) + 1
+        name = f"{label} #{self.counts[label]}"
+        sites = {stat.traceback: stat for stat in _relevant(snapshot.statistics("lineno"))}
+
+        if self.previous is None:
+            growth, top = 0, []
+            self.first = snapshot
+        else:
+            growth = sum(stat.size for stat in sites.values()) - sum(
+                stat.size for stat in self.previous.values()
+            )
+            grown = []
+            for site, stat in sites.items():
+                before = self.previous.get(site)
+                size_diff = stat.size - (before.size if before else 0)
+                if size_diff > 0:
+                    grown.append((size_diff, site[0]))
+            top = sorted(grown, key=lambda item: item[0], reverse=True)[:TOP_SITES]
+        self.previous = sites
+        self.checkpoints.append(Checkpoint(name, time.time(), current, peak, growth))
+
+        _stderr.print(
+            f"[bold]🧠 {name}[/bold] [dim]{_format_size(current)} traced "
+            f"({_format_size(growth, sign=True)}) • peak {_format_size(peak)}[/dim]"
+        )
+        for size_diff, frame in top:
+            _stderr.print(
+                f"   [dim]{_format_size(size_diff, sign=True):>10}  "
+                f"{_short_path(frame.filename)}:{frame.lineno}[/dim]"
+            )
+
+    def dump(self) -> Optional[Path]:
+        """Write the growth since the first checkpoint to the dump file."""
+        if self.first is None:
+            return None
+        final = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            "TerryAnn CLI memory profile",
+            f"Written {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Traced now {_format_size(current)}, peak {_format_size(peak)}",
+            "",
+            "Checkpoints:",
+        ]
+        for point in self.checkpoints:
+            lines.append(
+                f"  {time.strftime('%H:%M:%S', time.localtime(point.at))}  "
+                f"{point.label:<24} {_format_size(point.current):>10} "
+                f"{_format_size(point.growth, sign=True):>11}"
+            )
+
+        lines += ["", f"Top {DUMP_SITES} growth sites since the first checkpoint:"]
+        grown = [s for s in _relevant(final.compare_to(self.first, "lineno")) if s.size_diff > 0]
+        for stat in grown[:DUMP_SITES]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {_format_size(stat.size_diff, sign=True):>11} "
+                f"({stat.count_diff:+,} blocks)  {frame.filename}:{frame.lineno}"
+            )
+
+        lines += ["", "Largest growth by stack:"]
+        grown = [
+            s for s in _relevant(final.compare_to(self.first, "traceback")) if s.size_diff > 0
+        ]
+        for stat in grown[:TOP_SITES * 3]:
+            lines.append(
+                f"  {_format_size(stat.size_diff, sign=True)} ({stat.count_diff:+,} blocks)"
+            )
+            lines += [f"    {line}" for line in stat.traceback.format(most_recent_first=True)]
+
+        lines += ["", f"Top {DUMP_SITES} allocation sites now:"]
+        for stat in _relevant(final.statistics("lineno"))[:DUMP_SITES]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {_format_size(stat.size):>10} ({stat.count:,} blocks)  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.warning("Could not write memory profile to %s: %s", self.path, e)
+            return None
+        return self.path
+
+
+_profiler: Optional[MemoryProfiler] = None
+
+
+def start_memprof(path: Optional[Path] = None) -> None:
+    """
+    Trace allocations for the rest of the process and dump a diff on exit.
+
+    Args:
+        path: Dump file (default: ~/.terryann/memprof/<timestamp>.txt)
+    """
+    global _profiler
+    if path is None:
+        path = MEMPROF_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.txt"
+    tracemalloc.start(TRACE_FRAMES)
+    _profiler = MemoryProfiler(path)
+
+    def finish():
+        written = _profiler.dump()
+        if written:
+            _stderr.print(f"[dim]Memory profile written to {written}[/dim]")
+        tracemalloc.stop()
+
+    atexit.register(finish)
+
+
+def is_memprof_enabled() -> bool:
+    """Check if --memprof is active."""
+    return _profiler is not None
+
+
+def checkpoint(label: str) -> None:
+    """Report memory growth since the previous checkpoint, if --memprof is on."""
+    if _profiler is not None:
+        _profiler.checkpoint(label)
+
+
+def _relevant(stats: list) -> list:
+    """Drop statistics whose allocation site is the profiler or the import system."""
+    return [stat for stat in stats if stat.traceback[0].filename not in _IGNORED_FILES]
+
+
+def _short_path(filename: str) -> str:
+    """Path from the package (site-packages/...) down, for compact output."""
+    parts = Path(filename).parts
+    for anchor in ("site-packages", "src", "lib"):
+        if anchor in parts:
+            return "/".join(parts[len(parts) - parts[::-1].index(anchor):])
+    return filename
+
+
+def _format_size(size: int, sign: bool = False) -> str:
+    prefix = ("+" if size > 0 else "-" if size < 0 else "±") if sign else ""
+    size = abs(size)
+    if size < 1024:
+        return f"{prefix}{size} B"
+    if size < 1024 * 1024:
+        return f"{prefix}{size / 1024:.1f} KB"
+    return f"{prefix}{size / (1024 * 1024):.1f} MB"
@@ -0,0 +1,168 @@
+"""Concurrent multi-service probing for `terryann status --deep`.
+
+Each target is sampled several times over a fresh connection, so every
+sample pays for DNS, TCP and TLS and its phases can be reported separately.
+Targets are probed concurrently and all of them share one deadline: the
+whole probe takes at most the timeout budget, however many targets and
+samples there are. Probes bypass the shared pool (no retries, breaker or
+keep-alive) so they measure the network rather than the pool.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import httpx
+
+from terryann_cli.breaker import percentile
+from terryann_cli.timings import TRACE_PHASES
+
+
+@dataclass
+class ProbeTarget:
+    """A service endpoint to probe."""
+    service: str
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    # Whether the CLI can't work at all without this service
+    critical: bool = False
+
+
+@dataclass
+class ProbeSample:
+    """Timings of one request over a fresh connection (seconds)."""
+    total: float
+    status: int = 0  # 0 if no response was received
+    connect: Optional[float] = None  # DNS + TCP
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None  # request sent -> response headers received
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the service answered (a 4xx still proves it is up)."""
+        return self.error is None and 0 < self.status < 500
+
+
+@dataclass
+class ProbeResult:
+    """All samples taken from one target."""
+    target: ProbeTarget
+    samples: list[ProbeSample] = field(default_factory=list)
+
+    @property
+    def successes(self) -> list[ProbeSample]:
+        return [sample for sample in self.samples if sample.ok]
+
+    @property
+    def healthy(self) -> bool:
+        """Whether at least one sample got through."""
+        return bool(self.successes)
+
+    def percentile(self, phase: str, q: float) -> Optional[float]:
+        """Percentile of a phase ("connect", "tls", "ttfb", "total") over successes."""
+        values = [getattr(s, phase) for s in self.successes if getattr(s, phase) is not None]
+        return percentile(values, q)
+
+    def last_error(self) -> Optional[str]:
+        """Most recent failure, for display."""
+        for sample in reversed(self.samples):
+            if not sample.ok:
+                return sample.error or f"HTTP {sample.status}"
+        return None
+
+
+class _PhaseTrace:
+    """httpx trace extension callback collecting phase durations."""
+
+    def __init__(self):
+        self.started: dict[str, float] = {}
+        self.durations: dict[str, float] = {}
+        self.request_sent: Optional[float] = None
+        self.headers_received: Optional[float] = None
+
+    async def __call__(self, event: str, info: dict[str, Any]) -> None:
+        _, _, rest = event.partition(".")
+        step, _, state = rest.rpartition(".")
+        phase = TRACE_PHASES.get(step)
+        if phase is None:
+            return
+        now = time.perf_counter()
+        if state == "started":
+            self.started[step] = now
+            if step == "send_request_headers" and self.request_sent is None:
+                self.request_sent = now
+        elif step in self.started:
+            duration = now - self.started.pop(step)
+            self.durations[phase] = self.durations.get(phase, 0.0) + duration
+            if step == "receive_response_headers":
+                self.headers_received = now
+
+
+async def _sample(client: httpx.AsyncClient, target: ProbeTarget) -> ProbeSample:
+    """Take one sample; the caller bounds how long it may take."""
+    trace = _PhaseTrace()
+    started = time.perf_counter()
+    try:
+        response = await client.get(
+            target.url, headers=target.headers, extensions={"trace": trace}
+        )
+        status, error = response.status_code, None
+    except httpx.HTTPError as e:
+        status, error = 0, type(e).__name__
+    sample = ProbeSample(total=time.perf_counter() - started, status=status, error=error)
+    sample.connect = trace.durations.get("connect")
+    sample.tls = trace.durations.get("tls")
+    if trace.request_sent is not None and trace.headers_received is not None:
+        sample.ttfb = trace.headers_received - trace.request_sent
+    return sample
+
+
+async def probe_targets(
+    targets: list[ProbeTarget],
+    samples: int = 3,
+    budget: float = 10.0,
+    on_sample: Optional[Callable[[ProbeResult, ProbeSample], None]] = None,
+) -> list[ProbeResult]:
+    """
+    Probe all targets concurrently within one timeout budget.
+
+    Samples of the same target are taken one after another, so they don't
+    compete with each other for bandwidth. A sample still running when the
+    budget runs out is recorded as a timeout and the target's remaining
+    samples are skipped.
+
+    Args:
+        targets: Endpoints to probe
+        samples: Samples per target
+        budget: Seconds the whole probe may take
+        on_sample: Called after every sample (for progress display)
+
+    Returns:
+        One result per target, in the order given
+    """
+    results = [ProbeResult(target) for target in targets]
+    deadline = time.perf_counter() + budget
+
+    # No keep-alive: every sample opens (and times) a new connection
+    limits = httpx.Limits(max_keepalive_connections=0)
+    async with httpx.AsyncClient(limits=limits, timeout=budget) as client:
+
+        async def probe(result: ProbeResult) -> None:
+            for _ in range(samples):
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return
+                started = time.perf_counter()
+                try:
+                    sample = await asyncio.wait_for(_sample(client, result.target), remaining)
+                except asyncio.TimeoutError:
+                    sample = ProbeSample(total=time.perf_counter() - started, error="Timeout")
+                result.samples.append(sample)
+                if on_sample:
+                    on_sample(result, sample)
+
+        await asyncio.gather(*(probe(result) for result in results))
+
+    return results
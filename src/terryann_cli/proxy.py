@@ -0,0 +1,363 @@
+"""Shared caching proxy in front of the gateway (`terryann serve`).
+
+A team points TERRYANN_GATEWAY_URL (and TERRYANN_BACKEND_URL) at one proxy,
+so scripts and CLI users reading the same journeys share a warm upstream
+connection pool instead of each opening their own connections.
+
+- Journey reads (GET /gateway/journeys and /gateway/journeys/<id>) are
+  cached per user for the cache TTL and coalesced while in flight. Expired
+  entries are revalidated upstream with the gateway's validators, and
+  served stale if the gateway can't be reached.
+- Everything else is passed through and streamed back as it arrives, so
+  chat replies (SSE) keep flowing. Journey builds (/journey/...) go to the
+  backend, everything else to the gateway.
+- Writes, and journey builds and their job polls, drop the user's cached
+  reads, so a new journey shows up in the next list.
+- The Authorization header is forwarded as is. Cache entries are keyed by
+  a hash of it, so a user is never served another user's responses.
+- GET /_proxy/metrics reports cache and upstream counters as JSON, or in
+  the Prometheus text format for `Accept: text/plain`.
+
+The proxy has its own HTTP pool, sized for many users and kept out of the
+operator's ~/.terryann latency history and endpoint health.
+"""
+
+import dataclasses
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from terryann_cli.breaker import CircuitOpenError
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter
+from terryann_cli.logging import get_logger
+from terryann_cli.singleflight import SingleFlight
+from terryann_cli.transport import HTTPPool
+
+logger = get_logger(__name__)
+
+DEFAULT_PORT = 8790
+DEFAULT_CACHE_TTL = 30.0
+DEFAULT_MAX_ENTRIES = 1024
+# Upstream connections; each streamed chat reply holds one while it runs
+DEFAULT_MAX_CONNECTIONS = 256
+METRICS_PATH = "/_proxy/metrics"
+
+CACHEABLE_PATH = re.compile(r"^/gateway/journeys(/[^/]+)?$")
+# Journey builds and their jobs, served by the backend
+BACKEND_PATH_PREFIX = "/journey/"
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+UPSTREAM_TIMEOUT = 30.0
+# Chat replies stream for a while
+PASS_THROUGH_TIMEOUT = 300.0
+
+# Not forwarded in either direction: connection management, and headers
+# that describe the encoding of a body the proxy re-frames
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+    "host",
+    "content-length",
+    "content-encoding",
+    "accept-encoding",
+})
+
+
+@dataclass
+class CachedResponse:
+    """A journey read as served to clients."""
+    status: int
+    body: bytes
+    content_type: str
+    # Sent to clients; the gateway's ETag, or a hash of the body
+    etag: str
+    # The gateway's own validators, for revalidating upstream
+    validators: dict[str, str]
+    stored_at: float
+
+
+def _user_key(request: HTTPRequest) -> str:
+    """Identity a cached response belongs to (anonymous requests share one)."""
+    authorization = request.headers.get("authorization", "")
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+
+
+def _pool_config(config: Config, max_connections: int) -> Config:
+    """Pool settings for serving many users at once.
+
+    A streamed chat reply holds a connection and a per-host slot for as
+    long as it runs, so both limits scale with concurrent users instead of
+    one CLI's needs. Requests are not retried: each CLI behind the proxy
+    already retries, and retrying here too would multiply the attempts.
+    """
+    return dataclasses.replace(
+        config,
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        max_requests_per_host=max_connections,
+        retry_max_attempts=1,
+    )
+
+
+def _forward_headers(headers: Any) -> dict[str, str]:
+    return {
+        name.lower(): value
+        for name, value in headers.items()
+        if name.lower() not in HOP_BY_HOP_HEADERS
+    }
+
+
+class GatewayProxy:
+    """Request handler for http_server.serve()."""
+
+    def __init__(
+        self,
+        config: Config,
+        upstreams: list[str],
+        backend_upstreams: Optional[list[str]] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        """
+        Initialize the proxy.
+
+        Args:
+            config: CLI configuration the upstream pool is based on
+            upstreams: Gateway base URLs, primary first (reads are hedged)
+            backend_upstreams: Backend base URLs for journey builds
+                (default: the gateway upstreams)
+            cache_ttl: Seconds a journey read is served without revalidating
+            max_entries: Cached responses kept, least recently used evicted
+            max_connections: Concurrent upstream connections
+        """
+        self.upstreams = [url.rstrip("/") for url in upstreams]
+        self.backend_upstreams = [url.rstrip("/") for url in backend_upstreams or upstreams]
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self.pool = HTTPPool(_pool_config(config, max_connections), persist=False)
+        self.cache: dict[tuple[str, str], CachedResponse] = {}
+        # Bumped on each invalidation, so a read fetched before a write
+        # isn't cached after it
+        self._generations: dict[str, int] = {}
+        self._inflight = SingleFlight()
+        self.started = time.time()
+        self.counters = {
+            "requests": 0,
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stale": 0,
+            "not_modified": 0,
+            "passed_through": 0,
+            "upstream_errors": 0,
+            "invalidations": 0,
+            "bytes_from_cache": 0,
+        }
+
+    async def handle(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        self.counters["requests"] += 1
+        if request.path == METRICS_PATH:
+            await self._metrics(request, response)
+        elif request.method == "GET" and CACHEABLE_PATH.match(request.path):
+            await self._cached_read(request, response)
+        else:
+            await self._pass_through(request, response)
+
+    async def _cached_read(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        """Serve a journey read from the cache, fetching or revalidating it if needed."""
+        user = _user_key(request)
+        key = (user, request.target)
+        entry = self.cache.get(key)
+        if entry is not None and time.monotonic() - entry.stored_at < self.cache_ttl:
+            self.counters["hits"] += 1
+            state = "HIT"
+            # Keep recently used entries at the end (evicted last)
+            self.cache[key] = self.cache.pop(key)
+        else:
+            self.counters["misses"] += 1
+            try:
+                entry, state = await self._inflight.do(key, lambda: self._fetch(request, key))
+            except Exception as e:
+                await self._upstream_failed(request, response, e, key)
+                return
+
+        headers = {"X-Cache": state}
+        if entry.status == 200:
+            headers["ETag"] = entry.etag
+            if request.headers.get("if-none-match") == entry.etag:
+                self.counters["not_modified"] += 1
+                await response.send(304, headers=headers)
+                return
+        if state != "MISS":
+            self.counters["bytes_from_cache"] += len(entry.body)
+        await response.send(
+            entry.status, entry.body, {"Content-Type": entry.content_type, **headers}
+        )
+
+    async def _fetch(
+        self, request: HTTPRequest, key: tuple[str, str]
+    ) -> tuple[CachedResponse, str]:
+        """Fetch (or revalidate) a journey read upstream and cache a success."""
+        generation = self._generations.get(key[0], 0)
+        previous = self.cache.get(key)
+        headers = _forward_headers(request.headers)
+        headers.pop("if-none-match", None)
+        headers.pop("if-modified-since", None)
+        if previous is not None:
+            headers.update(previous.validators)
+
+        upstream = await self.pool.hedged_request(
+            "GET",
+            [f"{url}{request.target}" for url in self.upstreams],
+            headers=headers,
+            timeout=UPSTREAM_TIMEOUT,
+        )
+        if upstream.status_code == 304 and previous is not None:
+            self.counters["revalidated"] += 1
+            if self._generations.get(key[0], 0) == generation:
+                previous.stored_at = time.monotonic()
+            return previous, "REVALIDATED"
+
+        if upstream.status_code >= 500:
+            self.counters["upstream_errors"] += 1
+            if previous is not None:
+                self.counters["stale"] += 1
+                return previous, "STALE"
+
+        body = upstream.content
+        validators = {}
+        if upstream.headers.get("etag"):
+            validators["If-None-Match"] = upstream.headers["etag"]
+        if upstream.headers.get("last-modified"):
+            validators["If-Modified-Since"] = upstream.headers["last-modified"]
+        entry = CachedResponse(
+            status=upstream.status_code,
+            body=body,
+            content_type=upstream.headers.get("content-type", "application/json"),
+            etag=upstream.headers.get("etag") or f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            validators=validators,
+            stored_at=time.monotonic(),
+        )
+        if upstream.status_code == 200 and self._generations.get(key[0], 0) == generation:
+            self._store(key, entry)
+        return entry, "MISS"
+
+    def _store(self, key: tuple[str, str], entry: CachedResponse) -> None:
+        self.cache.pop(key, None)
+        while len(self.cache) >= self.max_entries:
+            del self.cache[next(iter(self.cache))]
+        self.cache[key] = entry
+
+    async def _upstream_failed(
+        self,
+        request: HTTPRequest,
+        response: HTTPResponseWriter,
+        error: Exception,
+        key: Optional[tuple[str, str]] = None,
+    ) -> None:
+        """Answer a request the gateway couldn't serve, stale if possible."""
+        self.counters["upstream_errors"] += 1
+        logger.warning("Upstream %s %s failed: %s", request.method, request.path, error)
+        stale = self.cache.get(key) if key is not None else None
+        if stale is not None:
+            self.counters["stale"] += 1
+            await response.send(
+                stale.status,
+                stale.body,
+                {"Content-Type": stale.content_type, "ETag": stale.etag, "X-Cache": "STALE"},
+            )
+            return
+        status = 503 if isinstance(error, CircuitOpenError) else 502
+        await response.send_json(status, {"detail": f"Gateway unavailable: {error}"})
+
+    async def _pass_through(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        """Forward a request to the primary gateway or backend and stream the reply back."""
+        self.counters["passed_through"] += 1
+        journey_build = request.path.startswith(BACKEND_PATH_PREFIX)
+        # Writes (chat turns, journey builds) can change this user's journeys;
+        # a build only shows up in the list once its job completes
+        invalidates = journey_build or request.method not in READ_METHODS
+        if invalidates:
+            self._invalidate(_user_key(request))
+
+        upstreams = self.backend_upstreams if journey_build else self.upstreams
+        url = f"{self.pool.rank(upstreams)[0]}{request.target}"
+        try:
+            async with self.pool.stream(
+                request.method,
+                url,
+                content=request.body or None,
+                headers=_forward_headers(request.headers),
+                timeout=PASS_THROUGH_TIMEOUT,
+            ) as upstream:
+                await response.start_chunked(
+                    upstream.status_code, _forward_headers(upstream.headers)
+                )
+                async for chunk in upstream.aiter_bytes():
+                    await response.write_chunk(chunk)
+                await response.end_chunked()
+                status = upstream.status_code
+        except Exception as e:
+            if response.started:
+                raise
+            await self._upstream_failed(request, response, e)
+            return
+
+        if invalidates and status < 400:
+            # Also drop reads that were fetched and cached while it ran
+            self._invalidate(_user_key(request))
+
+    def _invalidate(self, user: str) -> None:
+        self._generations[user] = self._generations.get(user, 0) + 1
+        stale = [key for key in self.cache if key[0] == user]
+        for key in stale:
+            del self.cache[key]
+        if stale:
+            self.counters["invalidations"] += 1
+            logger.debug("Dropped %d cached reads after a write", len(stale))
+
+    def metrics(self) -> dict[str, Any]:
+        """Cache, coalescing and upstream counters."""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            "uptime": time.time() - self.started,
+            "upstreams": [urlsplit(url).netloc for url in self.upstreams],
+            "backend_upstreams": [urlsplit(url).netloc for url in self.backend_upstreams],
+            **self.counters,
+            "hit_ratio": self.counters["hits"] / lookups if lookups else None,
+            "coalesced": self._inflight.coalesced,
+            "entries": len(self.cache),
+            "cache_bytes": sum(len(entry.body) for entry in self.cache.values()),
+            "users": len({key[0] for key in self.cache}),
+            "upstream_requests": self.pool.totals["requests"],
+            "upstream_bytes_received": self.pool.totals["bytes_received"],
+        }
+
+    async def aclose(self) -> None:
+        """Close the upstream connection pool."""
+        await self.pool.aclose()
+
+    async def _metrics(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        metrics = self.metrics()
+        if not request.accepts("text/plain"):
+            await response.send_json(200, metrics)
+            return
+        lines = []
+        for name, value in metrics.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines.append(f"terryann_proxy_{name} {value:g}")
+        await response.send(
+            200,
+            ("\n".join(lines) + "\n").encode("utf-8"),
+            {"Content-Type": "text/plain; version=0.0.4"},
+        )
@@ -0,0 +1,149 @@
+"""Retry policy for gateway and backend requests.
+
+Transient failures (connection errors, dropped keep-alive connections,
+429/502/503/504 responses) are retried with exponential backoff and full
+jitter. POST requests carry an Idempotency-Key header that stays the same
+across retries, so a retried journey creation can't create duplicates.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from terryann_cli.config import Config
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Responses worth retrying - the request was not processed or can be replayed
+RETRYABLE_STATUSES = (429, 502, 503, 504)
+
+# Transport errors worth retrying
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how long to retry a failed request."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    # No new attempt is started once this many seconds have passed
+    budget: float = 60.0
+    respect_retry_after: bool = True
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RetryPolicy":
+        """Build the policy from the [retry] section of config.toml."""
+        return cls(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            budget=config.retry_budget,
+            respect_retry_after=config.retry_respect_retry_after,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given attempt (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    policy: RetryPolicy,
+    label: str,
+) -> httpx.Response:
+    """
+    Send a request, retrying transient failures according to the policy.
+
+    Args:
+        send: Callable that sends the request once and returns the response
+        policy: Retry policy to apply
+        label: Short description for debug logs (e.g. "POST /gateway/message")
+
+    Returns:
+        The first non-retryable response, or the last response once the
+        attempts or budget run out
+
+    Raises:
+        httpx.TransportError: If the last attempt failed with a transport error
+    """
+    started = time.monotonic()
+    attempt = 0
+
+    while True:
+        attempt += 1
+        response: Optional[httpx.Response] = None
+        error: Optional[Exception] = None
+        try:
+            response = await send()
+        except RETRYABLE_ERRORS as e:
+            error = e
+            reason = type(e).__name__
+            delay = policy.backoff(attempt)
+            if attempt >= policy.max_attempts:
+                logger.debug("%s failed after %d attempts: %s", label, attempt, reason)
+                raise
+        else:
+            if response.status_code not in RETRYABLE_STATUSES or attempt >= policy.max_attempts:
+                if attempt > 1:
+                    logger.debug(
+                        "%s finished with %d after %d retries",
+                        label,
+                        response.status_code,
+                        attempt - 1,
+                    )
+                return response
+            reason = str(response.status_code)
+            delay = policy.backoff(attempt)
+            retry_after = _retry_after(response) if policy.respect_retry_after else None
+            if retry_after is not None:
+                delay = retry_after
+
+        if time.monotonic() - started + delay > policy.budget:
+            logger.debug("%s: retry budget of %.0fs exhausted", label, policy.budget)
+            if response is not None:
+                return response
+            raise error
+
+        if response is not None:
+            # Release the connection before trying again
+            await response.aclose()
+
+        logger.debug(
+            "%s: attempt %d/%d failed (%s), retrying in %.2fs",
+            label,
+            attempt,
+            policy.max_attempts,
+            reason,
+            delay,
+        )
+        await asyncio.sleep(delay)
@@ -0,0 +1,171 @@
+"""One event loop per process, shared by every command.
+
+Commands used to wrap each async call in its own asyncio.run(). A command
+that refreshed the token and then fetched data built two loops, and the
+shared HTTP pool reconnected on each, since connections belong to the
+loop that opened them. The runtime keeps a single loop for the life of
+the process and owns what lives on it:
+
+- run(coro) runs a coroutine on the loop, as often as needed
+- spawn(coro) starts a background task that is cancelled at shutdown
+- on_shutdown(hook) registers async cleanup (closing the HTTP pool,
+  flushing history), run in reverse order on the same loop at exit
+- entry_point turns an async function into a Typer command
+
+The loop comes from uvloop when it is installed (`pip install
+terryann-cli[fast]`) and [runtime] uvloop isn't turned off.
+"""
+
+import asyncio
+import atexit
+import functools
+from typing import Any, Awaitable, Callable, Coroutine, Optional, ParamSpec, TypeVar
+
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def _uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """uvloop's loop constructor, or None if uvloop isn't installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+class Runtime:
+    """The process's event loop, background tasks and shutdown hooks."""
+
+    def __init__(self, use_uvloop: bool = True):
+        """
+        Initialize the runtime (the loop is created on first use).
+
+        Args:
+            use_uvloop: Run on uvloop if it is installed
+        """
+        self.use_uvloop = use_uvloop
+        self._runner: Optional[asyncio.Runner] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._hooks: list[Callable[[], Awaitable[None]]] = []
+        self.closed = False
+
+    def _get_runner(self) -> asyncio.Runner:
+        if self.closed:
+            raise RuntimeError("The runtime has been shut down")
+        if self._runner is None:
+            factory = _uvloop_factory() if self.use_uvloop else None
+            self._runner = asyncio.Runner(loop_factory=factory)
+            logger.debug("Started event loop (%s)", "uvloop" if factory else "asyncio")
+        return self._runner
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop."""
+        return self._get_runner().get_loop()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the runtime's loop and return its result.
+
+        Raises:
+            RuntimeError: If called from code already running on a loop
+                (await the coroutine there instead)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError("runtime.run() called from a running event loop")
+        return self._get_runner().run(coro)
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+        """
+        Start a background task on the loop; it is cancelled at shutdown.
+
+        Must be called from a coroutine running on the runtime.
+        """
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def on_shutdown(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Register async cleanup to run on the loop at shutdown (last registered runs first)."""
+        self._hooks.append(hook)
+
+    def shutdown(self) -> None:
+        """Cancel background tasks, run the shutdown hooks and close the loop."""
+        if self.closed:
+            return
+        runner, self._runner = self._runner, None
+        self.closed = True
+        if runner is None:
+            # No loop was ever started, so nothing was opened on one
+            return
+
+        async def stop() -> None:
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for hook in reversed(self._hooks):
+                try:
+                    await hook()
+                except Exception as e:
+                    logger.debug("Shutdown hook %r failed: %s", hook, e)
+
+        try:
+            runner.run(stop())
+        finally:
+            runner.close()
+
+
+_runtime: Optional[Runtime] = None
+
+
+def get_runtime() -> Runtime:
+    """Get the process-wide runtime, shut down automatically at exit."""
+    global _runtime
+    if _runtime is None:
+        from terryann_cli.config import load_config
+
+        _runtime = Runtime(use_uvloop=load_config().uvloop)
+        atexit.register(_runtime.shutdown)
+    return _runtime
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the process-wide loop (see Runtime.run)."""
+    return get_runtime().run(coro)
+
+
+def spawn(coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+    """Start a background task owned by the runtime (see Runtime.spawn)."""
+    return get_runtime().spawn(coro, name)
+
+
+def on_shutdown(hook: Callable[[], Awaitable[None]]) -> None:
+    """Register async cleanup for process exit (see Runtime.on_shutdown)."""
+    get_runtime().on_shutdown(hook)
+
+
+def entry_point(fn: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, T]:
+    """
+    Make an async function usable as a Typer command.
+
+    The wrapper keeps the function's signature, so Typer still sees its
+    options and arguments, and runs it on the process-wide loop.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return run(fn(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,60 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same thing at the same moment, only the
+first one does the work; the others wait for it and share its result.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single call.
+
+    The shared call runs in its own task, so a caller being cancelled does
+    not cancel it for the others. All callers receive the same result
+    object (or the same exception).
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once for all concurrent callers using the same key.
+
+        Args:
+            key: Identity of the call (e.g. method, URL and params)
+            fn: Zero-argument coroutine function doing the actual work
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+            logger.debug("Joining in-flight request %s", key)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Counts of calls made and calls that joined an in-flight one."""
+        return {"calls": self.calls, "coalesced": self.coalesced}
@@ -8,6 +8,7 @@ from rich.live import Live
 from rich.spinner import Spinner
 from rich.text import Text
 
+from terryann_cli import tracing
 from terryann_cli.action_words import (
     MessageContext,
     detect_context,
@@ -88,7 +89,7 @@ class RotatingStatus:
         # Use Rich's Live display with spinner
         spinner = Spinner("dots", text=self._get_renderable(), style=CORAL)
 
-        with Live(
+        with tracing.span("spinner", "ui", context=self.context.value), Live(
             spinner,
             console=self.console,
             refresh_per_second=10,
@@ -11,7 +11,9 @@ from rich.console import Console
 from rich.text import Text
 
 from terryann_cli import __version__
-from terryann_cli.logging import logger
+from terryann_cli.logging import get_logger
+
+logger = get_logger(__name__)
 
 # TerryAnn brand colors (from SVG logo)
 BLUE = "#b8d4e3"       # Soft blue - left circle
@@ -78,7 +80,7 @@ def render_iterm2_image(image_path: Path, width: int = 10) -> bool:
         return True
 
     except Exception as e:
-        logger.debug(f"iTerm2 image rendering failed: {e}")
+        logger.debug("iTerm2 image rendering failed: %s", e)
         return False
 
 
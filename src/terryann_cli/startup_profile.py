@@ -0,0 +1,156 @@
+"""Import-time profile of CLI startup (--profile-startup).
+
+By the time a flag can be parsed, the imports it should measure have
+already happened, so the command is run again in a fresh interpreter with
+`python -X importtime`. The child's per-module timings (written to stderr)
+are parsed into a tree and printed with the most expensive imports first;
+any other stderr output of the child is passed through.
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Optional
+
+from rich.console import Console
+from rich.tree import Tree
+
+PROFILE_FLAG = "--profile-startup"
+IMPORTTIME_PREFIX = "import time:"
+
+# Imports cheaper than this (cumulative) are folded into "n more"
+MIN_CUMULATIVE_MS = 2.0
+MAX_DEPTH = 4
+
+_stderr = Console(stderr=True, highlight=False)
+
+
+@dataclass
+class ImportNode:
+    """One module import and the imports it triggered."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list["ImportNode"] = field(default_factory=list)
+
+
+def parse_importtime(lines: list[str]) -> list[ImportNode]:
+    """
+    Build the import tree from `-X importtime` output.
+
+    A module's line is printed after the lines of the imports it triggered,
+    indented two spaces per level.
+
+    Args:
+        lines: "import time:" lines (others are ignored)
+
+    Returns:
+        Top-level imports in import order
+    """
+    pending: dict[int, list[ImportNode]] = {}
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len(IMPORTTIME_PREFIX):].split("|", 2)
+            node = ImportNode(name.strip(), int(self_us), int(cumulative_us))
+        except ValueError:
+            continue  # the "self [us] | cumulative | imported package" header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        node.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def run_profiled(args: list[str]) -> tuple[int, list[ImportNode]]:
+    """
+    Run the CLI with args in a child interpreter under -X importtime.
+
+    Args:
+        args: Command line without the --profile-startup flag
+
+    Returns:
+        (exit code of the child, its import tree)
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "terryann_cli.main", *args],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    timing_lines = []
+    for line in process.stderr.splitlines():
+        if line.startswith(IMPORTTIME_PREFIX):
+            timing_lines.append(line)
+        else:
+            print(line, file=sys.stderr)
+    return process.returncode, parse_importtime(timing_lines)
+
+
+def _ms(us: int) -> str:
+    return f"{us / 1000:,.1f}ms"
+
+
+def _add_children(tree: Tree, node: ImportNode, depth: int) -> None:
+    children = sorted(node.children, key=lambda child: child.cumulative_us, reverse=True)
+    shown = [c for c in children if c.cumulative_us >= MIN_CUMULATIVE_MS * 1000]
+    if depth >= MAX_DEPTH:
+        shown = []
+    for child in shown:
+        branch = tree.add(_label(child))
+        _add_children(branch, child, depth + 1)
+    hidden = children[len(shown):]
+    if hidden:
+        cost = sum(child.cumulative_us for child in hidden)
+        tree.add(f"[dim]… {len(hidden)} more ({_ms(cost)})[/dim]")
+
+
+def _label(node: ImportNode) -> str:
+    style = ""
+    if node.cumulative_us >= 50_000:
+        style = "red"
+    elif node.cumulative_us >= 10_000:
+        style = "yellow"
+    name = f"[{style}]{node.name}[/{style}]" if style else node.name
+    return f"{name} [bold]{_ms(node.cumulative_us)}[/bold] [dim](self {_ms(node.self_us)})[/dim]"
+
+
+def print_import_tree(roots: list[ImportNode], title: Optional[str] = None) -> None:
+    """Print the import tree on stderr, most expensive imports first."""
+    total = sum(root.cumulative_us for root in roots)
+    tree = Tree(f"[bold]{title or 'Imports'}[/bold] [dim]{_ms(total)} total[/dim]")
+    _add_children(tree, ImportNode("", 0, total, roots), depth=0)
+    _stderr.print(tree)
+
+    # Flat ranking of the packages that are worth making lazy
+    flat: dict[str, int] = {}
+
+    def collect(node: ImportNode) -> None:
+        top = node.name.split(".")[0]
+        flat[top] = flat.get(top, 0) + node.self_us
+        for child in node.children:
+            collect(child)
+
+    for root in roots:
+        collect(root)
+    ranking = sorted(flat.items(), key=lambda item: item[1], reverse=True)[:8]
+    _stderr.print(
+        "[dim]By package (self time): "
+        + " • ".join(f"{name} {_ms(us)}" for name, us in ranking)
+        + "[/dim]"
+    )
+
+
+def profile_startup(argv: list[str]) -> int:
+    """
+    Profile the imports of a CLI invocation and print the tree.
+
+    Args:
+        argv: Command line including the --profile-startup flag
+
+    Returns:
+        Exit code of the profiled invocation
+    """
+    args = [arg for arg in argv if arg != PROFILE_FLAG] or ["--version"]
+    returncode, roots = run_profiled(args)
+    print_import_tree(roots, title=f"terryann {' '.join(args)}")
+    return returncode
@@ -0,0 +1,248 @@
+"""Per-phase latency breakdown of CLI operations (--timings).
+
+An operation (a chat turn, `journeys list`, `journeys show`) collects rows
+of timed segments: one row per HTTP request, split into the phases httpx
+reports through its trace extension, plus rows for local work such as JSON
+decoding and Rich rendering. When the operation ends a compact waterfall
+is printed to stderr.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+from urllib.parse import urlsplit
+
+from rich.console import Console
+from rich.text import Text
+
+from terryann_cli import tracing
+
+if TYPE_CHECKING:
+    import httpx
+
+# httpcore trace events -> waterfall phase. There is no separate DNS event:
+# name resolution is part of "connect".
+TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_connection_init": "send",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "download",
+}
+
+PHASE_STYLES = {
+    "connect": "yellow",
+    "tls": "magenta",
+    "send": "blue",
+    "wait": "cyan",
+    "download": "green",
+    "decode": "white",
+    "build": "bright_blue",
+    "render": "red",
+}
+
+WATERFALL_WIDTH = 40
+
+_enabled = False
+_current: contextvars.ContextVar[Optional["Operation"]] = contextvars.ContextVar(
+    "terryann_timings_operation", default=None
+)
+_stderr = Console(stderr=True, highlight=False)
+
+
+def enable_timings() -> None:
+    """Print a phase waterfall after each operation."""
+    global _enabled
+    _enabled = True
+
+
+def is_timings_enabled() -> bool:
+    """Check if --timings is active."""
+    return _enabled
+
+
+@dataclass
+class Row:
+    """One line of the waterfall: a request or a kind of local work."""
+    label: str
+    # (phase, start, end) in perf_counter seconds
+    segments: list[tuple[str, float, float]] = field(default_factory=list)
+    note: str = ""
+    _open: dict[str, float] = field(default_factory=dict)
+
+    def total(self) -> float:
+        return sum(end - start for _, start, end in self.segments)
+
+
+class RequestTiming:
+    """Collects httpcore trace events for one request into a Row."""
+
+    def __init__(self, row: Row):
+        self.row = row
+
+    async def trace(self, event: str, info: dict[str, Any]) -> None:
+        """httpx trace extension callback."""
+        # e.g. "http11.receive_response_headers.started"
+        _, _, rest = event.partition(".")
+        step, _, state = rest.rpartition(".")
+        phase = TRACE_PHASES.get(step)
+        if phase is None:
+            return
+        now = time.perf_counter()
+        if state == "started":
+            self.row._open[step] = now
+        elif step in self.row._open:
+            self.row.segments.append((phase, self.row._open.pop(step), now))
+
+
+@dataclass
+class Operation:
+    """A user-visible operation and the rows timed within it."""
+    name: str
+    started: float = field(default_factory=time.perf_counter)
+    rows: list[Row] = field(default_factory=list)
+    _phases: dict[str, Row] = field(default_factory=dict)
+
+    def phase_row(self, phase: str) -> Row:
+        row = self._phases.get(phase)
+        if row is None:
+            row = self._phases[phase] = Row(label=phase)
+            self.rows.append(row)
+        return row
+
+
+OperationToken = tuple[Optional[contextvars.Token], Optional[tracing.SpanToken]]
+
+
+def begin(name: str) -> Optional[OperationToken]:
+    """
+    Start timing an operation in the current context.
+
+    The operation is also recorded as a trace span when --trace is active.
+
+    Returns:
+        Token for end(), or None when neither timings nor tracing are on
+    """
+    span = tracing.begin(name, "operation")
+    token = _current.set(Operation(name)) if _enabled else None
+    if token is None and span is None:
+        return None
+    return token, span
+
+
+def end(token: Optional[OperationToken]) -> None:
+    """Finish the operation started by begin() and print its waterfall."""
+    if token is None:
+        return
+    timing_token, span = token
+    tracing.end(span)
+    if timing_token is None:
+        return
+    operation = _current.get()
+    _current.reset(timing_token)
+    if operation is not None and operation.rows:
+        print_waterfall(operation, time.perf_counter())
+
+
+@contextmanager
+def operation(name: str) -> Iterator[None]:
+    """Time everything in the block as one operation."""
+    token = begin(name)
+    try:
+        yield
+    finally:
+        end(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time local work (decode, build, render) within the current operation."""
+    operation = _current.get()
+    with tracing.span(name, "local"):
+        if operation is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            operation.phase_row(name).segments.append((name, started, time.perf_counter()))
+
+
+def trace_extension(method: str, url: str) -> dict[str, Any]:
+    """
+    Request extensions that time a request's phases, if an operation is active.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+
+    Returns:
+        {"trace": callback} to merge into the request's extensions, or {}
+    """
+    operation = _current.get()
+    if operation is None:
+        return {}
+    row = Row(label=f"{method} {urlsplit(url).path}")
+    operation.rows.append(row)
+    return {"trace": RequestTiming(row).trace}
+
+
+def finish_request(request: "httpx.Request", status: int, error: Optional[str] = None) -> None:
+    """Label a timed request's row with its outcome."""
+    timing = getattr(request.extensions.get("trace"), "__self__", None)
+    if isinstance(timing, RequestTiming):
+        timing.row.note = str(status) if status else (error or "failed")
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Format a latency for report tables: "850ms", "1.25s" or "—" if unknown."""
+    if seconds is None:
+        return "—"
+    return f"{seconds:.2f}s" if seconds >= 1 else f"{seconds * 1000:.0f}ms"
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:,.0f}ms" if seconds >= 0.001 else f"{seconds * 1000:.1f}ms"
+
+
+def print_waterfall(operation: Operation, finished: float) -> None:
+    """Print an operation's rows as a waterfall on stderr."""
+    total = max(finished - operation.started, 1e-6)
+    labels = [f"{row.label} {row.note}".strip() for row in operation.rows]
+    label_width = min(36, max(len(label) for label in labels))
+    width = max(10, min(WATERFALL_WIDTH, _stderr.width - label_width - 14))
+    scale = total / width
+
+    _stderr.print(f"[bold]⏱ {operation.name}[/bold] [dim]{_format_ms(total)}[/dim]")
+    for row, label in zip(operation.rows, labels):
+        line = Text("  ")
+        line.append(label[:label_width].ljust(label_width) + "  ")
+        bar = [Text("·", style="dim")] * width
+        for name, start, end in row.segments:
+            first = min(width - 1, int((start - operation.started) / scale))
+            last = max(first + 1, min(width, round((end - operation.started) / scale)))
+            for i in range(first, last):
+                bar[i] = Text("█", style=PHASE_STYLES.get(name, "white"))
+        for cell in bar:
+            line.append_text(cell)
+        line.append(f" {_format_ms(row.total()):>8}")
+        _stderr.print(line, no_wrap=True, overflow="ellipsis")
+
+        phases: dict[str, float] = {}
+        for name, start, end in row.segments:
+            phases[name] = phases.get(name, 0.0) + end - start
+        if len(phases) > 1:
+            breakdown = " · ".join(f"{name} {_format_ms(s)}" for name, s in phases.items())
+            _stderr.print(f"    [dim]{breakdown}[/dim]", no_wrap=True, overflow="ellipsis")
+
+    legend = Text("  ")
+    for name, style in PHASE_STYLES.items():
+        legend.append("█", style=style)
+        legend.append(f" {name} ", style="dim")
+    _stderr.print(legend, no_wrap=True, overflow="ellipsis")
@@ -0,0 +1,227 @@
+"""Chrome / Perfetto trace-event export of a CLI session (--trace out.json).
+
+Spans are kept in a contextvar, so a span started in one asyncio task is
+the parent of spans in tasks (and to_thread threads) it spawns. Each task
+or thread gets its own track; spans on the same track nest by time, and a
+flow arrow links a span to its parent when the parent lives on another
+track. Events are written when the process exits. Load the file in
+chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar
+
+from terryann_cli.logging import get_logger
+
+if TYPE_CHECKING:
+    import asyncio
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """An open span."""
+    name: str
+    category: str
+    start: float
+    track: int
+    parent: Optional["Span"] = None
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class TraceRecorder:
+    """Collects trace events and writes them as trace-event JSON."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events: list[dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": self.pid, "args": {"name": "terryann"}}
+        ]
+        self._lock = threading.Lock()
+        self._task_tracks: "weakref.WeakKeyDictionary[asyncio.Task, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._thread_tracks: dict[int, int] = {}
+        self._ids = itertools.count(1)
+
+    def _us(self, seconds: float) -> float:
+        return round((seconds - self.origin) * 1_000_000, 1)
+
+    def track(self) -> int:
+        """Track ID of the current asyncio task, or of the current thread."""
+        # Not imported here: commands that never start a loop skip asyncio
+        asyncio = sys.modules.get("asyncio")
+        try:
+            task = asyncio.current_task() if asyncio else None
+        except RuntimeError:
+            task = None
+
+        with self._lock:
+            if task is not None:
+                track = self._task_tracks.get(task)
+                if track is None:
+                    track = self._task_tracks[task] = next(self._ids)
+                    self._name_track(track, task.get_name())
+            else:
+                ident = threading.get_ident()
+                track = self._thread_tracks.get(ident)
+                if track is None:
+                    track = self._thread_tracks[ident] = next(self._ids)
+                    self._name_track(track, threading.current_thread().name)
+        return track
+
+    def _name_track(self, track: int, name: str) -> None:
+        self.events.append({
+            "ph": "M",
+            "name": "thread_name",
+            "pid": self.pid,
+            "tid": track,
+            "args": {"name": name},
+        })
+
+    def finish(self, span: Span, end: float) -> None:
+        """Record a finished span (and a flow from a parent on another track)."""
+        events = [{
+            "ph": "X",
+            "name": span.name,
+            "cat": span.category,
+            "ts": self._us(span.start),
+            "dur": round((end - span.start) * 1_000_000, 1),
+            "pid": self.pid,
+            "tid": span.track,
+            "args": span.args,
+        }]
+        if span.parent is not None and span.parent.track != span.track:
+            flow_id = next(self._ids)
+            common = {"name": "spawn", "cat": "flow", "id": flow_id, "pid": self.pid}
+            events.append(
+                {**common, "ph": "s", "ts": self._us(span.start), "tid": span.parent.track}
+            )
+            events.append(
+                {**common, "ph": "f", "bp": "e", "ts": self._us(span.start), "tid": span.track}
+            )
+        with self._lock:
+            self.events.extend(events)
+
+    def save(self) -> None:
+        """Write the trace file."""
+        data = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"argv": sys.argv[1:]},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(data, f)
+        except OSError as e:
+            logger.warning("Could not write trace to %s: %s", self.path, e)
+
+
+_recorder: Optional[TraceRecorder] = None
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "terryann_trace_span", default=None
+)
+
+SpanToken = tuple[contextvars.Token, Span]
+
+
+def start_tracing(path: Path) -> None:
+    """Record spans for the rest of the process and write them to path on exit."""
+    global _recorder
+    _recorder = TraceRecorder(path)
+    root = begin(" ".join(["terryann", *sys.argv[1:]]), "cli")
+
+    def finish():
+        end(root)
+        _recorder.save()
+
+    atexit.register(finish)
+
+
+def is_tracing_enabled() -> bool:
+    """Check if --trace is active."""
+    return _recorder is not None
+
+
+def begin(name: str, category: str = "cli", **args: Any) -> Optional[SpanToken]:
+    """
+    Open a span as a child of the current one.
+
+    Returns:
+        Token for end(), or None when tracing is off
+    """
+    if _recorder is None:
+        return None
+    span = Span(
+        name=name,
+        category=category,
+        start=time.perf_counter(),
+        track=_recorder.track(),
+        parent=_current.get(),
+        args=args,
+    )
+    return _current.set(span), span
+
+
+def end(token: Optional[SpanToken]) -> None:
+    """Close a span opened with begin()."""
+    if token is None:
+        return
+    context_token, span = token
+    try:
+        _current.reset(context_token)
+    except ValueError:
+        # Closed from another context (e.g. a generator finalized elsewhere)
+        pass
+    _recorder.finish(span, time.perf_counter())
+
+
+@contextmanager
+def span(name: str, category: str = "cli", **args: Any) -> Iterator[None]:
+    """Record the block as a span."""
+    token = begin(name, category, **args)
+    try:
+        yield
+    finally:
+        end(token)
+
+
+def annotate(**args: Any) -> None:
+    """Add arguments (status, sizes, ...) to the current span."""
+    current = _current.get()
+    if current is not None:
+        current.args.update(args)
+
+
+def traced(name: str, category: str = "cli") -> Callable[[F], F]:
+    """Decorator recording each call of a function as a span."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _recorder is None:
+                return fn(*args, **kwargs)
+            with span(name, category):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -0,0 +1,649 @@
+"""Shared HTTP transport for TerryAnn CLI.
+
+Every gateway, backend and help call goes through one long-lived
+httpx.AsyncClient so that chat turns reuse keep-alive connections
+(and HTTP/2 streams when available) instead of paying DNS, TCP and
+TLS setup on each request.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import re
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+from urllib.parse import urlsplit
+
+import httpx
+
+from terryann_cli import runtime, timings, tracing
+from terryann_cli.breaker import CircuitBreaker, LatencyTracker, load_health, save_health
+from terryann_cli.config import Config, load_config
+from terryann_cli.history import LatencyHistory
+from terryann_cli.http_cache import ConditionalCache
+from terryann_cli.logging import get_logger
+from terryann_cli.retry import RetryPolicy, send_with_retry
+from terryann_cli.singleflight import SingleFlight
+
+logger = get_logger(__name__)
+# One record per request; sample it with [logging.sample] "transport.requests"
+request_logger = get_logger("transport.requests")
+
+# Used when a call site does not pass its own timeout
+DEFAULT_TIMEOUT = 30.0
+
+# Methods that get an Idempotency-Key so retries can't apply twice
+IDEMPOTENCY_KEY_METHODS = ("POST", "PUT", "PATCH")
+
+# Hedge delay for endpoints without enough latency samples for a p95
+DEFAULT_HEDGE_DELAY = 1.0
+
+
+# Path segments that identify a resource (UUIDs, long hex/numeric IDs)
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[0-9a-fA-F-]{8,}$")
+
+
+@dataclass
+class RequestRecord:
+    """What one logical request (including retries) cost on the wire."""
+
+    method: str
+    url: str
+    endpoint: str
+    status: int  # 0 if no response was received
+    duration: float  # seconds
+    bytes_sent: int  # request body as sent (after compression)
+    bytes_received: int  # response body on the wire (before decoding)
+    bytes_decoded: int  # response body after content decoding
+    content_encoding: str = ""
+    error: Optional[str] = None
+
+
+def endpoint_label(method: str, url: str) -> str:
+    """Group a request under its endpoint, e.g. "GET /gateway/journeys/{id}"."""
+    segments = [
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in urlsplit(str(url)).path.split("/")
+    ]
+    return f"{method.upper()} {'/'.join(segments) or '/'}"
+
+
+def _format_bytes(count: int) -> str:
+    """Format a byte count for debug logs."""
+    if count < 1024:
+        return f"{count} B"
+    return f"{count / 1024:.1f} KB"
+
+
+def _http2_available() -> bool:
+    """Check if the optional h2 package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HTTPPool:
+    """
+    Process-wide pool of keep-alive connections shared by all API calls.
+
+    The underlying client is created lazily on first use. Connections are
+    bound to the event loop that opened them, so a new client is built if
+    the pool is used from a different loop.
+    """
+
+    def __init__(self, config: Config, persist: bool = True):
+        """
+        Initialize the pool.
+
+        Args:
+            config: CLI configuration with the [http] pool settings
+            persist: Load and save endpoint health and record latency
+                history in ~/.terryann (off for pools whose traffic
+                shouldn't shape later runs or show up in `terryann stats`)
+        """
+        self.config = config
+        self.persist = persist
+        self.retry_policy = RetryPolicy.from_config(config)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._inflight = SingleFlight()
+        self.cache = ConditionalCache()
+        self.observers: list[Callable[[RequestRecord], None]] = []
+        self.totals = {"requests": 0, "bytes_received": 0, "bytes_decoded": 0}
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(
+            failure_threshold=config.breaker_failure_threshold,
+            reset_timeout=config.breaker_reset_timeout,
+        )
+        self.history: Optional[LatencyHistory] = None
+        if persist:
+            load_health(self.latency, self.breaker)
+            if config.history_enabled:
+                self.history = LatencyHistory(capacity=config.history_max_records)
+                self.observers.append(self.history.observe)
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 multiplexing is enabled for this pool."""
+        return self.config.http2 and _http2_available()
+
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                logger.debug("Event loop changed, dropping stale HTTP pool")
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+            self._loop = loop
+            self._host_slots = {}
+            logger.debug(
+                "Opened shared HTTP pool (http2=%s, max_connections=%d, accept-encoding=%s)",
+                self.http2,
+                self.config.max_connections,
+                self._client.headers.get("accept-encoding"),
+            )
+        return self._client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests to one host."""
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.config.max_requests_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    def _build_request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        timeout: Optional[float],
+        circuit: bool,
+        kwargs: dict[str, Any],
+    ) -> httpx.Request:
+        """Build a request, adding an Idempotency-Key to mutations.
+
+        Raises:
+            CircuitOpenError: If the target host's circuit is open
+        """
+        if circuit:
+            self.breaker.before_request(urlsplit(url).netloc)
+
+        timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+        if self.config.adaptive_timeouts:
+            timeout = self.latency.timeout_for(endpoint_label(method, url), timeout)
+        trace = timings.trace_extension(method, url)
+        if trace:
+            kwargs["extensions"] = {**(kwargs.get("extensions") or {}), **trace}
+        if method.upper() in IDEMPOTENCY_KEY_METHODS:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if not any(name.lower() == "idempotency-key" for name in headers):
+                headers["Idempotency-Key"] = str(uuid.uuid4())
+            kwargs["headers"] = headers
+
+        if self.config.compress_requests and kwargs.get("json") is not None:
+            body = json.dumps(kwargs["json"]).encode("utf-8")
+            if len(body) >= self.config.compress_min_bytes:
+                # Large bodies (e.g. long zip_codes lists) go out gzipped
+                del kwargs["json"]
+                kwargs["content"] = gzip.compress(body)
+                headers = dict(kwargs.pop("headers", None) or {})
+                headers["Content-Type"] = "application/json"
+                headers["Content-Encoding"] = "gzip"
+                kwargs["headers"] = headers
+                logger.debug(
+                    "Compressed request body %s -> %s",
+                    _format_bytes(len(body)),
+                    _format_bytes(len(kwargs["content"])),
+                )
+
+        return client.build_request(method, url, timeout=timeout, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        retry: bool = True,
+        circuit: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request through the shared pool.
+
+        Transient failures are retried according to the [retry] policy.
+        POST/PUT/PATCH requests carry an Idempotency-Key header that stays
+        the same across retries.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            timeout: Per-request timeout in seconds (default: DEFAULT_TIMEOUT);
+                with adaptive timeouts this is the upper bound
+            retry: Whether to retry transient failures
+            circuit: Whether an open circuit breaker may reject the request
+                (health checks pass False so they act as probes)
+            **kwargs: Passed through to httpx.AsyncClient.build_request
+
+        Returns:
+            The httpx response (body already read)
+        """
+        client = self.client()
+        request = self._build_request(client, method, url, timeout, circuit, kwargs)
+        policy = self.retry_policy if retry else RetryPolicy(max_attempts=1)
+
+        async def send() -> httpx.Response:
+            async with self._host_slot(url):
+                return await client.send(request)
+
+        started = time.perf_counter()
+        with tracing.span(endpoint_label(method, url), "http", url=url):
+            try:
+                response = await send_with_retry(send, policy, f"{method} {request.url.path}")
+            except Exception as e:
+                self._record(
+                    request,
+                    None,
+                    started,
+                    error=type(e).__name__,
+                    timed_out=isinstance(e, httpx.TimeoutException),
+                )
+                raise
+            except BaseException:
+                # Cancelled (e.g. the slower half of a hedged read): nothing is
+                # recorded, so hand a half-open probe back to the next request
+                if circuit:
+                    self.breaker.release_probe(request.url.netloc.decode("ascii"))
+                raise
+            self._record(request, response, started)
+        return response
+
+    def rank(self, urls: Sequence[str]) -> list[str]:
+        """
+        Order equivalent URLs on different endpoints, best first.
+
+        Endpoints with an open circuit go last, the rest are ordered by
+        their latency score. Endpoints without a score keep their
+        configured order behind the scored ones.
+        """
+
+        def sort_key(item: tuple[int, str]) -> tuple[bool, float, int]:
+            index, url = item
+            host = urlsplit(url).netloc
+            score = self.latency.host_scores.get(host, float("inf"))
+            return (self.breaker.is_open(host), score, index)
+
+        return [url for _, url in sorted(enumerate(urls), key=sort_key)]
+
+    async def hedged_request(
+        self,
+        method: str,
+        urls: Sequence[str],
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send an idempotent request to the best of several equivalent URLs.
+
+        If the best endpoint hasn't answered by its p95 latency, a duplicate
+        goes to the next one and whichever answers first wins; the loser is
+        cancelled. Endpoints that fail are skipped immediately.
+
+        Args:
+            method: HTTP method (must be idempotent, e.g. GET)
+            urls: The same resource on each endpoint
+            **kwargs: Passed through to request()
+
+        Returns:
+            The first successful response (or the last failure's response)
+        """
+        remaining = self.rank(urls)
+        if len(remaining) == 1 or not self.config.hedge_requests:
+            return await self.request(method, remaining[0], **kwargs)
+
+        # Failing over to another endpoint replaces retrying the same one
+        kwargs.setdefault("retry", False)
+        hedge_delay = (
+            self.latency.percentile(endpoint_label(method, remaining[0]), 95)
+            or DEFAULT_HEDGE_DELAY
+        )
+        tasks: dict[asyncio.Task, str] = {}
+        last_response: Optional[httpx.Response] = None
+        last_error: Optional[BaseException] = None
+
+        def launch() -> None:
+            url = remaining.pop(0)
+            tasks[asyncio.create_task(self.request(method, url, **kwargs))] = url
+
+        launch()
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    logger.debug("No answer within %.0fms, hedging", hedge_delay * 1000)
+                    launch()
+                    continue
+
+                for task in done:
+                    url = tasks.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        continue
+                    response = task.result()
+                    if response.status_code >= 500 and (tasks or remaining):
+                        last_response = response
+                        continue
+                    if tasks:
+                        logger.debug("Hedged request won by %s", urlsplit(url).netloc)
+                    return response
+
+                if not tasks and remaining:
+                    # Everything in flight failed - fail over right away
+                    launch()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    async def get_json(
+        self,
+        url: str | Sequence[str],
+        *,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        conditional: bool = False,
+    ) -> Any:
+        """
+        GET a JSON resource, coalescing identical concurrent requests.
+
+        Concurrent calls with the same URL, params and headers share one
+        network round trip and receive the same parsed object, so callers
+        must not mutate the result.
+
+        With conditional=True, validators from the last response are sent
+        and a 304 is answered from the local copy without re-parsing.
+
+        Args:
+            url: Absolute request URL, or the same resource on several
+                endpoints (primary first) to hedge across
+            params: Query parameters
+            headers: Request headers (part of the coalescing key)
+            timeout: Per-request timeout in seconds (default: DEFAULT_TIMEOUT)
+            conditional: Use the ETag / Last-Modified cache
+
+        Returns:
+            The decoded JSON body
+
+        Raises:
+            httpx.HTTPStatusError: If the response is an error status
+        """
+        urls = [url] if isinstance(url, str) else list(url)
+        key = (
+            tuple(urls),
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+
+        async def fetch() -> Any:
+            entry = None
+            request_headers = dict(headers or {})
+            if conditional:
+                # Keyed on path rather than host, so mirrors share entries
+                cache_key = self.cache.key(urlsplit(urls[0]).path, key[1:])
+                entry = self.cache.lookup(cache_key)
+                if entry is not None:
+                    request_headers.update(entry.validators())
+
+            response = await self.hedged_request(
+                "GET", urls, params=params, headers=request_headers, timeout=timeout
+            )
+            if response.status_code == 304 and entry is not None:
+                self.cache.hits += 1
+                logger.debug("Not modified, serving cached %s", response.url.path)
+                return entry.body
+            response.raise_for_status()
+            with timings.phase("decode"):
+                body = response.json()
+
+            if conditional:
+                self.cache.misses += 1
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                if etag or last_modified:
+                    self.cache.store(cache_key, etag, last_modified, body)
+            return body
+
+        return await self._inflight.do(key, fetch)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        retry: bool = True,
+        circuit: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a request through the shared pool without reading the body.
+
+        Only failures before the response headers arrive are retried; once
+        the body starts streaming, errors are raised to the caller.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            timeout: Per-request timeout in seconds (default: DEFAULT_TIMEOUT)
+            retry: Whether to retry transient failures
+            circuit: Whether an open circuit breaker may reject the request
+                (health checks pass False so they act as probes)
+            **kwargs: Passed through to httpx.AsyncClient.build_request
+
+        Yields:
+            The httpx response, with the body available via aiter_* methods
+        """
+        client = self.client()
+        request = self._build_request(client, method, url, timeout, circuit, kwargs)
+        policy = self.retry_policy if retry else RetryPolicy(max_attempts=1)
+
+        started = time.perf_counter()
+        span = tracing.begin(endpoint_label(method, url), "http", url=url, stream=True)
+        try:
+            async with self._host_slot(url):
+                try:
+                    response = await send_with_retry(
+                        lambda: client.send(request, stream=True),
+                        policy,
+                        f"{method} {request.url.path}",
+                    )
+                except Exception as e:
+                    self._record(
+                        request,
+                        None,
+                        started,
+                        error=type(e).__name__,
+                        timed_out=isinstance(e, httpx.TimeoutException),
+                    )
+                    tracing.end(span)
+                    raise
+                bytes_decoded = 0
+                aiter_bytes = response.aiter_bytes
+
+                async def counting_aiter_bytes(*args: Any, **kw: Any) -> AsyncIterator[bytes]:
+                    # aiter_text/aiter_lines read through this, so decoded size is counted
+                    nonlocal bytes_decoded
+                    async for chunk in aiter_bytes(*args, **kw):
+                        bytes_decoded += len(chunk)
+                        yield chunk
+
+                response.aiter_bytes = counting_aiter_bytes
+                try:
+                    yield response
+                finally:
+                    await response.aclose()
+                    self._record(request, response, started, bytes_decoded=bytes_decoded)
+                    tracing.end(span)
+        except BaseException:
+            # Cancelled or abandoned before a result was recorded (a no-op
+            # after _record): hand a half-open probe back to the next request
+            if circuit:
+                self.breaker.release_probe(request.url.netloc.decode("ascii"))
+            raise
+
+    def _record(
+        self,
+        request: httpx.Request,
+        response: Optional[httpx.Response],
+        started: float,
+        bytes_decoded: Optional[int] = None,
+        error: Optional[str] = None,
+        timed_out: bool = False,
+    ) -> None:
+        """Build a RequestRecord for a finished request and notify observers."""
+        if bytes_decoded is None:
+            bytes_decoded = len(response.content) if response is not None else 0
+
+        record = RequestRecord(
+            method=request.method,
+            url=str(request.url),
+            endpoint=endpoint_label(request.method, request.url),
+            status=response.status_code if response is not None else 0,
+            duration=time.perf_counter() - started,
+            bytes_sent=int(request.headers.get("content-length", 0)),
+            bytes_received=response.num_bytes_downloaded if response is not None else 0,
+            bytes_decoded=bytes_decoded,
+            content_encoding=response.headers.get("content-encoding", "") if response else "",
+            error=error,
+        )
+
+        timings.finish_request(request, record.status, error)
+        tracing.annotate(
+            status=record.status,
+            error=record.error,
+            bytes_received=record.bytes_received,
+            bytes_decoded=record.bytes_decoded,
+        )
+
+        host = request.url.netloc.decode("ascii")
+        if record.status == 0 or record.status >= 500:
+            self.breaker.record_failure(host)
+            self.latency.observe_host(host, None)
+            attempted = (request.extensions.get("timeout") or {}).get("read")
+            if timed_out and attempted:
+                # Sampled at the timeout it was given, so the next one is longer
+                self.latency.observe(record.endpoint, attempted)
+        else:
+            self.breaker.record_success(host)
+            self.latency.observe(record.endpoint, record.duration)
+            self.latency.observe_host(host, record.duration)
+
+        self.totals["requests"] += 1
+        self.totals["bytes_received"] += record.bytes_received
+        self.totals["bytes_decoded"] += record.bytes_decoded
+        if request_logger.isEnabledFor(logging.DEBUG):
+            # Guarded: the byte counts are formatted before the call
+            request_logger.debug(
+                "%s %s in %.0fms: sent %s, received %s wire / %s decoded%s",
+                record.endpoint,
+                record.status or record.error,
+                record.duration * 1000,
+                _format_bytes(record.bytes_sent),
+                _format_bytes(record.bytes_received),
+                _format_bytes(record.bytes_decoded),
+                f" ({record.content_encoding})" if record.content_encoding else "",
+            )
+
+        for observer in self.observers:
+            try:
+                observer(record)
+            except Exception as e:
+                logger.debug("Request observer failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections and persist endpoint health and history."""
+        if self.persist:
+            save_health(self.latency, self.breaker)
+        if self.history is not None:
+            self.history.flush()
+        hit_ratio = self.cache.hit_ratio()
+        if hit_ratio is not None:
+            logger.debug(
+                "Conditional cache: %d hits, %d misses (%.0f%% hit ratio)",
+                self.cache.hits,
+                self.cache.misses,
+                hit_ratio * 100,
+            )
+        if self._client is not None:
+            await self._client.aclose()
+            logger.debug(
+                "Closed shared HTTP pool after %d requests (%s wire / %s decoded)",
+                self.totals["requests"],
+                _format_bytes(self.totals["bytes_received"]),
+                _format_bytes(self.totals["bytes_decoded"]),
+            )
+        self._client = None
+        self._loop = None
+        self._host_slots = {}
+
+
+# Process-wide pool, created on first use
+_pool: Optional[HTTPPool] = None
+_close_registered = False
+
+
+def get_pool() -> HTTPPool:
+    """Get the process-wide HTTP pool (closed by the runtime at exit)."""
+    global _pool, _close_registered
+    if _pool is None:
+        _pool = HTTPPool(load_config())
+        if not _close_registered:
+            runtime.on_shutdown(close_pool)
+            _close_registered = True
+    return _pool
+
+
+def set_pool(pool: Optional[HTTPPool]) -> Optional[HTTPPool]:
+    """
+    Replace the process-wide HTTP pool (e.g. with one tuned for load tests).
+
+    Args:
+        pool: Pool to install, or None to create a default one on next use
+
+    Returns:
+        The previously installed pool
+    """
+    global _pool
+    previous, _pool = _pool, pool
+    return previous
+
+
+async def close_pool() -> None:
+    """Close the process-wide HTTP pool if it was opened."""
+    if _pool is not None:
+        await _pool.aclose()
@@ -0,0 +1,67 @@
+"""Adaptive timeouts can't collapse below what slow replies need."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from terryann_cli.breaker import TIMEOUT_FLOOR, LatencyTracker
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.transport import HTTPPool, endpoint_label
+
+ENDPOINT = "POST /gateway/message"
+
+
+def test_timeout_without_samples_is_the_ceiling():
+    assert LatencyTracker().timeout_for(ENDPOINT, 180.0) == 180.0
+
+
+def test_fast_replies_keep_half_the_ceiling():
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe(ENDPOINT, 0.3)
+
+    assert tracker.timeout_for(ENDPOINT, 180.0) == 90.0
+
+
+def test_short_ceilings_keep_the_fixed_floor():
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe(ENDPOINT, 0.1)
+
+    assert tracker.timeout_for(ENDPOINT, 8.0) == TIMEOUT_FLOOR
+
+
+def test_timeout_grows_back_after_timeouts():
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe(ENDPOINT, 10.0)
+    shrunk = tracker.timeout_for(ENDPOINT, 180.0)
+    # A slow reply timed out at the derived timeout
+    tracker.observe(ENDPOINT, shrunk)
+
+    assert tracker.timeout_for(ENDPOINT, 180.0) > shrunk
+
+
+@pytest.fixture
+async def slow_server():
+    async def handle(request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        await asyncio.sleep(1.0)
+        await response.send_json(200, {})
+
+    http = await serve(handle, "127.0.0.1", 0)
+    async with http:
+        yield f"http://127.0.0.1:{http.sockets[0].getsockname()[1]}"
+
+
+async def test_timed_out_request_is_sampled_at_its_timeout(slow_server):
+    pool = HTTPPool(Config(), persist=False)
+    url = f"{slow_server}/gateway/message"
+    try:
+        with pytest.raises(httpx.ReadTimeout):
+            await pool.request("POST", url, json={}, timeout=0.2, retry=False)
+    finally:
+        await pool.aclose()
+
+    assert pool.latency.samples[endpoint_label("POST", url)] == [0.2]
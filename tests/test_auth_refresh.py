@@ -0,0 +1,62 @@
+"""A token refresh only signs the user out when Supabase rejects the token."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from terryann_cli import auth
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.transport import HTTPPool, set_pool
+
+
+@pytest.fixture
+async def supabase(tmp_path, monkeypatch):
+    """Stand-in Supabase whose token endpoint answers with a chosen status."""
+    reply = {"status": 200}
+
+    async def handle(request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        await response.send_json(reply["status"], {"msg": f"status {reply['status']}"})
+
+    http = await serve(handle, "127.0.0.1", 0)
+    monkeypatch.setattr(auth, "SUPABASE_URL", f"http://127.0.0.1:{http.sockets[0].getsockname()[1]}")
+    monkeypatch.setattr(auth, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(auth, "CREDENTIALS_FILE", tmp_path / "credentials.json")
+    pool = HTTPPool(Config(retry_max_attempts=1), persist=False)
+    previous = set_pool(pool)
+    async with http:
+        yield reply
+    await pool.aclose()
+    set_pool(previous)
+
+
+def _stored_credentials() -> auth.AuthCredentials:
+    creds = auth.AuthCredentials(
+        access_token="access",
+        refresh_token="refresh",
+        user_id="user-1",
+        email="dev@example.com",
+        first_name="Dev",
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=2),
+    )
+    auth.save_credentials(creds)
+    return creds
+
+
+@pytest.mark.parametrize("status", [429, 404, 500])
+async def test_transient_errors_keep_credentials(supabase, status):
+    supabase["status"] = status
+    creds = _stored_credentials()
+
+    user = await auth.refresh_credentials(creds)
+
+    assert user is not None and user.access_token == "access"
+    assert auth.load_credentials() is not None
+
+
+@pytest.mark.parametrize("status", [400, 401, 403])
+async def test_rejected_refresh_token_clears_credentials(supabase, status):
+    supabase["status"] = status
+
+    assert await auth.refresh_credentials(_stored_credentials()) is None
+    assert auth.load_credentials() is None
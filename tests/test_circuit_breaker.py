@@ -0,0 +1,80 @@
+"""A cancelled half-open probe doesn't leave the circuit stuck open."""
+
+import asyncio
+
+import pytest
+
+from terryann_cli.breaker import HALF_OPEN
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.transport import HTTPPool
+
+
+class Server:
+    """Stand-in host whose first request hangs until cancelled."""
+
+    def __init__(self):
+        self.requests = 0
+        self.url = ""
+        self.host = ""
+
+    async def handle(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        self.requests += 1
+        if self.requests == 1:
+            await asyncio.sleep(30)
+        await response.send_json(200, {})
+
+
+@pytest.fixture
+async def server():
+    stand_in = Server()
+    http = await serve(stand_in.handle, "127.0.0.1", 0)
+    stand_in.host = f"127.0.0.1:{http.sockets[0].getsockname()[1]}"
+    stand_in.url = f"http://{stand_in.host}/health"
+    async with http:
+        yield stand_in
+
+
+@pytest.fixture
+async def pool(server):
+    http_pool = HTTPPool(Config(), persist=False)
+    # Open the circuit, then let its cool-down pass
+    for _ in range(http_pool.breaker.failure_threshold):
+        http_pool.breaker.record_failure(server.host)
+    http_pool.breaker.states[server.host].opened_at = 0.0
+    yield http_pool
+    await http_pool.aclose()
+
+
+async def _cancel_after_send(task: asyncio.Task, server: Server) -> None:
+    while server.requests == 0:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_cancelled_probe_is_released(pool, server):
+    probe = asyncio.create_task(pool.request("GET", server.url, retry=False))
+    await _cancel_after_send(probe, server)
+
+    circuit = pool.breaker.states[server.host]
+    assert circuit.state == HALF_OPEN and not circuit.probing
+    assert not pool.breaker.is_open(server.host)
+
+    response = await pool.request("GET", server.url, retry=False)
+    assert response.status_code == 200
+    assert server.host not in pool.breaker.states
+
+
+async def test_cancelled_streamed_probe_is_released(pool, server):
+    async def read_stream() -> None:
+        async with pool.stream("GET", server.url, retry=False) as response:
+            await response.aread()
+
+    probe = asyncio.create_task(read_stream())
+    await _cancel_after_send(probe, server)
+
+    assert not pool.breaker.is_open(server.host)
+    response = await pool.request("GET", server.url, retry=False)
+    assert response.status_code == 200
@@ -0,0 +1,45 @@
+"""The on-disk conditional cache is pruned by age and entry count."""
+
+import os
+import time
+
+from terryann_cli.http_cache import ConditionalCache
+
+
+def _age(cache: ConditionalCache, key: str, seconds: float) -> None:
+    then = time.time() - seconds
+    os.utime(cache.directory / f"{key}.bin", (then, then))
+
+
+def test_prune_keeps_the_most_recently_used_entries(tmp_path):
+    cache = ConditionalCache(tmp_path, max_entries=3)
+    for i in range(5):
+        cache.store(f"k{i}", f'"{i}"', None, {"i": i})
+        _age(cache, f"k{i}", 100 - i)
+    # Read from disk by a later process, so k0 counts as recently used
+    assert ConditionalCache(tmp_path).lookup("k0").body == {"i": 0}
+
+    assert cache.prune() == 2
+    assert sorted(path.stem for path in tmp_path.glob("*.bin")) == ["k0", "k3", "k4"]
+
+
+def test_prune_drops_expired_entries_and_stale_temp_files(tmp_path):
+    cache = ConditionalCache(tmp_path, max_age=3600)
+    cache.store("old", '"1"', None, [1])
+    cache.store("new", '"2"', None, [2])
+    _age(cache, "old", 7200)
+    stale = tmp_path / "crashed.tmp"
+    stale.write_bytes(b"")
+    os.utime(stale, (time.time() - 600, time.time() - 600))
+
+    assert cache.prune() == 2
+    assert [path.name for path in tmp_path.iterdir()] == ["new.bin"]
+
+
+def test_first_write_prunes(tmp_path):
+    ConditionalCache(tmp_path).store("old", '"1"', None, [1])
+    _age(ConditionalCache(tmp_path), "old", 60 * 24 * 3600)
+
+    ConditionalCache(tmp_path).store("new", '"2"', None, [2])
+
+    assert [path.name for path in tmp_path.iterdir()] == ["new.bin"]
@@ -0,0 +1,103 @@
+"""The shared HTTP server bounds what one client can make it read or wait for."""
+
+import asyncio
+import gzip
+
+import httpx
+import pytest
+
+from terryann_cli import http_server
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.proxy import GatewayProxy
+
+
+async def _echo(request: HTTPRequest, response: HTTPResponseWriter) -> None:
+    await response.send_json(200, {"bytes": len(request.body)})
+
+
+@pytest.fixture
+async def address():
+    http = await serve(_echo, "127.0.0.1", 0)
+    async with http:
+        yield "127.0.0.1", http.sockets[0].getsockname()[1]
+
+
+async def _exchange(address: tuple[str, int], data: bytes) -> bytes:
+    """Send raw bytes and read until the server closes the connection."""
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(data)
+    await writer.drain()
+    try:
+        return await asyncio.wait_for(reader.read(), 5)
+    finally:
+        writer.close()
+
+
+async def test_oversized_body_is_refused_before_reading(address):
+    head = f"POST / HTTP/1.1\r\nContent-Length: {http_server.MAX_BODY_BYTES + 1}\r\n\r\n"
+
+    reply = await _exchange(address, head.encode("ascii"))
+
+    assert reply.startswith(b"HTTP/1.1 413 ")
+
+
+async def test_gzip_bomb_is_refused(address):
+    body = gzip.compress(b"\0" * (http_server.MAX_BODY_BYTES + 1))
+    head = f"POST / HTTP/1.1\r\nContent-Encoding: gzip\r\nContent-Length: {len(body)}\r\n\r\n"
+
+    reply = await _exchange(address, head.encode("ascii") + body)
+
+    assert reply.startswith(b"HTTP/1.1 413 ")
+
+
+async def test_gzip_body_is_decoded(address):
+    body = gzip.compress(b"x" * 5000)
+    head = f"POST / HTTP/1.1\r\nContent-Encoding: gzip\r\nContent-Length: {len(body)}\r\n"
+
+    reply = await _exchange(address, head.encode("ascii") + b"Connection: close\r\n\r\n" + body)
+
+    assert reply.startswith(b"HTTP/1.1 200 ")
+    assert reply.endswith(b'{"bytes": 5000}')
+
+
+async def test_slow_headers_time_out(address, monkeypatch):
+    monkeypatch.setattr(http_server, "HEADER_TIMEOUT", 0.1)
+
+    reply = await _exchange(address, b"GET / HTTP/1.1\r\nHost: x\r\n")
+
+    assert reply.startswith(b"HTTP/1.1 408 ")
+
+
+async def test_idle_keep_alive_connection_is_closed(address, monkeypatch):
+    monkeypatch.setattr(http_server, "KEEPALIVE_TIMEOUT", 0.1)
+
+    reply = await _exchange(address, b"GET / HTTP/1.1\r\n\r\n")
+
+    # One response, then the server hangs up on the idle connection
+    assert reply.count(b"HTTP/1.1 200 ") == 1
+
+
+async def test_proxy_does_not_retry_upstream_errors():
+    hits = []
+
+    async def unavailable(request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        hits.append(request.path)
+        await response.send_json(503, {"detail": "Unavailable"})
+
+    upstream = await serve(unavailable, "127.0.0.1", 0)
+    upstream_url = f"http://127.0.0.1:{upstream.sockets[0].getsockname()[1]}"
+    proxy = GatewayProxy(Config(), [upstream_url])
+    http = await serve(proxy.handle, "127.0.0.1", 0)
+    try:
+        async with upstream, http:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    f"http://127.0.0.1:{http.sockets[0].getsockname()[1]}/gateway/message",
+                    json={"message": "hello"},
+                )
+    finally:
+        await proxy.aclose()
+
+    assert response.status_code == 503
+    assert hits == ["/gateway/message"]
@@ -0,0 +1,106 @@
+"""Journey job ledger: expired jobs, clearing and job-mode support."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from terryann_cli import jobs
+from terryann_cli.client import GatewayClient
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.transport import HTTPPool, set_pool
+
+JOURNEY_PARAMS = {"name": "Test", "campaign_type": "aep_acquisition", "zip_codes": ["33101"]}
+
+
+@pytest.fixture(autouse=True)
+def ledger(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(jobs, "JOBS_FILE", tmp_path / "jobs.json")
+    monkeypatch.setattr(jobs, "JOB_SUPPORT_FILE", tmp_path / "job_support.json")
+    monkeypatch.setattr(jobs, "_unsupported_backends", None)
+
+
+class Backend:
+    """Stand-in backend without job endpoints that counts requests by path."""
+
+    def __init__(self):
+        self.paths: list[str] = []
+        self.url = ""
+
+    async def handle(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        self.paths.append(request.path)
+        if request.path == "/journey/flowchart/create-v2":
+            await response.send_json(200, {"id": "journey-1"})
+        else:
+            await response.send_json(404, {"detail": "Not found"})
+
+
+@pytest.fixture
+async def client():
+    backend = Backend()
+    http = await serve(backend.handle, "127.0.0.1", 0)
+    backend.url = f"http://127.0.0.1:{http.sockets[0].getsockname()[1]}"
+    pool = HTTPPool(Config(), persist=False)
+    previous = set_pool(pool)
+    async with http:
+        yield GatewayClient(Config(gateway_url=backend.url, backend_url=backend.url)), backend
+    await pool.aclose()
+    set_pool(previous)
+
+
+def _job(job_id: str, status: str, age: timedelta) -> jobs.JourneyJob:
+    submitted = datetime.now(timezone.utc) - age
+    return jobs.JourneyJob(
+        job_id=job_id,
+        backend_url="http://backend",
+        name=job_id,
+        campaign_type="aep_acquisition",
+        submitted_at=submitted.isoformat(),
+        status=status,
+    )
+
+
+async def test_job_unknown_to_backend_is_marked_expired(client):
+    gateway, backend = client
+    jobs.save_jobs([_job("gone", "running", timedelta(minutes=5))])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await gateway.wait_for_journey_job("gone", backend.url)
+
+    (job,) = jobs.load_jobs()
+    assert job.status == jobs.EXPIRED
+    assert not jobs.has_recent_pending_jobs()
+
+
+async def test_unsupported_job_mode_is_remembered(client):
+    gateway, backend = client
+
+    assert await gateway.create_journey(JOURNEY_PARAMS) == {"id": "journey-1"}
+    assert await gateway.create_journey(JOURNEY_PARAMS) == {"id": "journey-1"}
+
+    assert backend.paths.count("/journey/flowchart/jobs") == 1
+    assert backend.paths.count("/journey/flowchart/create-v2") == 2
+    assert not jobs.jobs_supported(backend.url)
+
+
+def test_clear_drops_abandoned_pending_jobs():
+    jobs.save_jobs([
+        _job("fresh", "running", timedelta(minutes=5)),
+        _job("abandoned", "queued", timedelta(days=2)),
+        _job("done", "completed", timedelta(hours=1)),
+    ])
+
+    assert jobs.clear_finished_jobs() == 2
+    assert [job.job_id for job in jobs.load_jobs()] == ["fresh"]
+
+
+def test_save_prunes_old_abandoned_jobs():
+    jobs.save_jobs([
+        _job("recent", "completed", timedelta(days=3)),
+        _job("old", "completed", timedelta(days=40)),
+        _job("lost", "running", timedelta(days=40)),
+    ])
+
+    assert [job.job_id for job in jobs.load_jobs()] == ["recent"]
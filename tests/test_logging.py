@@ -0,0 +1,75 @@
+"""Log sampling keeps every Nth DEBUG/INFO record and never drops warnings."""
+
+import logging
+
+import pytest
+
+from terryann_cli.logging import SamplingFilter
+
+
+class ListHandler(logging.Handler):
+    """Collects the messages that pass its filters."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def synthetic():
+    """A throwaway logger tree outside "terryann", sampled at 0.25."""
+    logger = logging.getLogger("synthetic")
+    handler = ListHandler()
+    handler.addFilter(SamplingFilter({"synthetic": 0.25, "synthetic.muted": 0.0}))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger, handler
+    logger.removeHandler(handler)
+
+
+def test_keeps_every_nth_record(synthetic):
+    logger, handler = synthetic
+    for i in range(10):
+        logger.debug("tick %d", i)
+
+    assert handler.messages == ["tick 0", "tick 4", "tick 8"]
+
+
+def test_warnings_are_never_sampled(synthetic):
+    logger, handler = synthetic
+    for i in range(3):
+        logger.info("info %d", i)
+        logger.warning("warning %d", i)
+
+    assert handler.messages == ["info 0", "warning 0", "warning 1", "warning 2"]
+
+
+def test_rate_applies_to_children(synthetic):
+    logger, handler = synthetic
+    child = logger.getChild("requests")
+    for i in range(8):
+        child.debug("request %d", i)
+    for i in range(3):
+        logger.getChild("muted").debug("muted %d", i)
+    logger.getChild("muted").error("failed")
+
+    assert handler.messages == ["request 0", "request 4", "failed"]
+
+
+def test_unsampled_loggers_pass_through():
+    logger = logging.getLogger("other")
+    handler = ListHandler()
+    handler.addFilter(SamplingFilter({"synthetic": 0.25}))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    try:
+        for i in range(3):
+            logger.debug("line %d", i)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.messages == ["line 0", "line 1", "line 2"]
@@ -0,0 +1,105 @@
+"""Concurrent identical reads share one upstream request."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from terryann_cli.config import Config
+from terryann_cli.http_server import HTTPRequest, HTTPResponseWriter, serve
+from terryann_cli.singleflight import SingleFlight
+from terryann_cli.transport import HTTPPool
+
+CALLERS = 10
+
+
+class CountingServer:
+    """Stand-in gateway that counts hits and answers after a short delay."""
+
+    def __init__(self, status: int = 200, delay: float = 0.2):
+        self.status = status
+        self.delay = delay
+        self.hits = 0
+        self.url = ""
+
+    async def handle(self, request: HTTPRequest, response: HTTPResponseWriter) -> None:
+        self.hits += 1
+        # Long enough for every caller to join the in-flight request
+        await asyncio.sleep(self.delay)
+        await response.send_json(self.status, {"path": request.path, "hits": self.hits})
+
+
+@pytest.fixture
+async def server():
+    stand_in = CountingServer()
+    http = await serve(stand_in.handle, "127.0.0.1", 0)
+    stand_in.url = f"http://127.0.0.1:{http.sockets[0].getsockname()[1]}"
+    async with http:
+        yield stand_in
+
+
+@pytest.fixture
+async def pool():
+    http_pool = HTTPPool(Config(), persist=False)
+    yield http_pool
+    await http_pool.aclose()
+
+
+async def test_concurrent_get_json_makes_one_request(server, pool):
+    url = f"{server.url}/gateway/journeys"
+    results = await asyncio.gather(
+        *(pool.get_json(url, params={"limit": 20}) for _ in range(CALLERS))
+    )
+
+    assert server.hits == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == {"path": "/gateway/journeys", "hits": 1}
+
+
+async def test_different_requests_are_not_coalesced(server, pool):
+    await asyncio.gather(
+        pool.get_json(f"{server.url}/gateway/journeys", params={"limit": 20}),
+        pool.get_json(f"{server.url}/gateway/journeys", params={"limit": 50}),
+        pool.get_json(f"{server.url}/gateway/journeys/abc"),
+    )
+
+    assert server.hits == 3
+
+
+async def test_sequential_requests_are_not_coalesced(server, pool):
+    url = f"{server.url}/gateway/journeys"
+    await pool.get_json(url)
+    await pool.get_json(url)
+
+    assert server.hits == 2
+
+
+async def test_error_reaches_every_waiter(server, pool):
+    server.status = 500
+    url = f"{server.url}/gateway/journeys"
+    results = await asyncio.gather(
+        *(pool.get_json(url) for _ in range(CALLERS)), return_exceptions=True
+    )
+
+    assert server.hits == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+    assert all(result.response.status_code == 500 for result in results)
+
+
+async def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first = asyncio.create_task(flight.do("key", work))
+    await started.wait()
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
+    assert flight.stats() == {"calls": 1, "coalesced": 1}
@@ -0,0 +1,80 @@
+"""Cold start stays free of the heavy dependencies.
+
+Each command runs in a fresh interpreter under `python -X importtime`, the
+same way `terryann --profile-startup` measures it, and fails if the SDKs
+that dominate startup were imported. Timing budgets are checked by
+benchmarks/check_startup.py instead, since wall-clock limits are flaky
+on shared CI machines.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from terryann_cli.startup_profile import IMPORTTIME_PREFIX
+
+# Top-level packages a fast command must not import
+HEAVY_PACKAGES = {"supabase", "httpx", "prompt_toolkit"}
+
+COMMANDS = [
+    ["--version"],
+    ["whoami"],
+    ["journeys", "list", "--help"],
+]
+
+
+def imported_packages(args: list[str], home: Path) -> set[str]:
+    """Top-level packages imported by one CLI invocation."""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith("TERRYANN_")
+    }
+    env["HOME"] = str(home)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "terryann_cli.main", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=home,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    packages = set()
+    for line in result.stderr.splitlines():
+        if line.startswith(IMPORTTIME_PREFIX):
+            name = line.rsplit("|", 1)[-1].strip()
+            packages.add(name.split(".")[0])
+    assert packages, "no -X importtime output"
+    return packages
+
+
+@pytest.mark.parametrize("args", COMMANDS, ids=" ".join)
+def test_command_skips_heavy_imports(args, tmp_path):
+    heavy = imported_packages(args, tmp_path) & HEAVY_PACKAGES
+
+    assert not heavy, f"`terryann {' '.join(args)}` imported {sorted(heavy)}"
+
+
+def test_whoami_logged_in_skips_heavy_imports(tmp_path):
+    config_dir = tmp_path / ".terryann"
+    config_dir.mkdir()
+    (config_dir / "credentials.json").write_text(json.dumps({
+        "access_token": "token",
+        "refresh_token": "refresh",
+        "user_id": "user-1",
+        "email": "dev@example.com",
+        "first_name": "Dev",
+        # Far from expiry, so no refresh request is needed
+        "expires_at": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+    }))
+
+    heavy = imported_packages(["whoami"], tmp_path) & HEAVY_PACKAGES
+
+    assert not heavy, f"`terryann whoami` imported {sorted(heavy)}"
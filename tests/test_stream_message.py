@@ -0,0 +1,85 @@
+"""Streamed chat replies fail with GatewayStreamError, never a raw transport error."""
+
+import asyncio
+
+import pytest
+
+from terryann_cli.client import GatewayClient, GatewayStreamError
+from terryann_cli.config import Config
+from terryann_cli.transport import HTTPPool, set_pool
+
+EVENTS = b"".join(f'data: {{"text": "part {i} "}}\n\n'.encode("utf-8") for i in range(3))
+
+
+async def _serve_raw(body: bytes, content_length: int) -> asyncio.AbstractServer:
+    """Answer every request with an SSE head and body, then hang up."""
+
+    async def on_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        head = await reader.readuntil(b"\r\n\r\n")
+        for line in head.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                await reader.readexactly(int(value))
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            + f"Content-Length: {content_length}\r\n\r\n".encode("ascii")
+            + body
+        )
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(on_connection, "127.0.0.1", 0)
+
+
+@pytest.fixture(autouse=True)
+async def pool():
+    http_pool = HTTPPool(Config(http2=False), persist=False)
+    previous = set_pool(http_pool)
+    yield http_pool
+    await http_pool.aclose()
+    set_pool(previous)
+
+
+async def _stream(server: asyncio.AbstractServer, events: list) -> None:
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    client = GatewayClient(Config(gateway_url=url, backend_url=url))
+    async for event in client.stream_message("session", "hello"):
+        events.append(event)
+
+
+async def test_connection_dropped_mid_stream():
+    # Promise more bytes than are sent, then close the connection
+    server = await _serve_raw(EVENTS, len(EVENTS) + 1000)
+    events = []
+    async with server:
+        with pytest.raises(GatewayStreamError, match="lost mid-reply"):
+            await _stream(server, events)
+
+    assert events[0] == ("text", "part 0 ")
+
+
+async def test_complete_stream():
+    server = await _serve_raw(EVENTS, len(EVENTS))
+    events = []
+    async with server:
+        await _stream(server, events)
+
+    assert [kind for kind, _ in events] == ["text", "text", "text", "done"]
+    assert events[-1][1]["response"] == "part 0 part 1 part 2 "
+
+
+async def test_malformed_metadata_event():
+    body = b"event: metadata\ndata: {not json\n\n"
+    server = await _serve_raw(body, len(body))
+    async with server:
+        with pytest.raises(GatewayStreamError, match="Malformed metadata"):
+            await _stream(server, [])
+
+
+async def test_error_event():
+    body = b'event: error\ndata: {"detail": "Pipeline failed"}\n\n'
+    server = await _serve_raw(body, len(body))
+    async with server:
+        with pytest.raises(GatewayStreamError, match="Pipeline failed"):
+            await _stream(server, [])